@@ -0,0 +1,303 @@
+# Builtin Imports
+import os
+import json
+import time
+import queue
+import argparse
+import threading
+
+# Local Imports
+from src.ingestion.content_index import ContentIndex
+from src.textract.table_cache import load_tables_cached
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.core.money import bill_totals
+
+
+
+
+# Constants setting
+OUTPUT_DIR = os.path.join(os.path.dirname(__file__), "data/pipeline_output")
+TEXTRACT_FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "data/textract_output")
+
+STAGES = ("upload", "textract", "parse", "extract")
+DEFAULT_CONCURRENCY = {"upload": 4, "textract": 4, "parse": 1, "extract": 1}
+
+
+# --- Per-document State ---
+class DocumentState:
+
+    """
+    Resumable state of one PDF, persisted as '<output_dir>/state/<pdf name>.json'.
+    Each completed stage stores its outputs, so a re-run skips it. The parsed tables travel with the
+    document in memory only ('tables'), from the parse stage to the extract stage.
+    """
+
+    def __init__(self, pdf_path: str, state_dir: str):
+
+        self.pdf_path = pdf_path
+        self.name = os.path.basename(pdf_path)
+        self.path = os.path.join(state_dir, f"{self.name}.json")
+        self.stages = {}
+        self.error = None
+        self.tables = None
+
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                self.stages = json.load(f).get("stages", {})
+
+    def done(self, stage: str) -> bool:
+
+        """True if the stage completed and the files it produced still exist."""
+
+        outputs = self.stages.get(stage)
+        if outputs is None:
+            return False
+        return all(os.path.exists(outputs[k]) for k in ("artifact", "output") if k in outputs)
+
+    def complete(self, stage: str, **outputs) -> None:
+
+        self.stages[stage] = dict(outputs, completed_at=time.strftime("%Y-%m-%dT%H:%M:%S"))
+        self.save()
+
+    def fail(self, stage: str, error: Exception) -> None:
+
+        self.error = f"{stage}: {error}"
+        self.save()
+
+    def save(self) -> None:
+
+        tmp_path = self.path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump({"pdf": self.pdf_path, "stages": self.stages, "error": self.error}, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+
+
+# --- Pipeline ---
+class Pipeline:
+
+    """
+    Upload -> Textract -> Parse -> Extract for a batch of PDFs.
+
+    Each stage runs its own worker threads and hands documents to the next stage through a
+    bounded queue, so stages overlap across documents (bill B uploads while bill A is in
+    Textract) and a slow stage applies backpressure upstream instead of piling up work.
+    Stage outputs are persisted per document, so an interrupted run resumes where it stopped.
+
+    Args:
+        output_dir (str): Directory for state files, Textract artifacts and extracted expenses.
+        template_name (str): Optional. Bill template used by the extractor (auto-detected per table when None).
+        s3_client: Optional. S3 client (e.g. LocalS3Client). Defaults to the shared boto3 client.
+        textract_client: Optional. Textract client (e.g. LocalTextractClient). Defaults to the shared client.
+        bucket (str): Optional. S3 bucket. Defaults to S3_BUCKET.
+        concurrency (dict): Optional. Workers per stage (see DEFAULT_CONCURRENCY).
+        queue_size (int): Maximum documents waiting between two stages.
+        poll_interval (float): Optional. Fixed Textract poll interval (default: adaptive backoff).
+        index (ContentIndex): Optional. Content-hash index used to skip re-uploading / re-analyzing
+                              identical PDFs. Defaults to '<output_dir>/content_index.sqlite3';
+                              pass False to disable deduplication.
+    """
+
+    def __init__(self, output_dir: str = OUTPUT_DIR, template_name: str = None, s3_client=None, textract_client=None,
+                 bucket: str = None, concurrency: dict = None, queue_size: int = 2, poll_interval: float = None, index=None):
+
+        self.output_dir = output_dir
+        self.template_name = template_name
+        self.s3_client = s3_client
+        self.textract_client = textract_client
+        self.bucket = bucket
+        self.concurrency = dict(DEFAULT_CONCURRENCY, **(concurrency or {}))
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+
+        self.state_dir = os.path.join(output_dir, "state")
+        self.textract_dir = os.path.join(output_dir, "textract")
+        self.expenses_dir = os.path.join(output_dir, "expenses")
+
+        for path in (self.state_dir, self.textract_dir, self.expenses_dir):
+            os.makedirs(path, exist_ok=True)
+
+        if index is None:
+            index = ContentIndex(os.path.join(output_dir, "content_index.sqlite3"))
+        self.index = index or None
+
+    # Stage functions (each receives the document state and records its outputs)
+    def upload(self, doc: DocumentState) -> None:
+
+        from src.ingestion.upload_to_s3 import upload_file
+
+        s3_key = upload_file(doc.pdf_path, client=self.s3_client, bucket=self.bucket, index=self.index)
+        doc.complete("upload", s3_key=s3_key)
+
+    def textract(self, doc: DocumentState) -> None:
+
+        from src.textract.trigger_textract import run_textract_analysis
+
+        s3_key = doc.stages["upload"]["s3_key"]
+
+        # Same content already analyzed: reuse its artifact
+        entry = self.index.lookup_s3_key(s3_key) if self.index else None
+        if entry and entry["textract_artifact"] and os.path.exists(entry["textract_artifact"]):
+            print(f"♻️ Reusing Textract output for '{doc.name}'")
+            doc.complete("textract", artifact=entry["textract_artifact"], reused=True)
+            return
+
+        artifact = os.path.join(self.textract_dir, f"{doc.name}.slim.json.gz")
+        run_textract_analysis(
+            s3_key,
+            save_to=artifact,
+            save_format="slim",
+            poll_interval=self.poll_interval,
+            client=self.textract_client,
+            bucket=self.bucket,
+            index=self.index,
+        )
+        doc.complete("textract", artifact=artifact)
+
+    def parse(self, doc: DocumentState) -> None:
+
+        doc.tables = load_tables_cached(doc.stages["textract"]["artifact"])
+        doc.complete("parse", tables=len(doc.tables))
+
+    def extract(self, doc: DocumentState) -> None:
+
+        # Tables handed over by the parse stage; loaded here only when a resumed run skipped it
+        tables = doc.tables if doc.tables is not None else load_tables_cached(doc.stages["textract"]["artifact"])
+        doc.tables = None
+        expenses = extract_expenses_from_tables(tables, template_name=self.template_name)
+
+        output = os.path.join(self.expenses_dir, f"{doc.name}.expenses.json")
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(expenses, f, indent=2, ensure_ascii=False)
+
+        totals = {currency: str(money) for currency, money in bill_totals(expenses, template_name=self.template_name).items()}
+        doc.complete("extract", output=output, usd=len(expenses["usd_expenses"]), cop=len(expenses["cop_expenses"]), totals=totals)
+
+    # Orchestration
+    def _worker(self, stage: str, inbox: queue.Queue, outbox: queue.Queue) -> None:
+
+        run_stage = getattr(self, stage)
+
+        while True:
+            doc = inbox.get()
+            if doc is None:
+                break
+
+            if not doc.done(stage):
+                try:
+                    run_stage(doc)
+                except Exception as e:
+                    print(f"❌ [{stage}] {doc.name}: {e}")
+                    doc.fail(stage, e)
+                    continue
+
+            outbox.put(doc)   # Blocks while the next stage is saturated (backpressure)
+
+    def run(self, pdf_paths: list) -> list:
+
+        """
+        Runs every PDF through the pipeline.
+
+        Returns:
+            list: DocumentState of every PDF (check 'stages' / 'error').
+        """
+
+        docs = [DocumentState(path, self.state_dir) for path in pdf_paths]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in STAGES] + [queue.Queue()]
+
+        # Start stage workers
+        workers = []
+        for i, stage in enumerate(STAGES):
+            threads = [
+                threading.Thread(target=self._worker, args=(stage, queues[i], queues[i + 1]), name=f"{stage}-{n}", daemon=True)
+                for n in range(self.concurrency[stage])
+            ]
+            for thread in threads:
+                thread.start()
+            workers.append(threads)
+
+        # Feed documents, then shut stages down in order once their upstream is drained
+        for doc in docs:
+            queues[0].put(doc)
+
+        for i, threads in enumerate(workers):
+            for _ in threads:
+                queues[i].put(None)
+            for thread in threads:
+                thread.join()
+
+        return docs
+
+
+# --- CLI ---
+def build_offline_clients(output_dir: str, fixtures_dir: str) -> tuple:
+
+    """Local S3 and Textract stand-ins: uploads land on disk, Textract serves saved outputs."""
+
+    from src.ingestion.local_s3 import LocalS3Client
+    from src.textract.local_textract import LocalTextractClient
+
+    s3_client = LocalS3Client(root=os.path.join(output_dir, "local_s3"))
+    textract_client = LocalTextractClient(fixtures_dir=fixtures_dir)
+    return s3_client, textract_client
+
+def main(argv: list = None) -> int:
+
+    parser = argparse.ArgumentParser(description="Upload, analyze and extract expenses from a directory of PDF bills.")
+    parser.add_argument("input_dir", help="Directory containing the PDF bills")
+    parser.add_argument("--output-dir", default=OUTPUT_DIR, help="State, artifacts and extracted expenses")
+    parser.add_argument("--template", default=None, help="Bill template name (auto-detected per table by default)")
+    parser.add_argument("--offline", action="store_true", help="Use local S3/Textract stand-ins instead of AWS")
+    parser.add_argument("--textract-fixtures", default=TEXTRACT_FIXTURES_DIR, help="Saved Textract outputs served in offline mode")
+    parser.add_argument("--upload-workers", type=int, default=DEFAULT_CONCURRENCY["upload"])
+    parser.add_argument("--textract-workers", type=int, default=DEFAULT_CONCURRENCY["textract"])
+    parser.add_argument("--queue-size", type=int, default=2, help="Documents buffered between stages")
+    parser.add_argument("--poll-interval", type=float, default=None, help="Fixed Textract poll interval in seconds")
+    parser.add_argument("--no-dedup", action="store_true", help="Upload and analyze PDFs even if identical content was processed before")
+    args = parser.parse_args(argv)
+
+    pdf_paths = sorted(
+        os.path.join(args.input_dir, name)
+        for name in os.listdir(args.input_dir)
+        if name.lower().endswith(".pdf")
+    )
+
+    if not pdf_paths:
+        print(f"❌ No PDFs found in {args.input_dir}")
+        return 1
+
+    s3_client = textract_client = bucket = None
+    poll_interval = args.poll_interval
+    if args.offline:
+        s3_client, textract_client = build_offline_clients(args.output_dir, args.textract_fixtures)
+        bucket = "local"
+        poll_interval = poll_interval or 0.1
+
+    pipeline = Pipeline(
+        output_dir=args.output_dir,
+        template_name=args.template,
+        s3_client=s3_client,
+        textract_client=textract_client,
+        bucket=bucket,
+        concurrency={"upload": args.upload_workers, "textract": args.textract_workers},
+        queue_size=args.queue_size,
+        poll_interval=poll_interval,
+        index=False if args.no_dedup else None,
+    )
+
+    start = time.perf_counter()
+    docs = pipeline.run(pdf_paths)
+    elapsed = time.perf_counter() - start
+
+    # Summary
+    failed = [doc for doc in docs if doc.error]
+    print(f"\n📊 Processed {len(docs) - len(failed)}/{len(docs)} PDFs in {elapsed:.1f}s")
+    for doc in failed:
+        print(f"  ❌ {doc.name}: {doc.error}")
+
+    return 1 if failed else 0
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    raise SystemExit(main())
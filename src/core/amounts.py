@@ -0,0 +1,118 @@
+# Built-in imports
+import re
+from functools import lru_cache
+
+
+
+
+# Constants setting
+DEFAULT_DECIMAL = "."           # Bancolombia prints amounts as 1,234,567.89
+DEFAULT_THOUSANDS = ","
+SEPARATORS = (".", ",")
+CACHE_SIZE = 8192               # Distinct strings memoized (bills repeat rates, fees and instalment values)
+
+THOUSANDS = (",", ".", " ", "'")
+FORMATS = tuple((d, t) for d in SEPARATORS for t in THOUSANDS if t != d)
+
+# Everything but digits, sign and the two separators is dropped (currency symbols, letters, slashes...)
+_JUNK = {(d, t): re.compile(rf"[^\d\-{re.escape(d)}{re.escape(t)}]") for d, t in FORMATS}
+
+# What is left must group thousands properly: '1,234,567.89' or '1234567.89', never '1.2.3' or '12,34'
+_SHAPE = {(d, t): re.compile(rf"^-?(?:\d{{1,3}}(?:{re.escape(t)}\d{{3}})+|\d*)(?:{re.escape(d)}\d*)?$") for d, t in FORMATS}
+
+
+# --- Auxiliar Functions ---
+def check_format(decimal: str, thousands: str) -> None:
+
+    """Raises ValueError on an unsupported or ambiguous separator pair."""
+
+    if decimal not in SEPARATORS:
+        raise ValueError(f"Unsupported decimal separator {decimal!r} (expected one of {SEPARATORS})")
+    if thousands == decimal:
+        raise ValueError(f"Decimal and thousand separators must differ (both {decimal!r})")
+    if thousands not in THOUSANDS:
+        raise ValueError(f"Unsupported thousand separator {thousands!r} (expected one of {THOUSANDS})")
+
+def normalize_amount(value: str, decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS):
+
+    """
+    Amount text -> plain '-1234.56' string, None if it is not a well-formed amount in that format
+    (separators checked: '1.2.3' or '12,34,5' with thousands=',' are rejected, not merged).
+    """
+
+    clean = _JUNK[(decimal, thousands)].sub("", value).strip()
+    if not _SHAPE[(decimal, thousands)].match(clean):
+        return None
+    clean = clean.replace(thousands, "")
+    return clean.replace(decimal, ".") if decimal != "." else clean
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(value: str, decimal: str, thousands: str) -> float:
+
+    clean = normalize_amount(value, decimal, thousands)
+    try:
+        return float(clean) if clean is not None else 0.0
+    except ValueError:
+        return 0.0
+
+
+# --- Main Functions ---
+def parse_amount(value: str, decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS) -> float:
+
+    """
+    Converts an amount string to float, keeping negatives as negatives.
+
+    Currency symbols and other text are dropped, thousand separators must group digits by three
+    and the decimal mark becomes '.', so '$ 1,234.50' -> 1234.5 and, with decimal=',' / thousands='.',
+    '1,9598' -> 1.9598. Empty, unparseable or badly grouped values ('1.2.3' with decimal=',') give 0.0.
+    Repeated strings are served from an LRU cache.
+
+    Args:
+        value (str): Cell text.
+        decimal (str): Optional. Decimal mark ('.' or ',').
+        thousands (str): Optional. Thousand separator (one of THOUSANDS, not the decimal mark).
+
+    Returns:
+        float: Parsed amount.
+    """
+
+    if decimal != DEFAULT_DECIMAL or thousands != DEFAULT_THOUSANDS:
+        check_format(decimal, thousands)
+
+    if not value:
+        return 0.0
+    return _parse(value if isinstance(value, str) else str(value), decimal, thousands)
+
+def amount_parser(decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS):
+
+    """Validated single-argument parser for one number format (used by compiled templates)."""
+
+    check_format(decimal, thousands)
+
+    def parse(value: str) -> float:
+        if not value:
+            return 0.0
+        return _parse(value if isinstance(value, str) else str(value), decimal, thousands)
+
+    parse.__name__ = "parse_amount"
+    parse.decimal, parse.thousands = decimal, thousands
+    return parse
+
+def parse_amounts(values: list, decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS) -> list:
+
+    """
+    Batch API: parses a whole column, each distinct string once.
+
+    Returns:
+        list: Floats in the same order as 'values'.
+    """
+
+    parse = amount_parser(decimal, thousands)
+    parsed = {value: parse(value) for value in set(values)}
+    return [parsed[value] for value in values]
+
+def cache_info():
+
+    """Hit/miss statistics of the memoized fast path."""
+
+    return _parse.cache_info()
@@ -0,0 +1,79 @@
+# Builtin Imports
+import os
+import threading
+
+
+
+
+# Constants setting
+_ENV_LOADED = False
+_CLIENTS = {}
+_LOCK = threading.Lock()
+
+
+# --- Auxiliar Functions ---
+def load_env() -> None:
+
+    """Loads '.env' once, the first time AWS settings are needed (not at import)."""
+
+    global _ENV_LOADED
+
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _ENV_LOADED = True
+
+def default_bucket() -> str:
+
+    """S3 bucket configured in the environment (S3_BUCKET)."""
+
+    load_env()
+    return os.getenv("S3_BUCKET")
+
+
+# Main function
+def get_client(service: str, max_pool_connections: int = None):
+
+    """
+    Returns the shared boto3 client of a service, building it on first use.
+
+    boto3 is imported and credentials are resolved only here, so modules that merely import
+    the ingestion/textract code (parsing, extraction, tests with local stand-ins) never pay
+    for it. Clients are thread-safe and cached per (service, pool size).
+
+    Args:
+        service (str): boto3 service name ('s3', 'textract').
+        max_pool_connections (int): Optional. HTTP connection pool size (boto3 default: 10).
+
+    Returns:
+        boto3 client.
+    """
+
+    key = (service, max_pool_connections)
+    client = _CLIENTS.get(key)
+    if client is not None:
+        return client
+
+    with _LOCK:
+        if key not in _CLIENTS:
+            load_env()
+
+            import boto3
+            from botocore.config import Config
+
+            _CLIENTS[key] = boto3.client(
+                service,
+                aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
+                aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+                region_name=os.getenv("AWS_REGION"),
+                config=Config(max_pool_connections=max_pool_connections) if max_pool_connections else None,
+            )
+
+    return _CLIENTS[key]
+
+def reset_clients() -> None:
+
+    """Drops the cached clients (e.g. after changing credentials in the environment)."""
+
+    with _LOCK:
+        _CLIENTS.clear()
@@ -0,0 +1,138 @@
+# Built-in imports
+import os
+import json
+import time
+import argparse
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+# Local imports
+from src.core.templates import get_template, load_templates
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.core.money import CURRENCY_EXPONENTS, Money, bill_totals
+from src.textract.parse_textract_output import parse_textract_file
+
+
+
+
+# Constants setting
+TEXTRACT_SUFFIXES = (".json", ".json.gz", ".json.zst")     # Textract outputs (plain or compressed) and compact artifacts
+DEFAULT_WORKERS = os.cpu_count() or 1
+
+
+# --- Auxiliar Functions ---
+def find_textract_files(input_dir: str) -> list:
+
+    """Textract outputs of a directory (one per bill), sorted by name."""
+
+    return sorted(
+        os.path.join(input_dir, name)
+        for name in os.listdir(input_dir)
+        if name.lower().endswith(TEXTRACT_SUFFIXES) and os.path.isfile(os.path.join(input_dir, name))
+    )
+
+def _init_worker(template_name: str = None) -> None:
+
+    """Compiles the templates once per worker process; every bill the worker handles reuses them."""
+
+    load_templates()
+    if template_name is not None:
+        get_template(template_name)
+
+def extract_file(json_file_path: str, template_name: str = None) -> dict:
+
+    """
+    Parses and extracts one bill. Errors are returned, not raised, so one bad file doesn't stop a batch.
+
+    Returns:
+        dict: {'source', 'tables', 'seconds', 'totals' (exact minor units per currency), 'usd_expenses',
+               'cop_expenses'} or {'source', 'error'}.
+    """
+
+    source = os.path.basename(json_file_path)
+    start = time.perf_counter()
+
+    try:
+        tables = parse_textract_file(json_file_path)
+        expenses = extract_expenses_from_tables(tables, template_name=template_name)
+        totals = {currency: money.minor for currency, money in bill_totals(expenses, template_name=template_name).items()}
+    except Exception as e:
+        return {"source": source, "error": f"{type(e).__name__}: {e}"}
+
+    return {"source": source, "tables": len(tables), "seconds": round(time.perf_counter() - start, 3), "totals": totals, **expenses}
+
+
+# --- Main Functions ---
+def extract_directory(input_dir: str, output_path: str = None, workers: int = DEFAULT_WORKERS, template_name: str = None) -> dict:
+
+    """
+    Batch extraction of a directory of Textract outputs, fanned out over a process pool.
+
+    Bills are independent and parsing is CPU bound, so each worker process parses and extracts
+    whole files; only the extracted expenses travel back. Results are merged in file-name order.
+
+    Args:
+        input_dir (str): Directory of Textract JSON outputs (or compact artifacts), one per bill.
+        output_path (str): Optional. Merged JSON output file.
+        workers (int): Optional. Worker processes (1 runs everything in this process).
+        template_name (str): Optional. Bill template (auto-detected per table when None).
+
+    Returns:
+        dict: {'source_dir', 'bills': [{'source', 'tables', 'seconds', 'totals', 'usd_expenses', 'cop_expenses'}],
+               'failed': [{'source', 'error'}], 'totals' (minor units per currency, all bills), 'seconds'}
+    """
+
+    paths = find_textract_files(input_dir)
+    start = time.perf_counter()
+
+    if workers <= 1 or len(paths) <= 1:
+        _init_worker(template_name)
+        results = [extract_file(path, template_name) for path in paths]
+    else:
+        with ProcessPoolExecutor(max_workers=min(workers, len(paths)), initializer=_init_worker, initargs=(template_name,)) as executor:
+            results = list(executor.map(extract_file, paths, repeat(template_name)))
+
+    merged = {
+        "source_dir": os.path.abspath(input_dir),
+        "bills": [r for r in results if "error" not in r],
+        "failed": [r for r in results if "error" in r],
+        "totals": {currency: sum(r["totals"][currency] for r in results if "error" not in r) for currency in CURRENCY_EXPONENTS},
+        "seconds": round(time.perf_counter() - start, 3),
+    }
+
+    if output_path:
+        os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+        tmp_path = output_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(merged, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, output_path)
+
+    return merged
+
+
+# --- CLI ---
+def main(argv: list = None) -> int:
+
+    parser = argparse.ArgumentParser(description="Extract expenses from a directory of Textract outputs in parallel.")
+    parser.add_argument("input_dir", help="Directory of Textract JSON outputs, one per bill")
+    parser.add_argument("output", help="Merged expenses JSON file")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Worker processes")
+    parser.add_argument("--template", default=None, help="Bill template name (auto-detected per table by default)")
+    args = parser.parse_args(argv)
+
+    merged = extract_directory(args.input_dir, args.output, workers=args.workers, template_name=args.template)
+
+    n_bills = len(merged["bills"]) + len(merged["failed"])
+    n_expenses = sum(len(b["usd_expenses"]) + len(b["cop_expenses"]) for b in merged["bills"])
+    print(f"📊 Extracted {n_expenses} expenses from {len(merged['bills'])}/{n_bills} bills in {merged['seconds']:.1f}s -> {args.output}")
+    print("   Totals: " + ", ".join(str(Money(minor, currency)) for currency, minor in merged["totals"].items()))
+    for bill in merged["failed"]:
+        print(f"  ❌ {bill['source']}: {bill['error']}")
+
+    return 1 if merged["failed"] else 0
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+# Built-in imports
+import re
+from functools import lru_cache
+
+
+
+
+# Constants setting
+DATE_FORMATS = ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%y")     # Tried in this order, like the original strptime loop
+OUTPUT_FORMAT = "%Y-%m-%d"
+SAMPLE_SIZE = 5                 # Non-empty values looked at to infer a column's format
+CACHE_SIZE = 4096               # Distinct date strings memoized (bills repeat the same dates dozens of times)
+
+# Same field patterns 'strptime' uses, so the fast path accepts exactly what it accepted
+_FIELDS = {
+    "%d": r"(3[01]|[12]\d|0[1-9]|[1-9]| [1-9])",
+    "%m": r"(1[0-2]|0[1-9]|[1-9])",
+    "%Y": r"(\d\d\d\d)",
+    "%y": r"(\d\d)",
+}
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+# --- Auxiliar Functions ---
+def _compile_format(fmt: str) -> tuple:
+
+    """'%d/%m/%Y' -> (precompiled full-match pattern, field order such as ('%d', '%m', '%Y'))."""
+
+    parts = re.split(r"(%[dmYy])", fmt)
+    pattern = "".join(_FIELDS[part] if part in _FIELDS else re.escape(part) for part in parts)
+    order = tuple(part for part in parts if part in _FIELDS)
+    return re.compile(pattern).fullmatch, order
+
+_COMPILED = {fmt: _compile_format(fmt) for fmt in DATE_FORMATS}
+
+def _match(fmt: str, value: str):
+
+    """(year, month, day) if 'value' is a valid date in 'fmt', else None. Never raises."""
+
+    match, order = _COMPILED[fmt]
+    found = match(value)
+    if found is None:
+        return None
+
+    fields = dict(zip(order, found.groups()))
+    day, month = int(fields["%d"]), int(fields["%m"])
+    if "%Y" in fields:
+        year = int(fields["%Y"])
+    else:
+        year = int(fields["%y"])
+        year += 2000 if year < 69 else 1900     # strptime's two-digit year pivot
+
+    leap = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if year < 1 or day > _DAYS_IN_MONTH[month - 1] + leap:
+        return None
+    return year, month, day
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse(value: str, first: str = None) -> str:
+
+    # Formats are mutually exclusive (separators and year widths differ), so trying the inferred
+    # one first never changes the result, it only skips the misses
+    formats = DATE_FORMATS if first is None else (first,) + tuple(f for f in DATE_FORMATS if f != first)
+    for fmt in formats:
+        parsed = _match(fmt, value)
+        if parsed is not None:
+            return f"{parsed[0]:04d}-{parsed[1]:02d}-{parsed[2]:02d}"
+    return value
+
+
+# --- Main Functions ---
+def parse_date(value: str) -> str:
+
+    """
+    Transforms a date into "%Y-%m-%d" without raising on misses: each of DATE_FORMATS is a
+    precompiled pattern plus a calendar check, and repeated strings are served from an LRU cache.
+    Unparseable values are returned stripped; non-string cells (None, NaN) give None.
+    """
+
+    return _parse(value.strip()) if isinstance(value, str) else None
+
+def infer_format(values: list, sample: int = SAMPLE_SIZE):
+
+    """
+    Format of a column, guessed from its first few non-empty values.
+
+    Returns:
+        str | None: The first of DATE_FORMATS matching most sampled values, None if none matches.
+    """
+
+    seen = [v.strip() for v in values if isinstance(v, str) and v.strip()][:sample]
+    best, best_hits = None, 0
+    for fmt in DATE_FORMATS:
+        hits = sum(_match(fmt, v) is not None for v in seen)
+        if hits > best_hits:
+            best, best_hits = fmt, hits
+    return best
+
+def parse_dates(values: list, fmt: str = None) -> list:
+
+    """
+    Batch API: parses a whole column with its format inferred once, each distinct string once.
+    Values off the inferred format still go through the other formats, so results always equal
+    'parse_date' on each value.
+
+    Args:
+        values (list): Column cells.
+        fmt (str): Optional. Format to try first (inferred from the column when omitted).
+
+    Returns:
+        list: "%Y-%m-%d" strings (or the stripped value, None for non-string cells), same order as 'values'.
+    """
+
+    if fmt is None:
+        fmt = infer_format(values)
+    parsed = {value: _parse(value.strip(), fmt) if isinstance(value, str) else None for value in set(values)}
+    return [parsed[value] for value in values]
+
+def cache_info():
+
+    """Hit/miss statistics of the memoized fast path."""
+
+    return _parse.cache_info()
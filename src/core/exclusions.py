@@ -0,0 +1,206 @@
+# Built-in imports
+import re
+import time
+import threading
+from collections import Counter
+
+
+
+
+# Constants setting
+MATCH_TYPES = ("exact", "prefix", "contains", "regex")
+MEMO_SIZE = 4096                # Distinct descriptions remembered per rule set (bills repeat merchants)
+
+# Backreferences ('\1', '(?P=name)') and named groups break (or clash) once patterns are joined into one alternation,
+# and a global inline flag ('(?i)', '(?x)') either fails there or applies to every other rule
+_STANDALONE = re.compile(r"\\[1-9]|\(\?P[<=]|\(\?[aiLmsux]+\)")
+_MISSING = object()
+
+
+# --- Auxiliar Functions ---
+def _rule(spec) -> tuple:
+
+    """
+    Normalizes one 'exclude_descriptions' entry into (name, match type, pattern).
+
+    A plain string is an exact (case-insensitive) description, as before; a dict gives
+    {"pattern": ..., "match": "exact" | "prefix" | "contains" | "regex", "name": optional}.
+    """
+
+    if isinstance(spec, str):
+        return spec.upper(), "exact", spec.upper()
+
+    match = spec.get("match", "exact")
+    if match not in MATCH_TYPES:
+        raise ValueError(f"Unknown exclusion match type {match!r} (expected one of {MATCH_TYPES})")
+
+    pattern = spec["pattern"] if match == "regex" else spec["pattern"].upper()
+    re.compile(pattern if match == "regex" else re.escape(pattern))     # Fails fast on a bad regex
+    return spec.get("name") or f"{match}:{spec['pattern']}", match, pattern
+
+def _standalone(match: str, pattern: str) -> bool:
+
+    """True for regex rules that must be searched on their own instead of inside the combined alternation."""
+
+    return match == "regex" and _STANDALONE.search(pattern) is not None
+
+def _regex(match: str, pattern: str) -> str:
+    if match == "prefix":
+        return "^" + re.escape(pattern)
+    if match == "contains":
+        return re.escape(pattern)
+    return f"(?:{pattern})"
+
+
+# --- Rule Engine ---
+class ExclusionRules:
+
+    """
+    Compiled 'exclude_descriptions' of a template, evaluated once per description.
+
+    Exact rules are a dict lookup; prefix, contains and regex rules are compiled together into
+    one alternation (each rule a named group, so the match tells which rule fired), matched
+    against the stripped, uppercased description. Regex rules with backreferences, named groups or
+    global inline flags can't be joined without changing their meaning, so they are searched one by
+    one afterwards. Results are memoized per distinct description.
+    Per-rule hit counters are kept (see 'stats'); 'profile' times each rule on its own. A compiled
+    template (and so its rules) is shared by every thread of a batch or pipeline: the memo and the
+    counters are updated under a lock, while the matching itself runs outside it.
+    """
+
+    __slots__ = ("rules", "_exact", "_combined", "_group_rule", "_standalone", "_memo", "_lock", "hits", "evaluations", "memo_hits", "seconds")
+
+    def __init__(self, specs: list = ()):
+
+        self.rules = tuple(_rule(spec) for spec in specs)
+        self._exact = {}
+        self._group_rule = {}
+        self._standalone = []
+        alternatives = []
+
+        for i, (name, match, pattern) in enumerate(self.rules):
+            if match == "exact":
+                self._exact.setdefault(pattern, name)
+            elif _standalone(match, pattern):
+                self._standalone.append((name, re.compile(pattern, re.IGNORECASE).search))
+            else:
+                group = f"_r{i}"
+                self._group_rule[group] = name
+                alternatives.append(f"(?P<{group}>{_regex(match, pattern)})")
+
+        self._combined = re.compile("|".join(alternatives), re.IGNORECASE).search if alternatives else None
+        self._memo = {}
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+
+        """Zeroes the counters."""
+
+        with self._lock:
+            self.hits = {name: 0 for name, _, _ in self.rules}
+            self.evaluations = 0
+            self.memo_hits = 0
+            self.seconds = 0.0
+
+    def _evaluate(self, description: str):
+
+        text = description.strip().upper()
+        name = self._exact.get(text)
+        if name is None and self._combined is not None:
+            found = self._combined(text)
+            if found is not None:
+                name = self._group_rule[found.lastgroup]
+        if name is None:
+            for rule, search in self._standalone:
+                if search(text) is not None:
+                    return rule
+        return name
+
+    def rule_for(self, description: str):
+
+        """
+        Name of the first rule excluding 'description' (exact rules first, then in config order
+        among those matching at the leftmost position, then standalone regex rules in config order),
+        None if it is kept.
+        """
+
+        return self._count(description, 1)
+
+    def _count(self, description: str, n: int):
+
+        """Rule for one description, counted as 'n' rows (one evaluation at most)."""
+
+        elapsed = None
+        name = self._memo.get(description, _MISSING)
+        if name is _MISSING:
+            start = time.perf_counter()
+            name = self._evaluate(description)
+            elapsed = time.perf_counter() - start
+
+        with self._lock:
+            self.evaluations += n
+            if elapsed is None:
+                self.memo_hits += n
+            else:
+                self.memo_hits += n - 1
+                self.seconds += elapsed
+                if len(self._memo) >= MEMO_SIZE:
+                    self._memo.clear()
+                self._memo[description] = name
+            if name is not None:
+                self.hits[name] += n
+        return name
+
+    def match_many(self, descriptions: list) -> list:
+
+        """Batch mode: True per excluded description, each distinct value looked up once (counters still count every row)."""
+
+        excluded = {description: self._count(description, n) is not None for description, n in Counter(descriptions).items()}
+        return [excluded[d] for d in descriptions]
+
+    def __contains__(self, description: str) -> bool:
+
+        """'description in rules': membership without touching the counters."""
+
+        name = self._memo.get(description, _MISSING)
+        return (self._evaluate(description) if name is _MISSING else name) is not None
+
+    def __len__(self) -> int:
+        return len(self.rules)
+
+    def stats(self) -> dict:
+
+        """Counters: hits per rule, evaluations, memoized answers and time spent evaluating."""
+
+        return {"hits": dict(self.hits), "evaluations": self.evaluations, "memo_hits": self.memo_hits, "seconds": self.seconds}
+
+    def profile(self, descriptions: list, repeat: int = 1) -> dict:
+
+        """
+        Cost of each rule on its own over 'descriptions' (no memo).
+
+        Returns:
+            dict: {rule name: {'matches', 'seconds'}}, plus '__combined__' for the whole compiled set.
+        """
+
+        texts = [d.strip().upper() for d in descriptions] * repeat
+        report = {}
+
+        for name, match, pattern in self.rules:
+            if match == "exact":
+                test = lambda text, pattern=pattern: text == pattern
+            else:
+                search = re.compile(pattern if _standalone(match, pattern) else _regex(match, pattern), re.IGNORECASE).search
+                test = lambda text, search=search: search(text) is not None
+            start = time.perf_counter()
+            matches = sum(1 for text in texts if test(text))
+            report[name] = {"matches": matches, "seconds": time.perf_counter() - start}
+
+        start = time.perf_counter()
+        matches = sum(1 for text in texts if self._evaluate(text) is not None)
+        report["__combined__"] = {"matches": matches, "seconds": time.perf_counter() - start}
+        return report
+
+    def __repr__(self) -> str:
+        return f"ExclusionRules({len(self.rules)} rules)"
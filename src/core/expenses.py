@@ -0,0 +1,384 @@
+# Built-in imports
+import sys
+from array import array
+
+# Local imports
+from src.core.money import Money, from_minor, group_sum, to_minor
+
+
+
+
+# Constants setting
+BUCKETS = ("usd_expenses", "cop_expenses")
+CURRENCIES = ("USD", "COP")                 # Same position as BUCKETS
+
+# Extracted field label -> Expense attribute (field order of the extractor's dicts), as bancolombia_v1 labels them;
+# templates with other labels map them in their "field_attributes" (see 'record_fields')
+FIELDS = (
+    ("Número de Autorización", "authorization"),
+    ("Fecha de Transacción", "date"),
+    ("Descripción", "description"),
+    ("Valor Original", "original_value"),
+    ("Cargos y Abonos", "charge"),
+    ("Saldo a Diferir", "deferred_balance"),
+    ("Cuotas", "installments"),
+)
+
+# Optional fields, present only after the original-currency stage (see src/core/original_amounts.py)
+OPTIONAL_FIELDS = ("original_amount", "original_currency")
+
+AMOUNT_COLUMNS = {"original_value": "original_values", "charge": "charges", "deferred_balance": "deferred_balances"}
+
+_ATTRIBUTE = dict(FIELDS)
+_NO_DATE = 0                                # Int-encoded date of a value 'parse_date' could not parse
+_RECORD_FIELDS = {}                         # Record labels -> their (label, attribute) pairs, when all are default labels
+
+
+# --- Auxiliar Functions ---
+def encode_date(value: str) -> int:
+
+    """'2025-02-25' -> 20250225 (sortable, 4 bytes); anything else -> 0."""
+
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        digits = value[:4] + value[5:7] + value[8:]
+        if digits.isdigit():
+            return int(digits)
+    return _NO_DATE
+
+def decode_date(code: int) -> str:
+
+    """20250225 -> '2025-02-25'."""
+
+    return f"{code // 10000:04d}-{code // 100 % 100:02d}-{code % 100:02d}"
+
+def record_fields(labels) -> tuple:
+
+    """
+    (label, Expense attribute) pairs of an extracted record's labels, in record order.
+
+    Labels of 'FIELDS' map directly; any other set of labels is looked up in the template that
+    extracts them ('templates.template_for_fields') and its "field_attributes".
+
+    Raises:
+        ValueError: If a label has no Expense attribute.
+    """
+
+    labels = tuple(labels)
+    fields = _RECORD_FIELDS.get(labels)
+    if fields is not None:
+        return fields
+
+    known = [label for label in labels if label not in OPTIONAL_FIELDS]
+    if all(label in _ATTRIBUTE for label in known):
+        fields = _RECORD_FIELDS[labels] = tuple((label, _ATTRIBUTE[label]) for label in known)
+        return fields
+
+    from src.core.templates import template_for_fields
+    template = template_for_fields(known)
+    attributes = dict(template.record_fields) if template is not None else _ATTRIBUTE
+    unknown = [label for label in known if label not in attributes]
+    if unknown:
+        raise ValueError(f"Fields without an Expense attribute: {unknown}")
+    return tuple((label, attributes[label]) for label in known)
+
+def _fields_of(record: dict, resolved: dict) -> tuple:
+
+    """'record_fields' of a record, resolved once per distinct set of labels of a statement."""
+
+    labels = tuple(record)
+    if labels not in resolved:
+        resolved[labels] = record_fields(labels)
+    return resolved[labels]
+
+
+# --- Expense Record ---
+class Expense:
+
+    """
+    One extracted transaction with typed attributes instead of a dict keyed by the bill's headers.
+
+    Attributes:
+        authorization (str): Número de Autorización.
+        date (str): Fecha de Transacción, "%Y-%m-%d" (or the raw text if it could not be parsed).
+        description (str): Descripción.
+        original_value (float): Valor Original.
+        charge (float): Cargos y Abonos.
+        deferred_balance (float): Saldo a Diferir.
+        installments (str): Cuotas ("n/N").
+        currency (str): "USD" or "COP" (the bucket the extractor put it in).
+        original_amount (float): Amount in the original currency of a foreign row, None if not split out.
+        original_currency (str): Its currency code as printed ("USA", "MLT"), None if not split out.
+        fields (tuple): (label, attribute) pairs of the template's dict ('FIELDS' for bancolombia_v1).
+    """
+
+    __slots__ = ("authorization", "date", "description", "original_value", "charge", "deferred_balance", "installments", "currency",
+                 "original_amount", "original_currency", "fields")
+
+    authorization: str
+    date: str
+    description: str
+    original_value: float
+    charge: float
+    deferred_balance: float
+    installments: str
+    currency: str
+    original_amount: float
+    original_currency: str
+    fields: tuple
+
+    def __init__(self, authorization: str = "", date: str = "", description: str = "", original_value: float = 0.0,
+                 charge: float = 0.0, deferred_balance: float = 0.0, installments: str = "", currency: str = CURRENCIES[1],
+                 original_amount: float = None, original_currency: str = None, fields: tuple = FIELDS):
+
+        self.authorization = authorization
+        self.date = date
+        self.description = description
+        self.original_value = original_value
+        self.charge = charge
+        self.deferred_balance = deferred_balance
+        self.installments = installments
+        self.currency = currency
+        self.original_amount = original_amount
+        self.original_currency = original_currency
+        self.fields = fields
+
+    @classmethod
+    def from_dict(cls, record: dict, currency: str = CURRENCIES[1], fields: tuple = None) -> "Expense":
+
+        """
+        Builds an Expense from an extractor dict of any template.
+
+        Args:
+            record (dict): Extracted record.
+            currency (str): Optional. "USD" or "COP".
+            fields (tuple): Optional. (label, attribute) pairs of the record's template; resolved from
+                            its labels when None (see 'record_fields', ValueError on an unmapped label).
+        """
+
+        fields = fields if fields is not None else record_fields(record)
+        values = {attribute: record[label] for label, attribute in fields if label in record}
+        values.update((name, record[name]) for name in OPTIONAL_FIELDS if name in record)
+        return cls(currency=currency, fields=fields, **values)
+
+    def to_dict(self) -> dict:
+
+        """The extractor's dict for this expense (its template's labels and order, plus the optional fields when set)."""
+
+        record = {label: getattr(self, attribute) for label, attribute in self.fields}
+        if self.original_currency is not None:
+            record.update(original_amount=self.original_amount, original_currency=self.original_currency)
+        return record
+
+    def money(self, attribute: str = "charge") -> Money:
+
+        """An amount attribute as exact Money in the expense's currency."""
+
+        return Money.from_float(getattr(self, attribute), self.currency)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Expense):
+            return NotImplemented
+        return all(getattr(self, a) == getattr(other, a) for a in self.__slots__)
+
+    def __repr__(self) -> str:
+        return f"Expense({self.date}, {self.description!r}, {self.charge} {self.currency})"
+
+
+# --- Column-oriented Container ---
+class ExpenseBatch:
+
+    """
+    Many expenses stored column by column: amounts as int64 minor units of each row's currency
+    in 'array("q")' (exact sums, zero-copy NumPy views, see 'minor'), dates as int YYYYMMDD in
+    'array("i")', descriptions and installments dictionary-encoded (each distinct string kept
+    once, rows hold 4-byte codes) and the currency as one byte per row.
+
+    Iterating or indexing yields Expense objects; 'to_expenses' rebuilds the extractor's dict.
+    """
+
+    __slots__ = ("authorizations", "dates", "descriptions", "original_values", "charges", "deferred_balances",
+                 "installments", "currencies", "vocabulary", "_codes", "_raw_dates", "_inexact", "_originals", "_fields")
+
+    def __init__(self):
+
+        self.authorizations = []
+        self.dates = array("i")
+        self.descriptions = array("I")
+        self.original_values = array("q")
+        self.charges = array("q")
+        self.deferred_balances = array("q")
+        self.installments = array("I")
+        self.currencies = array("b")
+        self.vocabulary = []                # Code -> string (descriptions and installments)
+        self._codes = {}                    # String -> code
+        self._raw_dates = {}                # Row -> date text that is not "%Y-%m-%d"
+        self._inexact = {}                  # (row, attribute) -> float with more decimals than minor units hold
+        self._originals = {}                # Row -> (original_amount, original_currency) of split foreign rows
+        self._fields = {}                   # Row -> (label, attribute) pairs of rows not labelled like 'FIELDS'
+
+    def _encode(self, value: str) -> int:
+
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self.vocabulary)
+            self.vocabulary.append(sys.intern(value))
+        return code
+
+    def append(self, expense: Expense) -> None:
+
+        date = encode_date(expense.date)
+        if date == _NO_DATE:
+            self._raw_dates[len(self.dates)] = expense.date
+
+        row = len(self.dates)
+        if expense.original_currency is not None:
+            self._originals[row] = (expense.original_amount, expense.original_currency)
+        if expense.fields != FIELDS:
+            self._fields[row] = expense.fields
+
+        for attribute, column in AMOUNT_COLUMNS.items():
+            value = getattr(expense, attribute)
+            minor = to_minor(value, expense.currency)
+            if from_minor(minor, expense.currency) != value or (not minor and str(value).startswith("-")):
+                self._inexact[(row, attribute)] = value
+            getattr(self, column).append(minor)
+
+        self.authorizations.append(sys.intern(expense.authorization))
+        self.dates.append(date)
+        self.descriptions.append(self._encode(expense.description))
+        self.installments.append(self._encode(expense.installments))
+        self.currencies.append(CURRENCIES.index(expense.currency))
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def __getitem__(self, i: int) -> Expense:
+
+        if i < 0:
+            i += len(self)
+        date = self.dates[i]
+        currency = CURRENCIES[self.currencies[i]]
+        amounts = {
+            attribute: self._inexact[(i, attribute)] if (i, attribute) in self._inexact else from_minor(getattr(self, column)[i], currency)
+            for attribute, column in AMOUNT_COLUMNS.items()
+        }
+        return Expense(
+            authorization=self.authorizations[i],
+            date=self._raw_dates[i] if date == _NO_DATE else decode_date(date),
+            description=self.vocabulary[self.descriptions[i]],
+            installments=self.vocabulary[self.installments[i]],
+            currency=currency,
+            **amounts,
+            **dict(zip(OPTIONAL_FIELDS, self._originals.get(i, (None, None)))),
+            fields=self._fields.get(i, FIELDS),
+        )
+
+    def __iter__(self):
+        return (self[i] for i in range(len(self)))
+
+    @classmethod
+    def from_expenses(cls, expenses: dict, fields: tuple = None) -> "ExpenseBatch":
+
+        """
+        From the extractor's {'usd_expenses': [...], 'cop_expenses': [...]} dict.
+
+        Args:
+            fields (tuple): Optional. 'record_fields' of the template the bill was extracted with
+                            (resolved from each record's labels when None).
+        """
+
+        batch = cls()
+        resolved = {}
+        for bucket, currency in zip(BUCKETS, CURRENCIES):
+            for record in expenses.get(bucket, []):
+                batch.append(Expense.from_dict(record, currency=currency, fields=fields or _fields_of(record, resolved)))
+        return batch
+
+    def to_expenses(self) -> dict:
+
+        """Back to the extractor's dict (records keep their order within each bucket)."""
+
+        return from_records(self)
+
+    def extend(self, expenses) -> None:
+
+        """Appends Expense objects (or another batch)."""
+
+        for expense in expenses:
+            self.append(expense)
+
+    def minor(self, attribute: str = "charge"):
+
+        """Zero-copy int64 NumPy view of an amount column, in minor units of each row's currency."""
+
+        import numpy as np
+        return np.frombuffer(getattr(self, AMOUNT_COLUMNS[attribute]), dtype=np.int64)
+
+    def totals(self, attribute: str = "charge", by: str = None) -> dict:
+
+        """
+        Exact, vectorized totals of an amount column per currency.
+
+        Args:
+            attribute (str): Optional. 'original_value', 'charge' or 'deferred_balance'.
+            by (str): Optional. Also group by 'date' (YYYYMMDD), 'month' (YYYYMM) or 'description'.
+
+        Returns:
+            dict: {currency: Money}, or {(currency, key): Money} when grouped.
+        """
+
+        import numpy as np
+
+        minor = self.minor(attribute)
+        currencies = np.frombuffer(self.currencies, dtype=np.int8)
+
+        if by is None:
+            sums = group_sum(currencies, minor)
+            return {CURRENCIES[c]: Money(total, CURRENCIES[c]) for c, total in sums.items()}
+
+        if by == "date":
+            keys = np.frombuffer(self.dates, dtype=np.int32)
+        elif by == "month":
+            keys = np.frombuffer(self.dates, dtype=np.int32) // 100
+        elif by == "description":
+            keys = np.frombuffer(self.descriptions, dtype=np.uint32)
+        else:
+            raise ValueError(f"Unknown grouping: {by!r} (expected 'date', 'month' or 'description')")
+
+        # One int64 key per (currency, key) pair, split back after summing
+        sums = group_sum(currencies.astype(np.int64) << 32 | keys.astype(np.int64), minor)
+        result = {}
+        for combined, total in sums.items():
+            currency, key = CURRENCIES[combined >> 32], combined & 0xFFFFFFFF
+            key = self.vocabulary[key] if by == "description" else key
+            result[(currency, key)] = Money(total, currency)
+        return result
+
+    def nbytes(self) -> int:
+
+        """Approximate memory held by the batch (buffers, lists and distinct strings)."""
+
+        size = sum(sys.getsizeof(column) for column in (self.dates, self.descriptions, self.original_values, self.charges,
+                                                         self.deferred_balances, self.installments, self.currencies))
+        size += sys.getsizeof(self.authorizations) + sum(sys.getsizeof(s) for s in set(self.authorizations))
+        size += sys.getsizeof(self.vocabulary) + sum(sys.getsizeof(s) for s in self.vocabulary)
+        return size + sum(sys.getsizeof(index) for index in (self._codes, self._raw_dates, self._inexact, self._originals, self._fields))
+
+
+# --- Converters ---
+def to_records(expenses: dict, fields: tuple = None) -> list:
+
+    """Extractor dict -> list of Expense (USD bucket first, like the dict); 'fields' as in 'ExpenseBatch.from_expenses'."""
+
+    resolved = {}
+    return [Expense.from_dict(record, currency=currency, fields=fields or _fields_of(record, resolved))
+            for bucket, currency in zip(BUCKETS, CURRENCIES) for record in expenses.get(bucket, [])]
+
+def from_records(records) -> dict:
+
+    """List of Expense (or an ExpenseBatch) -> extractor dict."""
+
+    expenses = {bucket: [] for bucket in BUCKETS}
+    for expense in records:
+        expenses[BUCKETS[CURRENCIES.index(expense.currency)]].append(expense.to_dict())
+    return expenses
@@ -1,24 +1,22 @@
-# Built-in imports
-import os
-import json
-import re
-from datetime import datetime
+# Local imports
+from src.core.amounts import parse_amount as _parse_amount
+from src.core.dates import parse_date as _parse_date
+from src.core.money import BUCKET_CURRENCIES, minor_parser
+from src.core.templates import AMOUNT_FIELDS, CompiledTemplate, get_template, compile_template, template_index
 
 
 
 
 # Constants setting
-CONFIG_PATH = os.path.join(os.path.dirname(__file__), "../../config/bill_templates.json")
+OUTPUTS = ("dict", "records", "batch")
 
 
 # --- Auxiliar Functions ---
 def load_template(template_name: str) -> dict:
 
-    """Loads 'bill_templates.json' that contains the configuration for a specific Card-Issuer/Bill-Template"""
+    """Configuration of a specific Card-Issuer/Bill-Template from 'bill_templates.json' (cached, see 'get_template')"""
 
-    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
-        templates = json.load(f)
-    return templates["bill_templates"][template_name]
+    return get_template(template_name).config
 
 def normalize_value(value: str) -> str:
 
@@ -27,62 +25,60 @@ def normalize_value(value: str) -> str:
     return value.strip() if isinstance(value, str) else value
 
 def parse_amount(value: str) -> float:
-    """Convert amount string to float, keeping negatives as negatives."""
-    if not value:
-        return 0.0
-    clean = re.sub(r"[^\d,.-]", "", str(value))
-    clean = clean.replace(",", "")  # handle thousand separators
-    try:
-        return float(clean)
-    except ValueError:
-        return 0.0
+
+    """Convert amount string to float, keeping negatives as negatives (default number format, see src/core/amounts.py)."""
+
+    return _parse_amount(value)
 
 def parse_date(value: str) -> str:
     
-    """Transforms the date format into a "%Y-%m-%d" strftime"""
+    """Transforms the date format into a "%Y-%m-%d" strftime (exception-free and cached, see src/core/dates.py)"""
 
-    for fmt in ("%d/%m/%Y", "%d-%m-%Y", "%Y-%m-%d", "%d/%m/%y"):
-        try:
-            return datetime.strptime(value.strip(), fmt).strftime("%Y-%m-%d")
-        except Exception:
-            continue
-    return value.strip()
+    return _parse_date(value)
 
 def header_matches(expected: list, actual: list) -> bool:
 
     """Check if actual table header contains all expected headers in order."""
 
-    normalized_actual = [normalize_value(h).lower() for h in actual]
-    normalized_expected = [h.lower() for h in expected]
-    return all(h in normalized_actual for h in normalized_expected)
+    normalized_actual = {normalize_value(h).lower() for h in actual}
+    return all(h.lower() in normalized_actual for h in expected)
+
+def _as_output(expenses: dict, output: str, original_amounts: bool = False, template_name: str = None):
+
+    """
+    Converts the extractor's dict to the requested output (see 'OUTPUTS'), splitting original amounts first if asked.
+    Records map to Expense attributes through the named template's fields, or by their labels when auto-detected.
+    """
+
+    if original_amounts:
+        from src.core.original_amounts import add_original_amounts
+        expenses = add_original_amounts(expenses)
+
+    if output == "dict":
+        return expenses
 
-def classify_currency(table: list, template: dict) -> str:
+    from src.core.expenses import ExpenseBatch, to_records
+    fields = get_template(template_name).record_fields if template_name is not None else None
+    return to_records(expenses, fields) if output == "records" else ExpenseBatch.from_expenses(expenses, fields)
+
+def classify_currency(table: list, template) -> str:
 
     """
     Determine if table is foreign or domestic based on template currency_split rules.
     Scans rows until one matches criteria, then classifies table.
+    'template' is a CompiledTemplate (a raw template dict is compiled on the fly).
     """
 
+    if not isinstance(template, CompiledTemplate):
+        template = compile_template("", template)
+
     header = table[0]
-    index_map = {h.lower(): idx for idx, h in enumerate(header)}
-
-    def rule_match(row, rule):
-        for col, condition in rule.items():
-            col_idx = index_map.get(col.lower())
-            if col_idx is None:
-                return False
-            value = parse_amount(row[col_idx])
-            if condition == "0" and value != 0:
-                return False
-            if condition == "!=0" and value == 0:
-                return False
-        return True
+    index_map = {normalize_value(h).lower(): idx for idx, h in enumerate(header)}
 
     for row in table[1:]:
-        if rule_match(row, template["currency_split"]["foreign"]):
-            return "foreign"
-        if rule_match(row, template["currency_split"]["domestic"]):
-            return "domestic"
+        currency = template.classify(template.parse_rule_columns(row, index_map))
+        if currency is not None:
+            return currency
         
     return "domestic"  # default if no clear match
 
@@ -90,18 +86,50 @@ def classify_currency(table: list, template: dict) -> str:
 
 # --- Main Function ---
 
-def extract_expenses_from_tables(tables: list, template_name="bancolombia_v1") -> dict:
+def extract_expenses_from_tables(tables: list, template_name=None, engine: str = "python", output: str = "dict",
+                                 original_amounts: bool = False, minor_units: bool = False):
 
     """
     Main Function. Extract normalized expense rows from parsed tables based on template.
     Returns dict with keys 'usd_expenses' and 'cop_expenses'.
+
+    With template_name=None every table is matched against all registered templates through the
+    header index (see 'TemplateIndex') and extracted with the best one; naming a template restricts
+    extraction to the tables matching it.
+
+    engine="pandas" runs the columnar implementation (src/core/extract_expenses_columnar.py) instead
+    of the row-by-row one; both return the same structure.
+
+    output="records" returns a list of slotted Expense objects and output="batch" a column-oriented
+    ExpenseBatch instead of the dict (see src/core/expenses.py).
+
+    original_amounts=True splits the "VR MONEDA ORIG <amount> <currency>" fragment of foreign
+    descriptions into 'original_amount' / 'original_currency' fields (see src/core/original_amounts.py).
+
+    minor_units=True parses the amount fields straight to integer minor units of the bucket's currency
+    ('money.parse_minor', no float step) for exact validation and totals ('bill_totals(..., minor_units=True)').
+    Only with output="dict": Expense and ExpenseBatch take the float amounts.
     """
 
-    # Variables setting
-    template = load_template(template_name)
-    expected_headers = template["headers"]
-    fields_to_extract = template["fields_to_extract"]
-    exclude_descriptions = [d.upper() for d in template.get("exclude_descriptions", [])]
+    if output not in OUTPUTS:
+        raise ValueError(f"Unknown output: {output!r} (expected one of {OUTPUTS})")
+    if minor_units and output != "dict":
+        raise ValueError(f"minor_units=True needs output='dict' (got {output!r})")
+
+    if engine == "pandas":
+        from src.core.extract_expenses_columnar import extract_expenses_columnar
+        expenses = extract_expenses_columnar(tables, template_name=template_name, minor_units=minor_units)
+        return _as_output(expenses, output, original_amounts, template_name)
+
+    if engine != "python":
+        raise ValueError(f"Unknown extraction engine: {engine!r} (expected 'python' or 'pandas')")
+
+    # Template resolution per table header (compiled once per process, see src/core/templates.py)
+    if template_name is None:
+        resolve = template_index().match
+    else:
+        fixed = get_template(template_name)
+        resolve = lambda header: fixed if header_matches(fixed.headers, header) else None
 
     
     expenses = {"usd_expenses": [], "cop_expenses": []}
@@ -113,16 +141,25 @@ def extract_expenses_from_tables(tables: list, template_name="bancolombia_v1") -
         if not table or len(table) < 2:
             continue
 
-        if not header_matches(expected_headers, table[0]):
+        template = resolve(table[0])
+        if template is None:
             continue
 
         # Build column index map
         index_map = {normalize_value(h).lower(): idx for idx, h in enumerate(table[0])}
+        description_idx = index_map.get("descripción")
 
         # Determine currency type
         currency_type = classify_currency(table, template)
         bucket = "usd_expenses" if currency_type == "foreign" else "cop_expenses"
 
+        # Column and parser per field (amounts to the bucket currency's minor units if asked)
+        fields = [
+            (field, index_map.get(key), minor_parser(BUCKET_CURRENCIES[bucket], *template.amount_format(key))
+                                        if minor_units and key in AMOUNT_FIELDS else parser)
+            for field, key, parser in template.fields
+        ]
+
         # Records transformation
         for row in table[1:]:
 
@@ -131,30 +168,20 @@ def extract_expenses_from_tables(tables: list, template_name="bancolombia_v1") -
                 continue
 
             # Skip excluded descriptions
-            description_idx = index_map.get("descripción")
             description = normalize_value(row[description_idx]) if description_idx is not None else ""
-            if description.upper() in exclude_descriptions:
+            if template.exclusions.rule_for(description) is not None:
                 continue
 
 
             # Record holder initialized
             record = {}
             
-            # Record fields traversing
-            for field in fields_to_extract:
+            # Record fields traversing (parser per field resolved at template compile time)
+            for field, col_idx, parser in fields:
 
-                col_idx = index_map.get(field.lower())
                 value = normalize_value(row[col_idx]) if col_idx is not None and col_idx < len(row) else ""
-
-                if "fecha" in field.lower():
-                    record[field] = parse_date(value)
-
-                elif field.lower() in ["cargos y abonos", "saldo a diferir", "valor original"]:
-                    record[field] = parse_amount(value)
-
-                else:
-                    record[field] = value
+                record[field] = parser(value)
 
             expenses[bucket].append(record)
 
-    return expenses
\ No newline at end of file
+    return _as_output(expenses, output, original_amounts, template_name)
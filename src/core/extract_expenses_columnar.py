@@ -0,0 +1,460 @@
+# Built-in imports
+from itertools import repeat
+
+# Local imports
+from src.core.amounts import DEFAULT_DECIMAL, DEFAULT_THOUSANDS, parse_amounts
+from src.core.dates import DATE_FORMATS, OUTPUT_FORMAT, infer_format, parse_dates
+from src.core.extract_expenses import header_matches, normalize_value
+from src.core.money import BUCKET_CURRENCIES, minor_parser
+from src.core.templates import get_template, template_index
+
+# Third-party imports (pandas / numpy are imported lazily: see '_pd' and '_np')
+
+
+
+
+# Constants setting
+AMOUNT_FIELDS = ("cargos y abonos", "saldo a diferir", "valor original")
+BUCKETS = ("usd_expenses", "cop_expenses")
+META_COLUMNS = ("bill", "bucket", "template")
+
+_DESCRIPTION = "descripción"
+
+# Shape of each date format's zero-padded form ('9' = digit): cells written exactly so are vectorized
+_DATE_SHAPES = {fmt: fmt.replace("%Y", "9999").replace("%d", "99").replace("%m", "99").replace("%y", "99") for fmt in DATE_FORMATS}
+
+
+# --- Auxiliar Functions ---
+def _pd():
+    import pandas as pd
+    return pd
+
+def _np():
+    import numpy as np
+    return np
+
+def _on_uniques(column, transform):
+
+    """Applies a Series -> Series transform to the distinct values only (bills repeat dates, rates, cuotas...)."""
+
+    pd = _pd()
+    codes, uniques = pd.factorize(column.to_numpy(), use_na_sentinel=False)
+    return pd.Series(transform(pd.Series(uniques, dtype=object)).to_numpy()[codes], index=column.index)
+
+def _chars(values) -> tuple:
+
+    """
+    Strings -> (uint32 code point matrix, one row per string padded with 0, lengths), so cell shapes
+    can be checked with array operations instead of a regex per cell.
+    """
+
+    np = _np()
+    array = np.asarray(values, dtype=str)
+    if array.dtype.itemsize == 0:
+        array = array.astype("<U1")
+    matrix = np.ascontiguousarray(array).view(np.uint32).reshape(len(array), -1)
+    return matrix, (matrix != 0).sum(axis=1)
+
+def _cells(frame, idx: int, rows=None):
+
+    """Object array of one frame column (only 'rows' when given: mask or positions), None cells as ''."""
+
+    np = _np()
+    values = frame[idx].to_numpy()
+    if rows is not None:
+        values = values[rows]
+    missing = values == None        # Elementwise
+    return np.where(missing, "", values) if missing.any() else values
+
+def _text_array(values):
+
+    """
+    Stripped cell texts as one numpy array: bytes ('S', the usual ASCII amount cells, whose string
+    functions and float cast are several times faster) or str ('U') when a cell is not ASCII.
+    """
+
+    np = _np()
+    values = np.asarray(values, dtype=object)
+    try:
+        text = values.astype("S")
+    except UnicodeEncodeError:
+        text = values.astype(str)
+    if text.dtype.itemsize == 0:
+        text = text.astype(text.dtype.kind + "1")
+    return np.strings.strip(text)
+
+def _plain_amounts(text, clean, decimal: str, thousands: str):
+
+    """
+    Mask of well-formed amounts over a whole column of stripped strings ('clean': the same strings
+    without thousand separators): optional leading '-', an integer part either ungrouped or grouped
+    by three ('1,234,567'), and an optional non-empty decimal part. The character set is checked on
+    the array's code unit matrix, separators through counts and positions (numpy string functions),
+    no per-cell Python. Same cells the scalar parser accepts as they are; anything else is left to it.
+    """
+
+    np = _np()
+    same_kind = text.dtype.type
+    lengths = np.strings.str_len(text)
+
+    # Only digits, separators and '-' inside each string (the rest of the row is padding)
+    units = np.uint8 if text.dtype.kind == "S" else np.uint32
+    matrix = np.ascontiguousarray(text).view(units).reshape(len(text), -1)
+    allowed = (matrix >= 48) & (matrix <= 57)
+    for char in (decimal, thousands, "-"):
+        allowed |= matrix == ord(char)
+    plain = (allowed | (np.arange(matrix.shape[1]) >= lengths[:, None])).all(axis=1)
+
+    minus = same_kind("-")
+    start = np.strings.startswith(text, minus).astype(np.int64)
+    n_dec = np.strings.count(text, same_kind(decimal))
+    point = np.where(n_dec == 1, np.strings.find(text, same_kind(decimal)), lengths)
+    plain &= (n_dec <= 1) & (point - start >= 1) & (point != lengths - 1) & (np.strings.count(text, minus) == start)
+
+    # Grouped integer parts: first group of 1-3 digits, then a separator every fourth position up to the decimal mark
+    thousands = same_kind(thousands)
+    n_sep = lengths - np.strings.str_len(clean)
+    sep = np.strings.find(text, thousands)
+    plain &= (n_sep == 0) | ((sep - start >= 1) & (sep - start <= 3) & (point - sep == 4 * n_sep))
+    for k in range(1, int(n_sep.max(initial=0))):
+        more = n_sep > k
+        following = np.strings.find(text, thousands, np.where(more, sep + 1, 0))
+        plain &= ~more | (following == sep + 4)
+        sep = np.where(more, following, sep)
+
+    return plain
+
+def _plain_dates(matrix, lengths, fmt: str):
+
+    """Mask of cells written exactly in the zero-padded form of 'fmt' ('25/02/2025' for '%d/%m/%Y')."""
+
+    np = _np()
+    shape = _DATE_SHAPES[fmt]
+    if matrix.shape[1] < len(shape):
+        return np.zeros(len(matrix), dtype=bool)
+
+    head = matrix[:, :len(shape)]
+    is_digit = np.array([c == "9" for c in shape])
+    literal = np.array([0 if c == "9" else ord(c) for c in shape], dtype=np.uint32)
+    fits = np.where(is_digit, (head >= 48) & (head <= 57), head == literal)
+    return (lengths == len(shape)) & fits.all(axis=1)
+
+def parse_amount_column(column, decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS):
+
+    """
+    Vectorized 'parse_amount' over a whole column (every table of a layout concatenated): cells are
+    stripped, cleaned with one np.strings.replace of the thousand separator, checked ('_plain_amounts')
+    and cast to float in one go; only the leftovers (currency symbols, stray text) go to the cached
+    scalar parser (see 'parse_amounts'). Empty or unparseable -> 0.0.
+    """
+
+    pd, np = _pd(), _np()
+    index = column.index if hasattr(column, "index") else None
+    text = _text_array(column)
+    values = np.zeros(len(text), dtype=float)
+    if not len(text):
+        return pd.Series(values, index=index, dtype=float)
+
+    same_kind = text.dtype.type      # Separators as bytes for a bytes array
+    clean = np.strings.replace(text, same_kind(thousands), same_kind())
+    plain = _plain_amounts(text, clean, decimal, thousands)
+
+    if plain.any():
+        clean = clean[plain]
+        if decimal != ".":
+            clean = np.strings.replace(clean, same_kind(decimal), same_kind("."))
+        values[plain] = clean.astype(float)
+
+    leftover = np.flatnonzero(~plain & (np.strings.str_len(text) > 0))
+    if len(leftover):
+        cells = text[leftover].tolist()
+        if text.dtype.kind == "S":
+            cells = [cell.decode() for cell in cells]
+        values[leftover] = parse_amounts(cells, decimal=decimal, thousands=thousands)
+    return pd.Series(values, index=index, dtype=float)
+
+def parse_minor_column(column, currencies, decimal: str = DEFAULT_DECIMAL, thousands: str = DEFAULT_THOUSANDS):
+
+    """
+    Amount column straight to int64 minor units of each row's currency ('currencies', one code per
+    row), each distinct cell parsed once per currency by 'parse_minor' (no float step).
+    """
+
+    pd, np = _pd(), _np()
+    values = column.to_numpy()
+    minor = np.zeros(len(values), dtype=np.int64)
+
+    for currency in np.unique(currencies).tolist():
+        rows = currencies == currency
+        parse = minor_parser(currency, decimal, thousands)
+        codes, uniques = pd.factorize(values[rows], use_na_sentinel=False)
+        minor[rows] = np.array([parse(str(value).strip()) for value in uniques], dtype=np.int64)[codes]
+
+    return pd.Series(minor, index=column.index)
+
+def parse_date_column(column):
+
+    """
+    Vectorized 'parse_date' over the distinct values of a column: the format is inferred once, cells
+    written exactly in it are converted by pd.to_datetime, and only the rest (other formats,
+    impossible dates, text) go to the cached scalar parser (see 'parse_dates'). Unparsed values are
+    kept stripped.
+    """
+
+    pd, np = _pd(), _np()
+    codes, uniques = pd.factorize(column.to_numpy(), use_na_sentinel=False)
+    text = np.strings.strip(np.asarray(uniques, dtype=str))
+    matrix, lengths = _chars(text)
+
+    values = text.astype(object)
+    done = np.zeros(len(uniques), dtype=bool)
+    fmt = infer_format(text.tolist())
+
+    if fmt is not None:
+        candidates = np.flatnonzero(_plain_dates(matrix, lengths, fmt))
+        parsed = pd.to_datetime(pd.Series(text[candidates]), format=fmt, errors="coerce")
+        ok = parsed.notna().to_numpy()
+        values[candidates[ok]] = parsed[ok].dt.strftime(OUTPUT_FORMAT).to_numpy()
+        done[candidates[ok]] = True
+
+    leftover = ~done & (lengths > 0)
+    if leftover.any():
+        values[leftover] = parse_dates(uniques[leftover].tolist(), fmt)
+    return pd.Series(values[codes], index=column.index, dtype=object)
+
+def _rule_mask(checks: tuple, parsed: dict, n_rows: int):
+
+    """Rows satisfying a compiled currency_split rule ((column, "0" | "!=0") checks); a missing column (None in 'parsed') fails it."""
+
+    np = _np()
+    mask = np.ones(n_rows, dtype=bool)
+
+    for col, condition in checks:
+        values = parsed[col]
+        if values is None:
+            return np.zeros(n_rows, dtype=bool)
+        if condition == "0":
+            mask &= values == 0
+        elif condition == "!=0":
+            mask &= values != 0
+
+    return mask
+
+def _classify(frame, table_sizes, compiled, header: dict):
+
+    """
+    Vectorized 'classify_currency' for every table of a frame (tables are consecutive rows, 'table_sizes'
+    rows each): a table is foreign if its first row matching either rule matches the foreign one,
+    domestic otherwise. Like the row engine, rows are read only until they decide: the first row of
+    every table is checked at once, then the second row of the tables still undecided, and so on.
+
+    Returns:
+        ndarray: True (foreign) per row, taken from the row's table.
+    """
+
+    np = _np()
+    ends = np.cumsum(table_sizes)
+    starts = ends - table_sizes
+    columns = {col: header.get(col) for col, _ in compiled.rule_columns}
+
+    foreign = np.zeros(len(table_sizes), dtype=bool)
+    pending = np.flatnonzero(table_sizes)
+    offset = 0
+
+    while len(pending):
+        rows = starts[pending] + offset
+        parsed = {
+            col: parse_amount_column(_cells(frame, idx, rows), *compiled.amount_format(col)).to_numpy() if idx is not None else None
+            for col, idx in columns.items()
+        }
+        is_foreign = _rule_mask(compiled.foreign, parsed, len(rows))
+        decided = is_foreign | _rule_mask(compiled.domestic, parsed, len(rows))
+        foreign[pending[is_foreign]] = True
+
+        offset += 1
+        pending = pending[~decided & (rows + 1 < ends[pending])]
+
+    return np.repeat(foreign, table_sizes)
+
+
+# --- Main Functions ---
+def extract_expenses_frame(bills: list, template_name: str = None, minor_units: bool = False):
+
+    """
+    Columnar extraction over many bills at once.
+
+    Matching tables that share a header layout are concatenated into one DataFrame, so amount
+    parsing (one vectorized pass per column, see 'parse_amount_column'), date parsing (format
+    inferred per column) and exclusion filtering run once per layout instead of once per cell;
+    currency classification only reads each table's first rows until the rules decide.
+    Each layout is resolved to its template once (auto-detected through the header index when
+    'template_name' is None, like the row engine).
+
+    Args:
+        bills (list): One list of parsed tables per bill.
+        template_name (str): Optional. Bill template name.
+        minor_units (bool): Optional. Amount fields as int64 minor units of each row's currency ('parse_minor_column').
+
+    Returns:
+        DataFrame: One row per expense, in document order, with columns 'bill' (position in
+                   'bills'), 'bucket' ('usd_expenses' / 'cop_expenses'), 'template' and the
+                   template fields (union of fields when several templates matched).
+    """
+
+    pd, np = _pd(), _np()
+
+    if template_name is None:
+        resolve = template_index().match
+    else:
+        fixed = get_template(template_name)
+        resolve = lambda header: fixed if header_matches(fixed.headers, header) else None
+
+    # Group matching tables by header layout: rows are concatenated per group (C-level list.extend)
+    groups = {}
+    table_seq = 0
+
+    for bill, tables in enumerate(bills):
+        for table in tables:
+
+            if not table or len(table) < 2:
+                continue
+
+            key = tuple(table[0])
+            group = groups.get(key)
+            if group is None:
+                compiled = resolve(table[0])
+                if compiled is None:
+                    continue
+                group = groups[key] = {"template": compiled, "rows": [], "bill": [], "table": []}
+
+            rows = table[1:]
+            group["rows"].extend(rows)
+            group["bill"].append((bill, len(rows)))
+            group["table"].append((table_seq, len(rows)))
+            table_seq += 1
+
+    frames = []
+
+    for header_row, group in groups.items():
+
+        compiled = group["template"]
+        fields = compiled.config["fields_to_extract"]
+        exclusions = compiled.exclusions
+
+        n_cols = len(header_row)
+        rows = group["rows"]
+        if set(map(len, rows)) != {n_cols}:
+            rows = [row if len(row) == n_cols else (list(row) + [""] * n_cols)[:n_cols] for row in rows]
+        frame = pd.DataFrame(rows, columns=range(n_cols), dtype=object)
+
+        bill_ids = np.repeat([b for b, _ in group["bill"]], [n for _, n in group["bill"]])
+        table_sizes = np.array([n for _, n in group["table"]], dtype=np.int64)
+        table_ids = np.repeat([t for t, _ in group["table"]], table_sizes)
+
+        # Same lookup as the row engine: stripped + lowercased headers, for rules and fields alike
+        header = {normalize_value(h).lower(): idx for idx, h in enumerate(header_row)}
+
+        foreign = _classify(frame, table_sizes, compiled, header)
+
+        # Row filters: empty rows and excluded descriptions
+        keep = np.fromiter(map(any, rows), dtype=bool, count=len(rows))
+        description_idx = header.get(_DESCRIPTION)
+        if description_idx is not None and len(exclusions):
+            keep &= ~np.array(exclusions.match_many(_cells(frame, description_idx).tolist()), dtype=bool)
+
+        foreign = foreign[keep]
+        out = {
+            "seq": np.flatnonzero(keep),
+            "table": table_ids[keep],
+            "bill": bill_ids[keep],
+            "bucket": np.where(foreign, BUCKETS[0], BUCKETS[1]),
+            "template": compiled.name,
+        }
+
+        # Field transformation: one vectorized call per column, over the kept rows of every table of the layout
+        for field in fields:
+
+            idx = header.get(field.lower())
+            column = pd.Series(_cells(frame, idx, keep) if idx is not None else [""] * len(foreign), dtype=object)
+
+            if "fecha" in field.lower():
+                values = parse_date_column(column)
+            elif field.lower() in AMOUNT_FIELDS and minor_units:
+                currencies = np.where(foreign, BUCKET_CURRENCIES[BUCKETS[0]], BUCKET_CURRENCIES[BUCKETS[1]])
+                values = parse_minor_column(column, currencies, *compiled.amount_format(field))
+            elif field.lower() in AMOUNT_FIELDS:
+                values = parse_amount_column(column, *compiled.amount_format(field))
+            else:
+                values = _on_uniques(column, lambda c: c.str.strip())
+
+            out[field] = values.to_numpy()
+
+        frames.append(pd.DataFrame(out))
+
+    if not frames:
+        fields = get_template(template_name).config["fields_to_extract"] if template_name else []
+        return pd.DataFrame(columns=list(META_COLUMNS) + fields)
+
+    # Document order: by table sequence, then row position within its group (already so with one layout)
+    result = pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+    if len(frames) > 1:
+        result = result.sort_values(["table", "seq"], kind="stable")
+    return result.drop(columns=["table", "seq"]).reset_index(drop=True)
+
+def frame_to_expenses(frame, n_bills: int = 1) -> list:
+
+    """Converts an 'extract_expenses_frame' result into one {'usd_expenses', 'cop_expenses'} dict per bill."""
+
+    np = _np()
+    results = [{bucket: [] for bucket in BUCKETS} for _ in range(n_bills)]
+    if not len(frame):
+        return results
+
+    fields = [c for c in frame.columns if c not in META_COLUMNS]
+    columns = [frame[field].tolist() for field in fields]
+
+    names = frame["template"].unique().tolist() if "template" in frame.columns else []
+    if len(names) <= 1:
+        records = list(map(dict, map(zip, repeat(fields), zip(*columns))))
+
+        # Records split per (bill, bucket) with one stable sort, keeping document order within each list
+        keys = frame["bill"].to_numpy(dtype=np.int64) * len(BUCKETS) + (frame["bucket"].to_numpy() == BUCKETS[1])
+        order = np.argsort(keys, kind="stable")
+        bounds = np.searchsorted(keys[order], np.arange(n_bills * len(BUCKETS) + 1)).tolist()
+        ordered = [records[i] for i in order.tolist()]
+        for key in range(n_bills * len(BUCKETS)):
+            results[key // len(BUCKETS)][BUCKETS[key % len(BUCKETS)]] = ordered[bounds[key]:bounds[key + 1]]
+        return results
+
+    # Several templates: each record keeps only its own template's fields, in its order
+    positions = {name: [fields.index(f) for f in get_template(name).config["fields_to_extract"]] for name in names}
+    for bill, bucket, name, *values in zip(frame["bill"].tolist(), frame["bucket"].tolist(), frame["template"].tolist(), *columns):
+        results[bill][bucket].append({fields[i]: values[i] for i in positions[name]})
+
+    return results
+
+def extract_expenses_columnar(tables: list, template_name: str = None, as_frame: bool = False, minor_units: bool = False):
+
+    """
+    Columnar counterpart of 'extract_expenses_from_tables' for one bill.
+
+    Args:
+        tables (list): Parsed tables of the bill.
+        template_name (str): Optional. Bill template name (auto-detected per table when None).
+        as_frame (bool): Optional. Return a DataFrame (with a 'bucket' column) instead of the dict.
+        minor_units (bool): Optional. Amount fields as integer minor units (see 'extract_expenses_frame').
+
+    Returns:
+        dict | DataFrame: {'usd_expenses': [...], 'cop_expenses': [...]} like the row engine.
+    """
+
+    frame = extract_expenses_frame([tables], template_name=template_name, minor_units=minor_units)
+    if as_frame:
+        return frame.drop(columns=["bill"])
+    return frame_to_expenses(frame)[0]
+
+def extract_expenses_batch(bills: list, template_name: str = None) -> list:
+
+    """Columnar extraction of many bills in one pass. Returns one expenses dict per bill."""
+
+    return frame_to_expenses(extract_expenses_frame(bills, template_name=template_name), n_bills=len(bills))
@@ -0,0 +1,189 @@
+# Built-in imports
+import os
+import re
+import json
+import threading
+from functools import lru_cache
+
+# Local imports
+from src.core.expenses import BUCKETS, record_fields
+from src.core.original_amounts import ORIGINAL_PATTERN
+
+
+
+
+# Constants setting
+MERCHANTS_PATH = os.path.join(os.path.dirname(__file__), "../../config/merchants.json")
+CACHE_SIZE = 8192               # Raw descriptions remembered per canonicalizer (monthly bills repeat merchants)
+
+_CACHE = {}                     # Config path -> (mtime_ns, size, MerchantCanonicalizer)
+_LOCK = threading.Lock()
+_SPACES = re.compile(r"\s+")
+_SEPARATORS = re.compile(r"[/|]")
+_NOT_SLUG = re.compile(r"[^a-z0-9]+")
+
+
+# --- Auxiliar Functions ---
+def slugify(name: str) -> str:
+
+    """'APPLE.COM BILL' -> 'apple-com-bill' (ID of a merchant with no configured alias)."""
+
+    return _NOT_SLUG.sub("-", name.lower()).strip("-")
+
+
+# --- Canonicalizer ---
+class MerchantCanonicalizer:
+
+    """
+    Maps raw bill descriptions to canonical merchant IDs.
+
+    A description is uppercased, '/' separators become spaces, the "VR MONEDA ORIG ... USA" fragment
+    is cut with the original-currency stage's own pattern ('original_amounts.ORIGINAL_PATTERN') and the
+    noise patterns (payment processor prefixes, trailing reference codes) are removed in order, leaving
+    the merchant name ('clean'). The name is then matched against the
+    configured aliases, all compiled into one anchored alternation; a name no alias covers gets
+    its own slug as ID. Results are kept in a bounded LRU cache keyed on the raw description.
+
+    Args:
+        noise_patterns (list): Regexes removed from the uppercased description, in order.
+        merchants (dict): {merchant ID: [name prefixes]}.
+        cache_size (int): Optional. LRU entries (raw descriptions).
+    """
+
+    def __init__(self, noise_patterns: list = (), merchants: dict = None, cache_size: int = CACHE_SIZE):
+
+        self.noise = tuple(re.compile(pattern) for pattern in noise_patterns)
+        self.merchants = dict(merchants or {})
+        self._group_id = {}
+        alternatives = []
+
+        for merchant_id, prefixes in self.merchants.items():
+            for prefix in prefixes:
+                group = f"_m{len(alternatives)}"
+                self._group_id[group] = merchant_id
+                alternatives.append(f"(?P<{group}>{re.escape(prefix.upper())})")
+
+        # Prefixes end on a word boundary: 'UBER' matches 'UBER RIDES', not 'UBERLANDIA'
+        self._alias = re.compile(f"^(?:{'|'.join(alternatives)})(?![A-Z0-9])").match if alternatives else None
+        self._cached = lru_cache(maxsize=cache_size)(self._canonicalize)
+
+    @classmethod
+    def from_config(cls, config: dict, cache_size: int = CACHE_SIZE) -> "MerchantCanonicalizer":
+        return cls(config.get("noise_patterns", []), config.get("merchants", {}), cache_size)
+
+    def clean(self, description: str) -> str:
+
+        """Merchant name of a description: 'APPLE.COM/BILL VR MONEDA ORIG 27800.0 USA' -> 'APPLE.COM BILL'."""
+
+        text = _SPACES.sub(" ", _SEPARATORS.sub(" ", str(description).upper())).strip()
+        text = ORIGINAL_PATTERN.sub("", text)
+        for pattern in self.noise:
+            text = pattern.sub("", text).strip()
+        return text
+
+    def _canonicalize(self, description: str) -> str:
+
+        name = self.clean(description)
+        found = self._alias(name) if self._alias is not None else None
+        return self._group_id[found.lastgroup] if found is not None else slugify(name)
+
+    def canonicalize(self, description: str) -> str:
+
+        """Canonical merchant ID of a raw description (cached)."""
+
+        return self._cached(description)
+
+    def canonicalize_many(self, descriptions: list) -> list:
+
+        """Batch mode: merchant ID per description, each distinct description resolved once."""
+
+        resolved = {}
+        for description in descriptions:
+            if description not in resolved:
+                resolved[description] = self._cached(description)
+        return [resolved[description] for description in descriptions]
+
+    def cache_info(self):
+        return self._cached.cache_info()
+
+    def cache_clear(self) -> None:
+        self._cached.cache_clear()
+
+    def __repr__(self) -> str:
+        return f"MerchantCanonicalizer({len(self.merchants)} merchants, {len(self.noise)} noise patterns)"
+
+
+# --- Loading ---
+def get_canonicalizer(path: str = MERCHANTS_PATH) -> MerchantCanonicalizer:
+
+    """
+    Canonicalizer of a merchants config file, built once per process (so its cache is shared by
+    every bill) and rebuilt when the file's modification time (or size) changes.
+    """
+
+    stat = os.stat(path)
+    entry = _CACHE.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry[2]
+
+    with _LOCK:
+        entry = _CACHE.get(path)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            with open(path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            entry = _CACHE[path] = (stat.st_mtime_ns, stat.st_size, MerchantCanonicalizer.from_config(config))
+
+    return entry[2]
+
+def description_label(fields) -> str:
+
+    """Label of the Expense 'description' attribute among a template's (label, attribute) pairs."""
+
+    for label, attribute in fields:
+        if attribute == "description":
+            return label
+    raise ValueError(f"No description field among: {[label for label, _ in fields]}")
+
+
+# --- Main Functions ---
+def canonicalize_expenses(expenses: dict, canonicalizer: MerchantCanonicalizer = None, fields: tuple = None) -> dict:
+
+    """
+    Merchant stage over a whole extracted statement (the output of 'extract_expenses_from_tables').
+
+    Records are left untouched; the IDs come back in parallel lists, one per bucket.
+
+    Args:
+        expenses (dict): {'usd_expenses': [...], 'cop_expenses': [...]}.
+        canonicalizer (MerchantCanonicalizer): Optional. Defaults to the one of 'config/merchants.json'.
+        fields (tuple): Optional. 'record_fields' of the template the bill was extracted with, naming its
+                        description label; resolved from each record's labels when None ('expenses.record_fields').
+
+    Returns:
+        dict: {'usd_expenses': [merchant ID, ...], 'cop_expenses': [merchant ID, ...]}
+    """
+
+    canonicalizer = canonicalizer or get_canonicalizer()
+    fixed = description_label(fields) if fields is not None else None
+    labels = {}                 # Record labels -> description label, resolved once per distinct set
+
+    def description_of(record: dict) -> str:
+        if fixed is not None:
+            return record[fixed]
+        keys = tuple(record)
+        if keys not in labels:
+            labels[keys] = description_label(record_fields(keys))
+        return record[labels[keys]]
+
+    return {
+        bucket: canonicalizer.canonicalize_many([description_of(record) for record in expenses.get(bucket, [])])
+        for bucket in BUCKETS
+    }
+
+def canonicalize_batch(batch, canonicalizer: MerchantCanonicalizer = None) -> list:
+
+    """Merchant ID per row of an ExpenseBatch, resolving each distinct (dictionary-encoded) description once."""
+
+    canonicalizer = canonicalizer or get_canonicalizer()
+    ids = {code: canonicalizer.canonicalize(batch.vocabulary[code]) for code in set(batch.descriptions)}
+    return [ids[code] for code in batch.descriptions]
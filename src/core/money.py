@@ -0,0 +1,255 @@
+# Built-in imports
+import re
+from functools import lru_cache
+
+# Local imports
+from src.core.amounts import check_format, normalize_amount
+
+# Third-party imports (numpy is imported lazily: see '_np'; src.core.templates too, since it imports src.core.expenses)
+
+
+
+
+# Constants setting
+CURRENCY_EXPONENTS = {"COP": 2, "USD": 2}       # Minor units per major unit = 10 ** exponent (ISO 4217)
+BUCKET_CURRENCIES = {"usd_expenses": "USD", "cop_expenses": "COP"}
+
+CACHE_SIZE = 8192                               # Distinct (amount text, currency, format) entries memoized
+
+_NUMBER = re.compile(r"^(-?)(\d*)(?:\.(\d*))?$")
+
+
+# --- Auxiliar Functions ---
+def _np():
+    import numpy as np
+    return np
+
+def exponent(currency: str) -> int:
+
+    """Decimal places of a currency's minor unit (KeyError on an unknown currency)."""
+
+    return CURRENCY_EXPONENTS[currency]
+
+def to_minor(amount: float, currency: str) -> int:
+
+    """Float amount (as 'parse_amount' returns it) -> integer minor units, rounded to the nearest unit."""
+
+    return int(round(amount * 10 ** CURRENCY_EXPONENTS[currency]))
+
+def from_minor(minor: int, currency: str) -> float:
+
+    """Integer minor units -> float (the float 'parse_amount' gives for the same printed amount)."""
+
+    return minor / 10 ** CURRENCY_EXPONENTS[currency]
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _minor(value: str, currency: str, decimal: str, thousands: str) -> int:
+
+    text = normalize_amount(value, decimal, thousands)
+    found = _NUMBER.match(text) if text is not None else None
+    if found is None or not (found.group(2) or found.group(3)):
+        return 0
+
+    sign, units, fraction = found.group(1), found.group(2) or "0", found.group(3) or ""
+    places = CURRENCY_EXPONENTS[currency]
+    minor = int(units) * 10 ** places + int((fraction + "0" * places)[:places] or 0)
+    if fraction[places:places + 1] >= "5":
+        minor += 1
+    return -minor if sign else minor
+
+def parse_minor(value: str, currency: str, decimal: str = ".", thousands: str = ",") -> int:
+
+    """
+    Amount text straight to integer minor units, without going through float (digits beyond the
+    currency's exponent are rounded half away from zero). Unparseable, badly grouped or empty values
+    give 0, like 'parse_amount'.
+    """
+
+    check_format(decimal, thousands)
+    return _minor(str(value), currency, decimal, thousands) if value else 0
+
+def minor_parser(currency: str, decimal: str = ".", thousands: str = ","):
+
+    """Validated single-argument 'parse_minor' for one currency and number format (the extractor's minor-unit fields)."""
+
+    check_format(decimal, thousands)
+    exponent(currency)
+
+    def parse(value: str) -> int:
+        return _minor(value if isinstance(value, str) else str(value), currency, decimal, thousands) if value else 0
+
+    parse.__name__ = "parse_minor"
+    return parse
+
+
+# --- Money ---
+class Money:
+
+    """
+    Exact amount of one currency, held as integer minor units (cents).
+
+    Sums and differences stay exact whatever the number of terms; mixing currencies raises ValueError.
+    Bills extracted with minor_units=True carry their amount fields in these units already (parsed
+    by 'parse_minor', no float step), so validation compares them as integers and 'bill_totals'
+    adds them up as they are.
+    """
+
+    __slots__ = ("minor", "currency")
+
+    def __init__(self, minor: int, currency: str):
+
+        exponent(currency)  # Validates the currency
+        self.minor = int(minor)
+        self.currency = currency
+
+    @classmethod
+    def from_float(cls, amount: float, currency: str) -> "Money":
+        return cls(to_minor(amount, currency), currency)
+
+    @classmethod
+    def from_text(cls, value: str, currency: str, decimal: str = ".", thousands: str = ",") -> "Money":
+        return cls(parse_minor(value, currency, decimal, thousands), currency)
+
+    @property
+    def amount(self) -> float:
+        return from_minor(self.minor, self.currency)
+
+    def rounded(self) -> int:
+
+        """Whole major units (half away from zero), as the bill summaries print them."""
+
+        scale = 10 ** CURRENCY_EXPONENTS[self.currency]
+        units, rest = divmod(abs(self.minor), scale)
+        units += 2 * rest >= scale
+        return -units if self.minor < 0 else units
+
+    def _same(self, other: "Money") -> None:
+        if not isinstance(other, Money):
+            raise TypeError(f"Expected Money, got {type(other).__name__}")
+        if other.currency != self.currency:
+            raise ValueError(f"Currency mismatch: {self.currency} vs {other.currency}")
+
+    def __add__(self, other: "Money") -> "Money":
+        if isinstance(other, int) and other == 0:
+            return self     # sum() start value
+        self._same(other)
+        return Money(self.minor + other.minor, self.currency)
+
+    __radd__ = __add__
+
+    def __sub__(self, other: "Money") -> "Money":
+        self._same(other)
+        return Money(self.minor - other.minor, self.currency)
+
+    def __neg__(self) -> "Money":
+        return Money(-self.minor, self.currency)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self.minor == other.minor and self.currency == other.currency
+
+    def __lt__(self, other: "Money") -> bool:
+        self._same(other)
+        return self.minor < other.minor
+
+    def __hash__(self) -> int:
+        return hash((self.minor, self.currency))
+
+    def __repr__(self) -> str:
+        return f"Money({self.minor}, {self.currency!r})"
+
+    def __str__(self) -> str:
+        places = CURRENCY_EXPONENTS[self.currency]
+        units, rest = divmod(abs(self.minor), 10 ** places)
+        sign = "-" if self.minor < 0 else ""
+        return f"{self.currency} {sign}{units:,}" + (f".{rest:0{places}d}" if places else "")
+
+
+# --- Vectorized Operations ---
+def minor_array(amounts, currency: str):
+
+    """Float amounts -> int64 NumPy array of minor units."""
+
+    np = _np()
+    values = np.asarray(amounts, dtype=float) * 10 ** CURRENCY_EXPONENTS[currency]
+    return np.rint(values).astype(np.int64)
+
+def total(minor) -> int:
+
+    """Exact sum of an int64 minor-unit array (as a Python int)."""
+
+    return int(_np().asarray(minor, dtype=_np().int64).sum())
+
+def group_sum(keys, minor) -> dict:
+
+    """
+    Exact per-key sums of minor units, vectorized (sort + reduceat, no float weights).
+
+    Args:
+        keys: Group key per row (any sortable NumPy-compatible values).
+        minor: int64 minor units per row.
+
+    Returns:
+        dict: {key: int}
+    """
+
+    np = _np()
+    keys = np.asarray(keys)
+    minor = np.asarray(minor, dtype=np.int64)
+    if not len(keys):
+        return {}
+
+    order = np.argsort(keys, kind="stable")
+    sorted_keys = keys[order]
+    starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+    sums = np.add.reduceat(minor[order], starts)
+    return dict(zip(sorted_keys[starts].tolist(), sums.tolist()))
+
+
+# --- Reporting ---
+def _total_field(template, labels) -> str:
+
+    if template is None or template.total_field is None:
+        raise ValueError(f"No bill template with a total field extracts {sorted(labels)}")
+    return template.total_field
+
+def bill_totals(expenses: dict, field: str = None, template_name: str = None, path: str = None, minor_units: bool = False) -> dict:
+
+    """
+    Exact total per currency of one extracted bill ({'usd_expenses': [...], 'cop_expenses': [...]}).
+
+    Args:
+        expenses (dict): Extracted bill.
+        field (str): Optional. Amount field to add up; defaults to the template's 'total_field'.
+        template_name (str): Optional. Template the bill was extracted with; when None, each record's
+                             template is recognized from its field labels ('template_for_fields').
+        path (str): Optional. Templates config file (defaults to 'config/bill_templates.json').
+        minor_units (bool): Optional. True if the amounts already are minor units (extracted with minor_units=True).
+
+    Returns:
+        dict: {currency: Money}
+    """
+
+    from src.core.templates import CONFIG_PATH, get_template, template_for_fields
+    path = path or CONFIG_PATH
+
+    if field is None and template_name is not None:
+        field = _total_field(get_template(template_name, path), [template_name])
+
+    fields = {}     # Record labels -> total field (auto-detected bills)
+    def field_of(record: dict) -> str:
+        if field is not None:
+            return field
+        labels = tuple(record)
+        if labels not in fields:
+            fields[labels] = _total_field(template_for_fields(labels, path), labels)
+        return fields[labels]
+
+    def minor(value, currency: str) -> int:
+        return value if minor_units else to_minor(value, currency)
+
+    return {
+        currency: Money(sum(minor(record[field_of(record)], currency) for record in expenses.get(bucket, [])), currency)
+        for bucket, currency in BUCKET_CURRENCIES.items()
+    }
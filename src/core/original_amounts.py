@@ -0,0 +1,102 @@
+# Built-in imports
+import re
+
+# Local imports
+from src.core.amounts import parse_amount
+from src.core.expenses import BUCKETS
+
+# Third-party imports (pandas columns are handled without importing it here: see 'split_original_column')
+
+
+
+
+# Constants setting
+DESCRIPTION = "Descripción"
+ORIGINAL_FIELDS = ("original_amount", "original_currency")
+
+# "Disney PLUS VR MONEDA ORIG 23450.0 USA": the fragment foreign rows append to the description
+ORIGINAL_PATTERN = re.compile(r"\s*\bVR\s+MONEDA\s+ORIG\s+(?P<amount>-?\d[\d,]*(?:\.\d+)?)\s+(?P<currency>[A-Z]{3})\s*$")
+
+
+# --- Auxiliar Functions ---
+def split_original(description: str) -> tuple:
+
+    """
+    'Disney PLUS VR MONEDA ORIG 23450.0 USA' -> ('Disney PLUS', 23450.0, 'USA').
+
+    Descriptions without the fragment come back unchanged, with None amount and currency.
+    """
+
+    found = ORIGINAL_PATTERN.search(description) if isinstance(description, str) else None
+    if found is None:
+        return description, None, None
+    return description[:found.start()], parse_amount(found.group("amount")), found.group("currency")
+
+
+# --- Main Functions ---
+def split_original_column(column) -> tuple:
+
+    """
+    Splits a whole description column at once.
+
+    A pandas Series goes through the vectorized '.str' accessor (one extract, one replace) and its
+    amounts through 'parse_amount', the rule the list path uses, so '1,23' is rejected by both;
+    any other iterable is split per distinct value, since bills repeat descriptions.
+
+    Args:
+        column (list | pandas.Series): Descripción values.
+
+    Returns:
+        tuple: (descriptions, original amounts, original currencies), same type and length as the
+               input (Series or lists), None / NaN where a row has no original-currency amount.
+    """
+
+    if hasattr(column, "str"):
+        extracted = column.str.extract(ORIGINAL_PATTERN)
+        amounts = extracted["amount"].map(parse_amount, na_action="ignore").astype(float)
+        return column.str.replace(ORIGINAL_PATTERN, "", regex=True), amounts, extracted["currency"]
+
+    split = {}
+    descriptions, amounts, currencies = [], [], []
+    for value in column:
+        if value not in split:
+            split[value] = split_original(value)
+        description, amount, currency = split[value]
+        descriptions.append(description)
+        amounts.append(amount)
+        currencies.append(currency)
+    return descriptions, amounts, currencies
+
+def split_original_frame(frame):
+
+    """
+    Same split on a columnar-engine DataFrame ('extract_expenses_columnar(..., as_frame=True)'):
+    Descripción is rewritten and 'original_amount' / 'original_currency' columns added (NaN where absent).
+    """
+
+    frame = frame.copy()
+    frame[DESCRIPTION], frame["original_amount"], frame["original_currency"] = split_original_column(frame[DESCRIPTION])
+    return frame
+
+def add_original_amounts(expenses: dict) -> dict:
+
+    """
+    Original-currency stage over a whole extracted statement (the output of 'extract_expenses_from_tables').
+
+    Records whose Descripción carries the "VR MONEDA ORIG ..." fragment lose it and get 'original_amount'
+    and 'original_currency' instead; other records are copied as they are. The input is not modified.
+
+    Returns:
+        dict: {'usd_expenses': [...], 'cop_expenses': [...]} with the new records.
+    """
+
+    result = {}
+    for bucket in BUCKETS:
+        records = expenses.get(bucket, [])
+        descriptions, amounts, currencies = split_original_column([record.get(DESCRIPTION, "") for record in records])
+        result[bucket] = [
+            {**record, DESCRIPTION: description, "original_amount": amount, "original_currency": currency}
+            if currency is not None else dict(record)
+            for record, description, amount, currency in zip(records, descriptions, amounts, currencies)
+        ]
+    return result
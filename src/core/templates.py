@@ -0,0 +1,344 @@
+# Built-in imports
+import os
+import json
+import threading
+
+# Local imports
+from src.core.amounts import DEFAULT_DECIMAL, DEFAULT_THOUSANDS, amount_parser
+from src.core.dates import parse_date
+from src.core.exclusions import ExclusionRules
+from src.core.expenses import FIELDS
+
+
+
+
+# Constants setting
+CONFIG_PATH = os.path.join(os.path.dirname(__file__), "../../config/bill_templates.json")
+
+AMOUNT_FIELDS = frozenset({"cargos y abonos", "saldo a diferir", "valor original"})
+DEFAULT_TOTAL_FIELD = "valor original"      # Amount the bill summaries total, unless a template says otherwise
+
+_CACHE = {}                 # Config path -> (mtime_ns, size, {template name: CompiledTemplate}, TemplateIndex)
+_LOCK = threading.Lock()
+
+
+# --- Compiled Template ---
+class CompiledTemplate:
+
+    """
+    Bill template with everything the extractor needs precomputed.
+
+    Attributes:
+        name (str): Template name.
+        config (dict): Raw template entry from 'bill_templates.json'.
+        headers (tuple): Expected headers, lowercased (for 'header_matches').
+        fields (tuple): (field, field lowercased, parser) per field to extract; parser maps the
+                        stripped cell text to the output value (date, amount or text).
+        exclusions (ExclusionRules): Compiled 'exclude_descriptions' rules (exact, prefix, contains, regex).
+        foreign (tuple): (column lowercased, "0" | "!=0") checks of the "foreign" currency_split rule.
+        domestic (tuple): Same for the "domestic" rule.
+        rule_columns (tuple): (column lowercased, parser) of every column the rules read, each once.
+        number_format (tuple): Default (decimal, thousands) separators of the template's amounts.
+        column_formats (dict): Column lowercased -> (decimal, thousands), overriding 'number_format'.
+        record_fields (tuple): (field, Expense attribute) per extracted field with an attribute (config
+                               "field_attributes", else the bancolombia_v1 labels of 'expenses.FIELDS').
+        total_field (str | None): Amount field the bill totals add up (config "total_field", else
+                                  "Valor Original" when the template extracts it).
+    """
+
+    # Plain slotted class (not a dataclass): this module is on the CLI import path
+    __slots__ = ("name", "config", "headers", "fields", "exclusions", "foreign", "domestic", "rule_columns",
+                 "number_format", "column_formats", "record_fields", "total_field")
+
+    def __init__(self, name: str, config: dict, headers: tuple, fields: tuple, exclusions: ExclusionRules, foreign: tuple, domestic: tuple,
+                 rule_columns: tuple = (), number_format: tuple = (DEFAULT_DECIMAL, DEFAULT_THOUSANDS), column_formats: dict = None,
+                 record_fields: tuple = (), total_field: str = None):
+
+        self.name = name
+        self.config = config
+        self.headers = headers
+        self.fields = fields
+        self.exclusions = exclusions
+        self.foreign = foreign
+        self.domestic = domestic
+        self.rule_columns = rule_columns
+        self.number_format = number_format
+        self.column_formats = column_formats or {}
+        self.record_fields = record_fields
+        self.total_field = total_field
+
+    def amount_format(self, column: str) -> tuple:
+
+        """(decimal, thousands) separators of an amount column."""
+
+        return self.column_formats.get(column.lower(), self.number_format)
+
+    def parse_rule_columns(self, row: list, index_map: dict) -> dict:
+
+        """
+        Parsed values of the rule columns of one row (None for a column the table lacks).
+        """
+
+        parsed = {}
+        for col, parser in self.rule_columns:
+            idx = index_map.get(col)
+            parsed[col] = None if idx is None else parser(row[idx] if idx < len(row) else "")
+        return parsed
+
+    def classify(self, parsed: dict):
+
+        """
+        Currency of a row from its parsed rule columns.
+
+        Returns:
+            str | None: "foreign" or "domestic" when that rule holds (foreign checked first), else None.
+        """
+
+        if _rule_holds(self.foreign, parsed):
+            return "foreign"
+        if _rule_holds(self.domestic, parsed):
+            return "domestic"
+        return None
+
+    def __repr__(self) -> str:
+        return f"CompiledTemplate({self.name!r})"
+
+
+def _as_text(value: str) -> str:
+    return value
+
+def _number_format(spec: dict) -> tuple:
+    return (spec.get("decimal", DEFAULT_DECIMAL), spec.get("thousands", DEFAULT_THOUSANDS))
+
+def _compile_rule(rule: dict) -> tuple:
+
+    """Turns a currency_split rule ({column: "0" | "!=0"}) into (column lowercased, condition) checks."""
+
+    return tuple((col.lower(), condition) for col, condition in rule.items())
+
+def _rule_holds(checks: tuple, parsed: dict) -> bool:
+
+    """True if every check holds; a column missing from the table fails the rule."""
+
+    for col, condition in checks:
+        value = parsed.get(col)
+        if value is None:
+            return False
+        if condition == "0" and value != 0:
+            return False
+        if condition == "!=0" and value == 0:
+            return False
+    return True
+
+def compile_template(name: str, config: dict) -> CompiledTemplate:
+
+    """Precomputes headers, field parsers, exclusions, number formats and currency rules of one template entry."""
+
+    number_format = _number_format(config.get("number_format", {}))
+    column_formats = {col.lower(): _number_format(spec) for col, spec in config.get("column_formats", {}).items()}
+
+    # One validated parser per distinct format
+    parsers = {}
+    def parser_for(column: str):
+        fmt = column_formats.get(column, number_format)
+        if fmt not in parsers:
+            parsers[fmt] = amount_parser(*fmt)
+        return parsers[fmt]
+
+    fields = []
+    for field in config["fields_to_extract"]:
+        key = field.lower()
+        if "fecha" in key:
+            parser = parse_date
+        elif key in AMOUNT_FIELDS:
+            parser = parser_for(key)
+        else:
+            parser = _as_text
+        fields.append((field, key, parser))
+
+    total_field = config.get("total_field")
+    if total_field is None:
+        total_field = next((field for field, key, _ in fields if key == DEFAULT_TOTAL_FIELD), None)
+    elif total_field.lower() not in AMOUNT_FIELDS or total_field not in config["fields_to_extract"]:
+        raise ValueError(f"Template '{name}': total_field '{total_field}' is not an extracted amount field")
+
+    attributes = {**dict(FIELDS), **config.get("field_attributes", {})}
+    unknown = set(attributes.values()) - {attribute for _, attribute in FIELDS}
+    if unknown:
+        raise ValueError(f"Template '{name}': field_attributes name no Expense attribute: {sorted(unknown)}")
+    record_fields = tuple((field, attributes[field]) for field in config["fields_to_extract"] if field in attributes)
+
+    foreign = _compile_rule(config["currency_split"]["foreign"])
+    domestic = _compile_rule(config["currency_split"]["domestic"])
+
+    return CompiledTemplate(
+        name=name,
+        config=config,
+        headers=tuple(h.lower() for h in config["headers"]),
+        fields=tuple(fields),
+        exclusions=ExclusionRules(config.get("exclude_descriptions", [])),
+        foreign=foreign,
+        domestic=domestic,
+        rule_columns=tuple((col, parser_for(col)) for col in dict.fromkeys(col for col, _ in foreign + domestic)),
+        number_format=number_format,
+        column_formats=column_formats,
+        record_fields=record_fields,
+        total_field=total_field,
+    )
+
+
+# --- Template Index ---
+class TemplateIndex:
+
+    """
+    Inverted index from normalized header (stripped, lowercased) to the templates expecting it.
+
+    A table header is matched against every registered template by looking up each of its cells
+    once and counting hits per template: the cost depends on the table's width, not on how many
+    issuers / template versions the config holds. Results are memoized per header row, since a
+    bill repeats the same header on every page.
+
+    Attributes:
+        templates (dict): {template name: CompiledTemplate}, in config order.
+        postings (dict): Header -> tuple of template names expecting it.
+        required (dict): Template name -> number of distinct expected headers.
+        extracts (tuple): (field labels, template name) per template, most fields first (for 'for_fields').
+    """
+
+    __slots__ = ("templates", "postings", "required", "extracts", "_order", "_memo")
+
+    MEMO_SIZE = 1024
+
+    def __init__(self, templates: dict):
+
+        self.templates = templates
+        self._order = {name: position for position, name in enumerate(templates)}
+        self._memo = {}
+
+        postings, required = {}, {}
+        for name, template in templates.items():
+            headers = set(template.headers)
+            if not headers:
+                continue        # A template without headers would match any table
+            required[name] = len(headers)
+            for header in headers:
+                postings.setdefault(header, []).append(name)
+
+        self.postings = {header: tuple(names) for header, names in postings.items()}
+        self.required = required
+        self.extracts = tuple(sorted(
+            ((frozenset(template.config["fields_to_extract"]), name) for name, template in templates.items()),
+            key=lambda entry: (-len(entry[0]), self._order[entry[1]]),
+        ))
+
+    def candidates(self, header_row: list) -> list:
+
+        """
+        Templates whose expected headers all appear in 'header_row' (same rule as 'header_matches'),
+        best first: most expected headers (most specific), then config order.
+        """
+
+        hits = {}
+        for header in {h.strip().lower() for h in header_row if isinstance(h, str)}:
+            for name in self.postings.get(header, ()):
+                hits[name] = hits.get(name, 0) + 1
+
+        matched = [name for name, count in hits.items() if count == self.required[name]]
+        matched.sort(key=lambda name: (-self.required[name], self._order[name]))
+        return matched
+
+    def match(self, header_row: list):
+
+        """
+        Best template for a table header.
+
+        Returns:
+            CompiledTemplate | None: None if no registered template matches.
+        """
+
+        key = tuple(header_row)
+        if key in self._memo:
+            return self._memo[key]
+
+        matched = self.candidates(header_row)
+        template = self.templates[matched[0]] if matched else None
+
+        if len(self._memo) >= self.MEMO_SIZE:
+            self._memo.clear()
+        self._memo[key] = template
+        return template
+
+    def for_fields(self, labels):
+
+        """
+        Template whose extracted fields all appear in 'labels' (the keys of one extracted record),
+        the one extracting the most fields first; None if no template fits.
+        """
+
+        labels = set(labels)
+        for fields, name in self.extracts:
+            if fields <= labels:
+                return self.templates[name]
+        return None
+
+
+# --- Loading ---
+def _load(path: str) -> tuple:
+
+    """Cache entry of a config file: (mtime_ns, size, compiled templates, index), rebuilt when the file changes."""
+
+    stat = os.stat(path)
+    entry = _CACHE.get(path)
+    if entry is not None and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+        return entry
+
+    with _LOCK:
+        entry = _CACHE.get(path)
+        if entry is None or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+            with open(path, "r", encoding="utf-8") as f:
+                config = json.load(f)
+            compiled = {name: compile_template(name, tpl) for name, tpl in config["bill_templates"].items()}
+            entry = _CACHE[path] = (stat.st_mtime_ns, stat.st_size, compiled, TemplateIndex(compiled))
+
+    return entry
+
+def load_templates(path: str = CONFIG_PATH) -> dict:
+
+    """
+    Compiled templates of a config file, loaded once per process and reloaded when the file's
+    modification time (or size) changes.
+
+    Returns:
+        dict: {template name: CompiledTemplate}
+    """
+
+    return _load(path)[2]
+
+def template_index(path: str = CONFIG_PATH) -> TemplateIndex:
+
+    """Header index over every template of a config file (rebuilt with the templates)."""
+
+    return _load(path)[3]
+
+def match_template(header_row: list, path: str = CONFIG_PATH):
+
+    """Best registered template for a table header, None if no template matches (see 'TemplateIndex')."""
+
+    return _load(path)[3].match(header_row)
+
+def template_for_fields(labels, path: str = CONFIG_PATH):
+
+    """Template an extracted record came from, by its field labels (see 'TemplateIndex.for_fields')."""
+
+    return _load(path)[3].for_fields(labels)
+
+def get_template(template_name: str, path: str = CONFIG_PATH) -> CompiledTemplate:
+
+    """Compiled template by name (KeyError if the config has no such template)."""
+
+    return load_templates(path)[template_name]
+
+def clear_template_cache() -> None:
+
+    with _LOCK:
+        _CACHE.clear()
@@ -0,0 +1,119 @@
+# Builtin Imports
+import os
+import time
+import sqlite3
+import hashlib
+import threading
+
+
+
+
+# Constants setting
+INDEX_PATH = os.path.join(os.path.dirname(__file__), "../../data/content_index.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS documents (
+    sha256              TEXT PRIMARY KEY,
+    file_name           TEXT,
+    size                INTEGER,
+    s3_bucket           TEXT,
+    s3_key              TEXT,
+    textract_artifact   TEXT,
+    updated_at          TEXT
+);
+CREATE INDEX IF NOT EXISTS documents_s3 ON documents (s3_bucket, s3_key);
+"""
+
+
+# --- Auxiliar Functions ---
+def file_sha256(file_path: str) -> str:
+
+    """SHA-256 of a file's content, read in 1 MB chunks."""
+
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Main class
+class ContentIndex:
+
+    """
+    Content-addressed index of processed PDFs (local SQLite).
+
+    Maps the SHA-256 of a PDF to the S3 object it was uploaded as and to the Textract artifact
+    produced for it, so re-running the pipeline on the same bill neither re-uploads it nor
+    pays for another Textract job. Safe to share between threads.
+
+    Args:
+        path (str): Optional. SQLite file. Use ':memory:' for a throwaway index.
+    """
+
+    def __init__(self, path: str = INDEX_PATH):
+
+        if path != ":memory:" and os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript(_SCHEMA)
+
+    def lookup(self, sha256: str) -> dict:
+
+        """Index entry of a content hash, or None."""
+
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM documents WHERE sha256 = ?", (sha256,)).fetchone()
+        return dict(row) if row else None
+
+    def lookup_s3_key(self, s3_key: str, bucket: str = None) -> dict:
+
+        """Index entry of an uploaded object, or None."""
+
+        query = "SELECT * FROM documents WHERE s3_key = ?" + (" AND s3_bucket = ?" if bucket is not None else "")
+        params = (s3_key, bucket) if bucket is not None else (s3_key,)
+
+        with self._lock:
+            row = self._conn.execute(query, params).fetchone()
+        return dict(row) if row else None
+
+    def record_upload(self, sha256: str, file_name: str, size: int, bucket: str, s3_key: str) -> None:
+
+        with self._lock, self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO documents (sha256, file_name, size, s3_bucket, s3_key, updated_at) VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT (sha256) DO UPDATE SET
+                    file_name = excluded.file_name, size = excluded.size, s3_bucket = excluded.s3_bucket,
+                    s3_key = excluded.s3_key, updated_at = excluded.updated_at
+                """,
+                (sha256, file_name, size, bucket, s3_key, _now()),
+            )
+
+    def record_artifact(self, s3_key: str, artifact_path: str, bucket: str = None) -> bool:
+
+        """Attaches a Textract artifact to the uploaded object. Returns False if the object is not indexed."""
+
+        query = "UPDATE documents SET textract_artifact = ?, updated_at = ? WHERE s3_key = ?" + (" AND s3_bucket = ?" if bucket is not None else "")
+        params = (artifact_path, _now(), s3_key) + ((bucket,) if bucket is not None else ())
+
+        with self._lock, self._conn:
+            return self._conn.execute(query, params).rowcount > 0
+
+    def forget(self, sha256: str) -> bool:
+
+        """Removes an entry (e.g. after deleting the S3 object). Returns True if it existed."""
+
+        with self._lock, self._conn:
+            return self._conn.execute("DELETE FROM documents WHERE sha256 = ?", (sha256,)).rowcount > 0
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+def _now() -> str:
+    return time.strftime("%Y-%m-%dT%H:%M:%S")
@@ -0,0 +1,153 @@
+# Builtin Imports
+import os
+import json
+import uuid
+import shutil
+import hashlib
+import threading
+
+
+
+
+# Constants setting
+LOCAL_S3_ROOT = os.path.join(os.path.dirname(__file__), "../../data/local_s3")
+
+
+# Main class
+class LocalS3Client:
+
+    """
+    Filesystem-backed stand-in for the boto3 S3 client (the subset PBA uses).
+
+    Objects are stored as files under '<root>/<bucket>/<key>', so uploads can be exercised and
+    inspected without AWS. Multipart uploads keep their parts under '<root>/.multipart/<UploadId>/'
+    until completed, so interrupted uploads can be listed and resumed like on S3.
+
+    Args:
+        root (str): Optional. Directory holding the fake buckets.
+    """
+
+    def __init__(self, root: str = LOCAL_S3_ROOT):
+
+        self.root = root
+        self.calls = {}
+        self._lock = threading.Lock()
+
+    def _path(self, bucket: str, key: str) -> str:
+        return os.path.join(self.root, bucket or "local", *key.split("/"))
+
+    def _tick(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] = self.calls.get(operation, 0) + 1
+
+    def _multipart_dir(self, upload_id: str) -> str:
+        return os.path.join(self.root, ".multipart", upload_id)
+
+    def upload_file(self, Filename: str, Bucket: str, Key: str, ExtraArgs: dict = None, Callback=None, Config=None) -> None:
+
+        self._tick("upload_file")
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.copyfile(Filename, path)
+
+        if Callback is not None:
+            Callback(os.path.getsize(path))
+
+    def put_object(self, Bucket: str, Key: str, Body=b"", **kwargs) -> dict:
+
+        self._tick("put_object")
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(Body if isinstance(Body, bytes) else Body.read())
+        return {}
+
+    def get_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+
+        self._tick("get_object")
+        path = self._path(Bucket, Key)
+        if not os.path.exists(path):
+            raise KeyError(f"NoSuchKey: {Key}")
+        with open(path, "rb") as f:
+            body = f.read()
+        return {"Body": _Body(body), "ContentLength": len(body)}
+
+    def head_object(self, Bucket: str, Key: str, **kwargs) -> dict:
+
+        self._tick("head_object")
+        path = self._path(Bucket, Key)
+        if not os.path.exists(path):
+            raise KeyError(f"NoSuchKey: {Key}")
+        return {"ContentLength": os.path.getsize(path)}
+
+    # Multipart API
+    def create_multipart_upload(self, Bucket: str, Key: str, **kwargs) -> dict:
+
+        self._tick("create_multipart_upload")
+        upload_id = uuid.uuid4().hex
+        os.makedirs(self._multipart_dir(upload_id))
+        with open(os.path.join(self._multipart_dir(upload_id), "upload.json"), "w", encoding="utf-8") as f:
+            json.dump({"Bucket": Bucket, "Key": Key}, f)
+        return {"Bucket": Bucket, "Key": Key, "UploadId": upload_id}
+
+    def upload_part(self, Bucket: str, Key: str, UploadId: str, PartNumber: int, Body, **kwargs) -> dict:
+
+        self._tick("upload_part")
+        data = Body if isinstance(Body, bytes) else Body.read()
+        with open(os.path.join(self._multipart_dir(UploadId), f"{PartNumber:05d}.part"), "wb") as f:
+            f.write(data)
+        return {"ETag": f'"{hashlib.md5(data).hexdigest()}"'}
+
+    def list_parts(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> dict:
+
+        self._tick("list_parts")
+        parts = []
+        for name in sorted(os.listdir(self._multipart_dir(UploadId))):
+            if name.endswith(".part"):
+                with open(os.path.join(self._multipart_dir(UploadId), name), "rb") as f:
+                    data = f.read()
+                parts.append({"PartNumber": int(name[:-5]), "ETag": f'"{hashlib.md5(data).hexdigest()}"', "Size": len(data)})
+        return {"Parts": parts, "IsTruncated": False}
+
+    def list_multipart_uploads(self, Bucket: str, Prefix: str = "", **kwargs) -> dict:
+
+        self._tick("list_multipart_uploads")
+        uploads = []
+        base = os.path.join(self.root, ".multipart")
+        for upload_id in sorted(os.listdir(base)) if os.path.isdir(base) else []:
+            with open(os.path.join(base, upload_id, "upload.json"), "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta["Bucket"] == Bucket and meta["Key"].startswith(Prefix):
+                uploads.append({"Key": meta["Key"], "UploadId": upload_id})
+        return {"Uploads": uploads, "IsTruncated": False}
+
+    def complete_multipart_upload(self, Bucket: str, Key: str, UploadId: str, MultipartUpload: dict, **kwargs) -> dict:
+
+        self._tick("complete_multipart_upload")
+        path = self._path(Bucket, Key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        with open(path, "wb") as out:
+            for part in sorted(MultipartUpload["Parts"], key=lambda p: p["PartNumber"]):
+                with open(os.path.join(self._multipart_dir(UploadId), f"{part['PartNumber']:05d}.part"), "rb") as f:
+                    out.write(f.read())
+
+        shutil.rmtree(self._multipart_dir(UploadId))
+        return {"Bucket": Bucket, "Key": Key}
+
+    def abort_multipart_upload(self, Bucket: str, Key: str, UploadId: str, **kwargs) -> dict:
+
+        self._tick("abort_multipart_upload")
+        shutil.rmtree(self._multipart_dir(UploadId), ignore_errors=True)
+        return {}
+
+
+class _Body:
+
+    """Minimal StreamingBody replacement."""
+
+    def __init__(self, data: bytes):
+        self._data = data
+
+    def read(self) -> bytes:
+        return self._data
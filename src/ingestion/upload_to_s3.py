@@ -1,38 +1,80 @@
 # Builtin Imports
 import os
+import time
 import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # Local Imports
-...
+from src.core.aws_clients import get_client, default_bucket
+from src.ingestion.content_index import file_sha256
 
-# Third-party imports
-import boto3
-from dotenv import load_dotenv
 
 
 
+# Transfer settings
+MAX_UPLOAD_WORKERS = 8                  # Files uploaded in parallel by 'upload_files'
+MULTIPART_THRESHOLD = 8 * 1024 * 1024   # Files above this size are sent in parts
+MULTIPART_CHUNKSIZE = 8 * 1024 * 1024   # Part size (S3 minimum is 5 MB, except the last part)
+MULTIPART_CONCURRENCY = 4               # Parts in flight per file
+POOL_CONNECTIONS = MAX_UPLOAD_WORKERS * MULTIPART_CONCURRENCY
 
-# Load environment variables
-load_dotenv()
+_TRANSFER_CONFIG = None
 
-# Get credentials from .env
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-AWS_REGION = os.getenv("AWS_REGION")
-S3_BUCKET = os.getenv("S3_BUCKET")
 
-# Initialize S3 client
-s3 = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_REGION
-)
+# --- Auxiliar Functions ---
+def s3_client():
+
+    """Shared S3 client (built on first use, pooled for every upload thread)."""
+
+    return get_client("s3", max_pool_connections=POOL_CONNECTIONS)
+
+def transfer_config():
+
+    """Tuned TransferConfig (boto3 is imported on first call)."""
+
+    global _TRANSFER_CONFIG
+
+    if _TRANSFER_CONFIG is None:
+        from boto3.s3.transfer import TransferConfig
+        _TRANSFER_CONFIG = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MULTIPART_CONCURRENCY,
+            use_threads=True,
+        )
+    return _TRANSFER_CONFIG
+
+def __getattr__(name: str):
+
+    # Former module-level globals, now resolved lazily
+    if name == "s3":
+        return s3_client()
+    if name == "S3_BUCKET":
+        return default_bucket()
+    if name == "TRANSFER_CONFIG":
+        return transfer_config()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _already_uploaded(file_path: str, bucket: str, index) -> tuple:
+
+    """
+    Content-addressed short-circuit shared by both upload paths.
+
+    Returns:
+        tuple: (sha256 of the file, S3 key of the same content already in 'bucket' or None).
+    """
+
+    sha256 = file_sha256(file_path)
+    entry = index.lookup(sha256)
+    if entry and entry["s3_bucket"] == bucket and entry["s3_key"]:
+        print(f"♻️ Skipped upload of '{os.path.basename(file_path)}': same content already at '{entry['s3_key']}'")
+        return sha256, entry["s3_key"]
+    return sha256, None
 
 
 # Main function
-def upload_file(file_path: str, s3_key: str = None) -> str:
+def upload_file(file_path: str, s3_key: str = None, client=None, bucket: str = None, index=None, stats: dict = None) -> str:
 
     """
     Uploads a file to the configured S3 bucket.
@@ -40,25 +82,176 @@ def upload_file(file_path: str, s3_key: str = None) -> str:
     Args:
         file_path (str): Local path to the file.
         s3_key (str): Optional. S3 key to use (default: basename of file_path)
+        client: Optional. S3 client (e.g. LocalS3Client). Defaults to the module client.
+        bucket (str): Optional. Target bucket. Defaults to S3_BUCKET.
+        index (ContentIndex): Optional. Content-hash index; a PDF already uploaded to the same
+                              bucket is not uploaded again and its existing key is returned.
+        stats (dict): Optional. Receives 'bytes_sent' (0 when the upload was skipped).
 
     Returns:
         str: S3 object key used.
     """
 
+    client = client if client is not None else s3_client()
+    bucket = bucket if bucket is not None else default_bucket()
+    basename = os.path.basename(file_path)
+    stats = stats if stats is not None else {}
+    stats["bytes_sent"] = 0
+
+    # Content-addressed short-circuit
+    if index is not None:
+        sha256, existing = _already_uploaded(file_path, bucket, index)
+        if existing:
+            return existing
+
     if not s3_key:
 
         # Generate a key like: uploads/2025-07-21_1630_<UUID>.pdf
-        basename = os.path.basename(file_path)
         date_prefix = datetime.now().strftime("%Y-%m-%d_%H%M")
         unique_id = str(uuid.uuid4())[:8]  # shorter UUID
         s3_key = f"uploads/{date_prefix}_{unique_id}_{basename}"
 
         
     try:
-        s3.upload_file(file_path, S3_BUCKET, s3_key)
-        print(f"✅ Uploaded '{basename}'\nLocation: to S3 bucket '{S3_BUCKET}'\nAs: '{s3_key}'")
+        client.upload_file(file_path, bucket, s3_key, Config=transfer_config())
+        stats["bytes_sent"] = os.path.getsize(file_path)
+        print(f"✅ Uploaded '{basename}'\nLocation: to S3 bucket '{bucket}'\nAs: '{s3_key}'")
+
+        if index is not None:
+            index.record_upload(sha256, basename, os.path.getsize(file_path), bucket, s3_key)
+
         return s3_key
     
     except Exception as e:
         print(f"❌ Failed to upload: {e}")
-        raise
\ No newline at end of file
+        raise
+
+
+# --- Batch & Resumable Uploads ---
+def upload_file_resumable(file_path: str, s3_key: str = None, client=None, bucket: str = None, part_size: int = MULTIPART_CHUNKSIZE,
+                          index=None, stats: dict = None) -> str:
+
+    """
+    Uploads a file with the low-level multipart API so an interrupted upload can be resumed.
+
+    If an unfinished multipart upload already exists for the key, the parts S3 already holds
+    (same number and size) are kept and only the missing ones are sent.
+
+    Args:
+        file_path (str): Local path to the file.
+        s3_key (str): Optional. S3 key to use. Defaults to a content-derived key, so a re-run
+                      after an interruption targets the same upload.
+        client: Optional. S3 client (e.g. LocalS3Client). Defaults to the module client.
+        bucket (str): Optional. Target bucket. Defaults to S3_BUCKET.
+        part_size (int): Optional. Bytes per part.
+        index (ContentIndex): Optional. Content-hash index, checked before any multipart call (see 'upload_file').
+        stats (dict): Optional. Receives 'bytes_sent': bytes of the parts actually sent by this call.
+
+    Returns:
+        str: S3 object key used.
+    """
+
+    client = client if client is not None else s3_client()
+    bucket = bucket if bucket is not None else default_bucket()
+    basename = os.path.basename(file_path)
+    stats = stats if stats is not None else {}
+    stats["bytes_sent"] = 0
+
+    # Content-addressed short-circuit
+    sha256 = None
+    if index is not None:
+        sha256, existing = _already_uploaded(file_path, bucket, index)
+        if existing:
+            return existing
+
+    if not s3_key:
+        s3_key = f"uploads/{(sha256 or file_sha256(file_path))[:12]}_{basename}"
+
+    # Find an interrupted upload for this key, or start a new one
+    uploads = client.list_multipart_uploads(Bucket=bucket, Prefix=s3_key).get("Uploads", [])
+    upload_id = next((u["UploadId"] for u in uploads if u["Key"] == s3_key), None)
+    done = {}
+
+    if upload_id:
+        request = {"Bucket": bucket, "Key": s3_key, "UploadId": upload_id}
+        while True:
+            listing = client.list_parts(**request)
+            done.update({p["PartNumber"]: p for p in listing.get("Parts", [])})
+            if not listing.get("IsTruncated"):
+                break
+            request["PartNumberMarker"] = listing["NextPartNumberMarker"]
+        print(f"⏯️ Resuming upload of '{basename}': {len(done)} parts already in S3")
+    else:
+        upload_id = client.create_multipart_upload(Bucket=bucket, Key=s3_key)["UploadId"]
+
+    # Upload missing parts
+    size = os.path.getsize(file_path)
+    parts = []
+
+    with open(file_path, "rb") as f:
+        for number, offset in enumerate(range(0, max(size, 1), part_size), start=1):
+
+            length = min(part_size, size - offset)
+            if number in done and done[number].get("Size") == length:
+                parts.append({"PartNumber": number, "ETag": done[number]["ETag"]})
+                continue
+
+            f.seek(offset)
+            response = client.upload_part(Bucket=bucket, Key=s3_key, UploadId=upload_id, PartNumber=number, Body=f.read(length))
+            parts.append({"PartNumber": number, "ETag": response["ETag"]})
+            stats["bytes_sent"] += length
+
+    client.complete_multipart_upload(Bucket=bucket, Key=s3_key, UploadId=upload_id, MultipartUpload={"Parts": parts})
+    print(f"✅ Uploaded '{basename}' in {len(parts)} parts as '{s3_key}'")
+
+    if index is not None:
+        index.record_upload(sha256, basename, size, bucket, s3_key)
+
+    return s3_key
+
+def upload_files(file_paths: list, client=None, bucket: str = None, max_workers: int = MAX_UPLOAD_WORKERS, index=None, resumable: bool = False) -> dict:
+
+    """
+    Uploads many files in a thread pool sharing one S3 client.
+
+    Args:
+        file_paths (list): Local paths of the files.
+        client: Optional. S3 client (e.g. LocalS3Client). Defaults to the module client.
+        bucket (str): Optional. Target bucket. Defaults to S3_BUCKET.
+        max_workers (int): Optional. Files uploaded in parallel.
+        index (ContentIndex): Optional. Content-hash index forwarded to both upload paths.
+        resumable (bool): Optional. Send files above MULTIPART_THRESHOLD with 'upload_file_resumable'.
+
+    Returns:
+        dict: {"keys": {path: s3_key}, "failures": {path: error}, "bytes": int (actually sent, skipped
+               files and parts already in S3 excluded), "seconds": float, "mb_per_s": float}
+    """
+
+    client = client if client is not None else s3_client()
+    bucket = bucket if bucket is not None else default_bucket()
+    sent = {}       # path -> upload stats
+
+    def upload_one(path: str) -> str:
+        stats = sent[path] = {}
+        if resumable and os.path.getsize(path) > MULTIPART_THRESHOLD:
+            return upload_file_resumable(path, client=client, bucket=bucket, index=index, stats=stats)
+        return upload_file(path, client=client, bucket=bucket, index=index, stats=stats)
+
+    keys, failures = {}, {}
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        futures = {path: pool.submit(upload_one, path) for path in file_paths}
+        for path, future in futures.items():
+            try:
+                keys[path] = future.result()
+            except Exception as e:
+                failures[path] = str(e)
+
+    seconds = time.perf_counter() - start
+    total_bytes = sum(sent[path].get("bytes_sent", 0) for path in keys)
+    mb_per_s = total_bytes / 1e6 / seconds if seconds > 0 else 0.0
+
+    print(f"📊 Uploaded {len(keys)}/{len(file_paths)} files ({total_bytes / 1e6:.1f} MB sent) in {seconds:.2f}s — {mb_per_s:.1f} MB/s")
+
+    return {"keys": keys, "failures": failures, "bytes": total_bytes, "seconds": seconds, "mb_per_s": mb_per_s}
@@ -0,0 +1,162 @@
+# Builtin Imports
+import os
+import re
+import time
+import uuid
+import threading
+
+# Local Imports
+from src.textract.slim_artifact import ARTIFACT_SUFFIXES, load_textract_document
+
+
+
+
+# Constants setting
+UPLOAD_PREFIX_PATTERN = re.compile(r"^\d{4}-\d{2}-\d{2}_\d{4}_[0-9a-f]{8}_")   # upload_file's '<date>_<uuid>_' key prefix
+
+
+
+
+# Main class
+class LocalTextractClient:
+
+    """
+    Offline stand-in for the boto3 Textract client (async document analysis API only).
+
+    Serves previously saved Textract outputs so jobs, polling and pagination can be exercised
+    without AWS. Documents are looked up by S3 object key.
+
+    Args:
+        documents (dict): S3 key -> Textract JSON/artifact path, or an already loaded result dict.
+        fixtures_dir (str): Optional. Directory of saved outputs used for keys missing from 'documents';
+                            a key matches '<anything><pdf name>.json' (or an artifact suffix), where the
+                            pdf name is the key's basename without the upload prefix.
+        polls_to_complete (int): Status calls answered with IN_PROGRESS before a job succeeds.
+        page_size (int): Blocks returned per get_document_analysis page.
+        latency (float): Seconds slept on every call, to mimic network round trips.
+        fail_keys (iterable): S3 keys whose jobs end in FAILED.
+        partial_keys (iterable): S3 keys whose jobs end in PARTIAL_SUCCESS (all blocks are still served).
+        completion_delay (float): Optional. Jobs complete this many seconds after starting
+                                  (replaces the poll-count rule).
+        notifier: Optional. LocalNotificationChannel that receives a completion message for jobs
+                  started with a NotificationChannel, like Textract's SNS notifications.
+    """
+
+    def __init__(self, documents: dict = None, fixtures_dir: str = None, polls_to_complete: int = 1, page_size: int = 1000, latency: float = 0.0, fail_keys=(), partial_keys=(), completion_delay: float = None, notifier=None):
+
+        self.documents = dict(documents or {})
+        self.fixtures_dir = fixtures_dir
+        self.polls_to_complete = polls_to_complete
+        self.page_size = page_size
+        self.latency = latency
+        self.fail_keys = set(fail_keys)
+        self.partial_keys = set(partial_keys)
+        self.completion_delay = 0.0 if notifier is not None and completion_delay is None else completion_delay
+        self.notifier = notifier
+
+        self.calls = {"start_document_analysis": 0, "get_document_analysis": 0}
+        self._jobs = {}     # JobId -> {"key", "polls", "started"}
+        self._loaded = {}   # S3 key -> result dict
+        self._lock = threading.Lock()
+
+    def start_document_analysis(self, DocumentLocation: dict, FeatureTypes: list = None, NotificationChannel: dict = None, **kwargs) -> dict:
+
+        self._tick("start_document_analysis")
+        key = DocumentLocation["S3Object"]["Name"]
+
+        if key not in self.documents:
+            fixture = self._find_fixture(key)
+            if fixture is None:
+                raise KeyError(f"Unknown S3 object: {key}")
+            self.documents[key] = fixture
+
+        job_id = uuid.uuid4().hex
+        with self._lock:
+            self._jobs[job_id] = {"key": key, "polls": 0, "started": time.monotonic()}
+
+        # Completion notification (SNS stand-in)
+        if self.notifier is not None and NotificationChannel:
+            status = self._status(key)
+            message = {"JobId": job_id, "Status": status, "API": "StartDocumentAnalysis", "DocumentLocation": {"S3ObjectName": key}}
+            timer = threading.Timer(self.completion_delay or 0.0, self.notifier.publish, args=(message,))
+            timer.daemon = True
+            timer.start()
+
+        return {"JobId": job_id}
+
+    def get_document_analysis(self, JobId: str, NextToken: str = None, MaxResults: int = None, **kwargs) -> dict:
+
+        self._tick("get_document_analysis")
+
+        with self._lock:
+            job = self._jobs[JobId]
+            if NextToken is None and not self._is_complete(job):
+                job["polls"] += 1
+                return {"JobStatus": "IN_PROGRESS"}
+
+        if job["key"] in self.fail_keys:
+            return {"JobStatus": "FAILED", "StatusMessage": "Simulated failure"}
+
+        result = self._load(job["key"])
+        blocks = result.get("Blocks", [])
+        size = MaxResults or self.page_size
+        start = int(NextToken or 0)
+        end = start + size
+
+        page = {
+            "JobStatus": self._status(job["key"]),
+            "DocumentMetadata": result.get("DocumentMetadata"),
+            "Blocks": blocks[start:end],
+        }
+        if end < len(blocks):
+            page["NextToken"] = str(end)
+
+        return page
+
+    def _status(self, key: str) -> str:
+
+        if key in self.fail_keys:
+            return "FAILED"
+        return "PARTIAL_SUCCESS" if key in self.partial_keys else "SUCCEEDED"
+
+    def _is_complete(self, job: dict) -> bool:
+
+        if self.completion_delay is not None:
+            return time.monotonic() - job["started"] >= self.completion_delay
+        return job["polls"] >= self.polls_to_complete
+
+    def _find_fixture(self, key: str) -> str:
+
+        """Finds the saved Textract output of an uploaded PDF in 'fixtures_dir'."""
+
+        if not self.fixtures_dir or not os.path.isdir(self.fixtures_dir):
+            return None
+
+        pdf_name = UPLOAD_PREFIX_PATTERN.sub("", key.rsplit("/", 1)[-1])
+        suffixes = tuple(pdf_name + suffix for suffix in (".json",) + ARTIFACT_SUFFIXES)
+
+        for name in sorted(os.listdir(self.fixtures_dir)):
+            if name.endswith(suffixes):
+                return os.path.join(self.fixtures_dir, name)
+
+        return None
+
+    def _tick(self, operation: str) -> None:
+
+        with self._lock:
+            self.calls[operation] += 1
+        if self.latency:
+            time.sleep(self.latency)
+
+    def _load(self, key: str) -> dict:
+
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+
+        source = self.documents[key]
+        result = source if isinstance(source, dict) else load_textract_document(source)
+
+        with self._lock:
+            self._loaded[key] = result
+        return result
@@ -1,75 +1,584 @@
 # Builtin Imports
 import json
+from collections import deque
+
+# Local Imports
+from src.textract.slim_artifact import is_compressed, is_textract_artifact, load_textract_document
+from src.textract.stitch_tables import TableStitcher, stitch_tables, table_meta
+
+
+
+# Constants setting
+PARSER_VERSION = "3"            # Bump whenever the reconstructed tables change (invalidates cached tables)
+STREAM_CHUNK_SIZE = 64 * 1024   # Characters read per chunk when streaming a Textract JSON file
+
+# Merged cells handling: text kept in the region's top-left cell ("anchor"), copied into every
+# spanned cell ("duplicate"), or spans ignored and each CELL keeps its own words ("ignore")
+MERGED_CELL_MODES = ("anchor", "duplicate", "ignore")
+DEFAULT_MERGED_CELLS = "anchor"
+
+# Merge table fragments that continue across pages into one logical table (see stitch_tables)
+DEFAULT_STITCH = True
+
+_JSON_DECODER = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+# --- Streaming Helpers ---
+class TableAssembler:
+
+    """
+    Incremental table builder fed one Textract block at a time.
+
+    Only the fields needed for table reconstruction are retained (WORD text, CELL and
+    MERGED_CELL positions and children, TABLE children), so the caller can discard every
+    block right after feeding it. Tables are returned in document order as soon as all
+    their cells (and the words inside them) have been seen; with stitching, the last
+    table of a page is returned once the next page shows it does not continue there.
+
+    Each pending table tracks the ids it still misses (cells, merged cells, words of its
+    cells), indexed by id: a block arriving only touches the tables waiting for it, and a
+    table is built once, when its last missing block lands. Feeding is linear in blocks.
+
+    Args:
+        merged_cells (str): Optional. Merged cells handling (see MERGED_CELL_MODES).
+        stitch (bool): Optional. Merge fragments of tables continuing across pages.
+    """
+
+    def __init__(self, merged_cells: str = DEFAULT_MERGED_CELLS, stitch: bool = DEFAULT_STITCH):
+
+        self.merged_cells = _check_merged_mode(merged_cells)
+        self._stitcher = TableStitcher() if stitch else None
+        self._words = {}                # WORD Id -> Text
+        self._page_word_ids = {}        # Page -> WORD Ids kept for that page
+        self._non_words = set()         # Ids of non-WORD cell children (e.g. SELECTION_ELEMENT)
+        self._cells = {}                # CELL / MERGED_CELL Id -> (row, col, row span, col span, child ids, left)
+        self._pending = deque()         # [table_id, page, cell_ids, merged_ids, (matrix, meta) or None, table block, missing ids] in document order
+        self._waiting = {}              # Missing block Id -> [(pending entry, "cell" | "merged" | "word")]
+        self._current_page = None
+
+    def feed(self, block: dict) -> list:
+
+        """
+        Consumes one block and returns the tables completed by it (possibly none).
+        """
+
+        block_type = block.get("BlockType")
+        page = block.get("Page", 1)
+        completed = []
+
+        # Page change: tables of earlier pages can no longer receive blocks
+        if page != self._current_page:
+            self._current_page = page
+            completed = self._drain()
+            self._release_pages(keep=page)
+
+        if block_type == "WORD":
+            self._words[block["Id"]] = block.get("Text", "")
+            self._page_word_ids.setdefault(page, []).append(block["Id"])
+            self._arrived(block["Id"])
+
+        elif block_type == "SELECTION_ELEMENT":
+            self._non_words.add(block["Id"])
+            self._arrived(block["Id"])
+
+        elif block_type == "CELL" or block_type == "MERGED_CELL":
+            self._cells[block["Id"]] = _cell_entry(block)
+            self._arrived(block["Id"])
+
+        elif block_type == "TABLE":
+            merged_ids = _child_ids(block, "MERGED_CELL") if self.merged_cells != "ignore" else []
+            table = {"Geometry": block.get("Geometry", {}), "Relationships": block.get("Relationships", [])} if self._stitcher else None
+            entry = [block["Id"], page, _child_ids(block), merged_ids, None, table, set()]
+            self._pending.append(entry)
+
+            for cell_id in entry[2]:
+                cell = self._cells.get(cell_id)
+                if cell is None:
+                    self._wait(entry, cell_id, "cell")
+                else:
+                    self._wait_words(entry, cell)
+            for merged_id in merged_ids:
+                if merged_id not in self._cells:
+                    self._wait(entry, merged_id, "merged")
+            if not entry[6]:
+                entry[4] = self._build(entry)
+
+        return completed + self._pop_completed()
+
+    def flush(self) -> list:
+
+        """
+        Resolves every pending table with whatever has been seen and returns them.
+        Missing word references are treated as non-text children.
+        """
+
+        for entry in self._pending:
+            if entry[4] is None:
+                entry[4] = self._build(entry, force=True)
+
+        tables = self._emit([entry[4] for entry in self._pending])
+        if self._stitcher is not None:
+            tables += self._stitcher.flush()
+
+        self._pending.clear()
+        self._waiting.clear()
+        self._words.clear()
+        self._page_word_ids.clear()
+        self._non_words.clear()
+        self._cells.clear()
+        return tables
+
+    def _drain(self) -> list:
+
+        """Page change: resolves the pending tables of earlier pages with what has been seen, then pops completed ones."""
+
+        for entry in self._pending:
+            if entry[4] is None and entry[1] != self._current_page:
+                for block_id in entry[6]:
+                    self._waiting[block_id] = [w for w in self._waiting.get(block_id, ()) if w[0] is not entry]
+                    if not self._waiting[block_id]:
+                        del self._waiting[block_id]
+                entry[4] = self._build(entry, force=True)
+
+        return self._pop_completed()
+
+    def _pop_completed(self) -> list:
+
+        """Pops the leading completed tables, keeping document order."""
+
+        completed = []
+        while self._pending and self._pending[0][4] is not None:
+            completed.append(self._pending.popleft()[4])
+        return self._emit(completed) if completed else []
+
+    def _wait(self, entry: list, block_id: str, kind: str) -> None:
+
+        entry[6].add(block_id)
+        self._waiting.setdefault(block_id, []).append((entry, kind))
+
+    def _wait_words(self, entry: list, cell: tuple) -> None:
+
+        """Registers the words of one of the table's cells that have not arrived yet."""
+
+        for word_id in cell[4]:
+            if word_id not in self._words and word_id not in self._non_words:
+                self._wait(entry, word_id, "word")
+
+    def _arrived(self, block_id: str) -> None:
+
+        """Updates the tables waiting for a block; those missing nothing else are built."""
+
+        waiting = self._waiting.pop(block_id, None)
+        if waiting is None:
+            return
+
+        for entry, kind in waiting:
+            if entry[4] is not None:
+                continue
+            entry[6].discard(block_id)
+            if kind == "cell":
+                self._wait_words(entry, self._cells[block_id])
+            if not entry[6]:
+                entry[4] = self._build(entry)
+
+    def _emit(self, fragments: list) -> list:
+
+        """Passes completed (matrix, meta) fragments through the stitcher, or returns their matrices."""
+
+        if self._stitcher is None:
+            return [matrix for matrix, _ in fragments]
+
+        tables = []
+        for matrix, meta in fragments:
+            tables.extend(self._stitcher.feed(matrix, meta))
+        return tables
+
+    def _build(self, entry: list, force: bool = False):
+
+        """Builds (matrix, meta) of a pending table, or returns None if some of its blocks have not arrived yet."""
+
+        _, page, cell_ids, merged_ids, _, table, _ = entry
+
+        cells = []
+        texts = []
+        for cell_id in cell_ids:
+            cell = self._cells.get(cell_id)
+            if cell is None:
+                if force:
+                    continue
+                return None
+            if not force and any(wid not in self._words and wid not in self._non_words for wid in cell[4]):
+                return None
+            cells.append(cell)
+            texts.append(" ".join(self._words[wid] for wid in cell[4] if wid in self._words))
+
+        merged = []
+        for merged_id in merged_ids:
+            region = self._cells.get(merged_id)
+            if region is None:
+                if force:
+                    continue
+                return None
+            merged.append(region)
+
+        matrix = _build_matrix(cells, texts, merged, self.merged_cells)
+        meta = _fragment_meta(page, table, cells) if table is not None else None
+
+        for cell_id in cell_ids + merged_ids:
+            self._cells.pop(cell_id, None)
+
+        return matrix, meta
+
+    def _release_pages(self, keep: int) -> None:
+
+        """Drops word texts of every page but 'keep' once no pending table can still reference them."""
+
+        if any(entry[4] is None and entry[1] != keep for entry in self._pending):
+            return
+
+        for page in [p for p in self._page_word_ids if p != keep]:
+            for wid in self._page_word_ids.pop(page):
+                self._words.pop(wid, None)
+        self._non_words.clear()
+
+
+def _child_ids(block: dict, rel_type: str = "CHILD") -> list:
+
+    """Returns the Ids of the block's relationships of the given type (CHILD by default)."""
+
+    ids = []
+    for rel in block.get("Relationships", []):
+        if rel["Type"] == rel_type:
+            ids.extend(rel["Ids"])
+    return ids
+
+def _cell_entry(block: dict) -> tuple:
+
+    """CELL / MERGED_CELL -> (row, col, row span, col span, child ids, left), with 0-based row/col."""
+
+    box = block.get("Geometry", {}).get("BoundingBox")
+    return (
+        block["RowIndex"] - 1, block["ColumnIndex"] - 1, block.get("RowSpan", 1), block.get("ColumnSpan", 1),
+        _child_ids(block), box["Left"] if box else None,
+    )
+
+def _fragment_meta(page: int, table: dict, cells: list) -> dict:
+
+    """Layout summary of a TABLE block and its cell entries, for the stitcher."""
+
+    rel_types = {rel["Type"] for rel in table.get("Relationships", [])}
+    return table_meta(page, table, [(cell[1], cell[3], cell[5]) for cell in cells], "TABLE_TITLE" in rel_types, "TABLE_FOOTER" in rel_types)
+
+def _check_merged_mode(merged_cells: str) -> str:
+
+    if merged_cells not in MERGED_CELL_MODES:
+        raise ValueError(f"merged_cells must be one of {MERGED_CELL_MODES}, got {merged_cells!r}")
+    return merged_cells
+
+def _build_matrix(cells: list, texts: list, merged: list, merged_cells: str) -> list:
+
+    """
+    Allocates a table matrix once and fills it, propagating merged regions.
+
+    Args:
+        cells (list): Cell entries of the table's CELL blocks (see '_cell_entry').
+        texts (list): Text of each CELL, in the same order.
+        merged (list): Cell entries of the table's MERGED_CELL blocks.
+        merged_cells (str): Merged cells handling (see MERGED_CELL_MODES).
+
+    Returns:
+        list: Table as a list of rows (lists of cell values).
+    """
+
+    if not cells:
+        return []
+
+    # Size while scanning (spans extend the matrix unless they are ignored)
+    spanned = merged_cells != "ignore"
+    n_rows = n_cols = 0
+    for row, col, row_span, col_span, _, _ in cells:
+        if not spanned:
+            row_span = col_span = 1
+        if row + row_span > n_rows:
+            n_rows = row + row_span
+        if col + col_span > n_cols:
+            n_cols = col + col_span
+
+    matrix = [[""] * n_cols for _ in range(n_rows)]
+
+    for (row, col, _, _, _, _), text in zip(cells, texts):
+        matrix[row][col] = text
+
+    if not spanned:
+        return matrix
+
+    # Span map: region anchor (row, col) -> (row span, col span); MERGED_CELL regions win over CELL spans
+    spans = {(row, col): (row_span, col_span) for row, col, row_span, col_span, _, _ in cells if row_span > 1 or col_span > 1}
+    spans.update({(row, col): (row_span, col_span) for row, col, row_span, col_span, _, _ in merged})
+
+    # Region text: words of the spanned cells in reading order (read before any region is filled)
+    regions = []
+    for (row, col), (row_span, col_span) in spans.items():
+        col_span = min(col_span, n_cols - col)
+        rows = range(row, min(row + row_span, n_rows))
+        regions.append((rows, col, col_span, " ".join(v for r in rows for v in matrix[r][col:col + col_span] if v)))
+
+    # One slice assignment per spanned row
+    for rows, col, col_span, text in regions:
+        fill = [text] * col_span if merged_cells == "duplicate" else [text] + [""] * (col_span - 1)
+        for r in rows:
+            matrix[r][col:col + col_span] = fill
+            if merged_cells == "anchor":
+                fill = [""] * col_span
+
+    return matrix
+
+
+def iter_textract_blocks(json_file_path: str, chunk_size: int = STREAM_CHUNK_SIZE):
+
+    """
+    Yields the entries of the top-level "Blocks" array of a Textract JSON file one at a time,
+    reading the file in chunks so the whole document is never held in memory.
+
+    Args:
+        json_file_path (str): Path to the Textract JSON output.
+        chunk_size (int): Characters read per chunk.
+
+    Yields:
+        dict: One Textract block.
+    """
+
+    with open(json_file_path, "r", encoding="utf-8") as f:
+
+        buffer = ""
+        pos = 0
+        eof = False
+
+        def fill():
+            nonlocal buffer, pos, eof
+            chunk = f.read(chunk_size)
+            if not chunk:
+                eof = True
+            buffer = buffer[pos:] + chunk
+            pos = 0
+
+        def skip(chars: str = _WHITESPACE) -> str:
+            """Skips the given characters and returns the next significant one ('' at EOF)."""
+            nonlocal pos
+            while True:
+                while pos < len(buffer) and buffer[pos] in chars:
+                    pos += 1
+                if pos < len(buffer):
+                    return buffer[pos]
+                if eof:
+                    return ""
+                fill()
+
+        def decode():
+            """Decodes the next JSON value, reading more of the file until it is complete."""
+            nonlocal pos
+            while True:
+                try:
+                    value, end = _JSON_DECODER.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                    fill()
+                    continue
+                # A bare number may be cut at the chunk boundary
+                if end == len(buffer) and not eof:
+                    fill()
+                    continue
+                pos = end
+                return value
+
+        if skip() != "{":
+            raise ValueError(f"Not a Textract JSON object: {json_file_path}")
+        pos += 1
+
+        # Top-level keys traversal
+        while skip(_WHITESPACE + ",") not in ("}", ""):
+
+            key = decode()
+            if skip() != ":":
+                raise ValueError(f"Malformed Textract JSON: {json_file_path}")
+            pos += 1
+
+            if key != "Blocks":
+                skip()
+                decode()
+                continue
+
+            if skip() != "[":
+                raise ValueError(f"'Blocks' is not an array: {json_file_path}")
+            pos += 1
+
+            while skip(_WHITESPACE + ",") not in ("]", ""):
+                yield decode()
+            pos += 1
+
+
+def iter_textract_file(json_file_path: str, chunk_size: int = STREAM_CHUNK_SIZE, merged_cells: str = DEFAULT_MERGED_CELLS,
+                       stitch: bool = DEFAULT_STITCH):
+
+    """
+    Streams a Textract JSON file and yields its tables as soon as their cells are resolved.
+
+    Peak memory is bounded by the blocks of the page being read plus the pending tables,
+    not by the size of the file.
+
+    Args:
+        json_file_path (str): Path to the Textract JSON output.
+        chunk_size (int): Characters read per chunk.
+        merged_cells (str): Optional. Merged cells handling (see MERGED_CELL_MODES).
+        stitch (bool): Optional. Merge fragments of tables continuing across pages.
+
+    Yields:
+        list: One table as a list of rows (lists of cell values), in document order.
+    """
+
+    assembler = TableAssembler(merged_cells=merged_cells, stitch=stitch)
+
+    for block in iter_textract_blocks(json_file_path, chunk_size=chunk_size):
+        yield from assembler.feed(block)
+
+    yield from assembler.flush()
+
+def iter_textract_pages(pages, merged_cells: str = DEFAULT_MERGED_CELLS, stitch: bool = DEFAULT_STITCH):
+
+    """
+    Yields tables from an iterable of Textract result pages (get_document_analysis responses)
+    while the pages are still arriving. Tables spanning page boundaries are resolved once
+    their remaining blocks show up in a later page.
+
+    Args:
+        pages (iterable): Response pages, each with a "Blocks" list.
+        merged_cells (str): Optional. Merged cells handling (see MERGED_CELL_MODES).
+        stitch (bool): Optional. Merge fragments of tables continuing across pages.
+
+    Yields:
+        list: One table as a list of rows (lists of cell values), in document order.
+    """
+
+    assembler = TableAssembler(merged_cells=merged_cells, stitch=stitch)
+
+    for page in pages:
+        for block in page.get("Blocks", []):
+            yield from assembler.feed(block)
+
+    yield from assembler.flush()
 
 
 
 
 # Main function
-def parse_textract_tables(textract_json: dict) -> list:
+def parse_textract_tables(textract_json: dict, merged_cells: str = DEFAULT_MERGED_CELLS, stitch: bool = DEFAULT_STITCH) -> list:
 
     """
     Parses Textract JSON output and extracts tables as 2D lists.
+
+    Reconstruction is a single pass over the blocks that indexes WORD texts, CELL / MERGED_CELL
+    positions (as 0-based integer row/column) and TABLE children; each matrix is then sized
+    while its cells are collected and allocated once. Merged regions (MERGED_CELL blocks and
+    CELLs with RowSpan/ColumnSpan) are propagated through a span map. Fragments of a table that
+    continues on the next page are then stitched into one logical table.
     
     Args:
         textract_json (dict): Raw Textract response JSON.
+        merged_cells (str): Optional. "anchor" keeps a merged region's text in its top-left cell,
+                            "duplicate" copies it into every spanned cell, "ignore" leaves each
+                            CELL with its own words.
+        stitch (bool): Optional. Merge fragments of tables continuing across pages (page position,
+                       column geometry, TABLE_TITLE/TABLE_FOOTER, repeated header).
 
     Returns:
         list: A list of tables, each table is a list of rows (lists of cell values)
     """
 
-    # JSON blocks parsing
-    blocks = textract_json.get("Blocks", [])
-    block_map = {b["Id"]: b for b in blocks}
-    
-    # Lists holder
-    tables = []
-    
+    _check_merged_mode(merged_cells)
+
+    # Lookup holders
+    words = {}          # WORD Id -> Text
+    cells = {}          # CELL / MERGED_CELL Id -> (row, col, row span, col span, child ids, left)
+    table_cells = []    # (CELL ids, MERGED_CELL ids, TABLE block) of every TABLE, in document order
+
 
-    # JSON Traversal to get all TABLE types
-    for block in blocks:
-
-        if block["BlockType"] == "TABLE":
-            
-            # Collect all CELL blocks related to this TABLE
-            cell_ids = []
-
-            for rel in block.get("Relationships", []):
-                if rel["Type"] == "CHILD":
-                    cell_ids.extend(rel["Ids"])
-            
-            cells = [block_map[cell_id] for cell_id in cell_ids if block_map[cell_id]["BlockType"] == "CELL"]
-            
-            # Build row/col matrix
-            max_row = max(cell["RowIndex"] for cell in cells)
-            max_col = max(cell["ColumnIndex"] for cell in cells)
-            
-
-            # Table reconstruction
-            matrix = [["" for _ in range(max_col)] for _ in range(max_row)]
-            
-            for cell in cells:
-
-                text = ""
-
-                # Extract text from CHILD relationships (WORDS)
-                for rel in cell.get("Relationships", []):
-                    if rel["Type"] == "CHILD":
-                        text = " ".join(block_map[wid]["Text"] for wid in rel["Ids"] if block_map[wid]["BlockType"] == "WORD")
-                
-                # Cell text population
-                matrix[cell["RowIndex"] - 1][cell["ColumnIndex"] - 1] = text
-            
-            tables.append(matrix)
+    # Single JSON traversal
+    for block in textract_json.get("Blocks", []):
+
+        block_type = block["BlockType"]
+
+        if block_type == "WORD":
+            words[block["Id"]] = block.get("Text", "")
+
+        elif block_type == "CELL" or block_type == "MERGED_CELL":
+            # Inline fast path for the usual single CHILD relationship; column geometry only matters for stitching
+            rels = block.get("Relationships")
+            child_ids = rels[0]["Ids"] if rels and len(rels) == 1 and rels[0]["Type"] == "CHILD" else _child_ids(block)
+            cells[block["Id"]] = (
+                block["RowIndex"] - 1, block["ColumnIndex"] - 1, block.get("RowSpan", 1), block.get("ColumnSpan", 1),
+                child_ids, block["Geometry"]["BoundingBox"]["Left"] if stitch and "Geometry" in block else None,
+            )
+
+        elif block_type == "TABLE":
+            merged_ids = _child_ids(block, "MERGED_CELL") if merged_cells != "ignore" else []
+            table_cells.append((_child_ids(block), merged_ids, block))
+
+
+    # Table reconstruction
+    fragments = []
+    word_text, word_at = words.get, words.__getitem__
+
+    for child_ids, merged_ids, block in table_cells:
+
+        # Resolve CELL texts: one C-level join when every child is a WORD, else non-WORD
+        # children (such as SELECTION_ELEMENT) are skipped
+        table = [cell for cell in map(cells.get, child_ids) if cell is not None]
+        texts = []
+        for cell in table:
+            try:
+                texts.append(" ".join(map(word_at, cell[4])))
+            except KeyError:
+                texts.append(" ".join([t for t in map(word_text, cell[4]) if t is not None]))
+
+        merged = [cells[merged_id] for merged_id in merged_ids if merged_id in cells]
+
+        matrix = _build_matrix(table, texts, merged, merged_cells)
+        fragments.append((matrix, _fragment_meta(block.get("Page", 1), block, table) if stitch else None))
+
+    # Cross-page stitching
+    if stitch:
+        return stitch_tables(fragments)
     
-    return tables
+    return [matrix for matrix, _ in fragments]
 
 
 # Function Caller
-def parse_textract_file(json_file_path: str) -> list:
+def parse_textract_file(json_file_path: str, stream: bool = False, merged_cells: str = DEFAULT_MERGED_CELLS, stitch: bool = DEFAULT_STITCH) -> list:
+
+    """
+    Load a Textract JSON file and parse its tables.
+
+    Args:
+        json_file_path (str): Path to the Textract JSON output.
+        stream (bool): Optional. Read the file incrementally instead of loading it whole.
+                       Ignored for compact artifacts and compressed dumps, which are loaded at once.
+        merged_cells (str): Optional. Merged cells handling (see 'parse_textract_tables').
+        stitch (bool): Optional. Merge fragments of tables continuing across pages.
+
+    Returns:
+        list: A list of tables, each table is a list of rows (lists of cell values)
+    """
+
+    # Compact artifacts and compressed dumps (detected by content, see src/textract/slim_artifact.py)
+    if is_compressed(json_file_path) or is_textract_artifact(json_file_path):
+        return parse_textract_tables(load_textract_document(json_file_path), merged_cells=merged_cells, stitch=stitch)
 
-    """Load a Textract JSON file and parse its tables."""
+    if stream:
+        return list(iter_textract_file(json_file_path, merged_cells=merged_cells, stitch=stitch))
 
     with open(json_file_path, "r", encoding="utf-8") as f:
         textract_json = json.load(f)
         
-    return parse_textract_tables(textract_json)
\ No newline at end of file
+    return parse_textract_tables(textract_json, merged_cells=merged_cells, stitch=stitch)
\ No newline at end of file
@@ -0,0 +1,205 @@
+# Builtin Imports
+import time
+import random
+import asyncio
+import threading
+from dataclasses import dataclass, field
+
+
+
+
+# Constants setting
+INITIAL_DELAY = 1.0         # Seconds before the first status poll
+BACKOFF_FACTOR = 1.6
+JITTER = 0.2                # +/- fraction applied to every delay
+BASE_CEILING = 5.0          # Maximum delay for a one-page document
+CEILING_PER_PAGE = 1.0      # Extra ceiling seconds per page (longer bills take longer)
+MAX_CEILING = 30.0
+NOTIFICATION_SLICE = 0.25   # Longest blocking channel wait of 'await_notification' (bounds cancellation latency)
+
+# Finished jobs whose result pages can be fetched: PARTIAL_SUCCESS jobs (some pages could not be
+# analyzed) still return the blocks of the pages that were, so they are handled like SUCCEEDED
+SUCCESS_STATUSES = ("SUCCEEDED", "PARTIAL_SUCCESS")
+
+
+# --- Metrics ---
+@dataclass
+class JobMetrics:
+
+    """Per-job polling metrics, used to tune the poller."""
+
+    job_id: str
+    mode: str = "poll"                                  # 'poll' or 'notification'
+    started_at: float = field(default_factory=time.monotonic)
+    completed_at: float = None
+    polls: int = 0
+    status: str = "IN_PROGRESS"
+
+    @property
+    def time_to_complete(self) -> float:
+        end = self.completed_at if self.completed_at is not None else time.monotonic()
+        return end - self.started_at
+
+    def as_dict(self) -> dict:
+        return {
+            "job_id": self.job_id,
+            "mode": self.mode,
+            "status": self.status,
+            "polls": self.polls,
+            "time_to_complete": round(self.time_to_complete, 3),
+        }
+
+
+# --- Pollers ---
+class AdaptivePoller:
+
+    """
+    Exponential backoff with jitter for Textract status polling.
+
+    Starts polling fast (short bills usually finish in a few seconds) and backs off up to a
+    ceiling that grows with the page count, so long documents do not burn API calls.
+
+    Args:
+        page_count (int): Optional. Pages in the document, used to size the ceiling.
+        initial (float): First delay in seconds.
+        factor (float): Multiplier applied after every poll.
+        jitter (float): Random +/- fraction applied to each delay.
+        ceiling (float): Optional. Explicit maximum delay (overrides the page-based one).
+    """
+
+    def __init__(self, page_count: int = None, initial: float = INITIAL_DELAY, factor: float = BACKOFF_FACTOR, jitter: float = JITTER, ceiling: float = None):
+
+        if ceiling is None:
+            ceiling = min(MAX_CEILING, BASE_CEILING + CEILING_PER_PAGE * max(0, (page_count or 1) - 1))
+
+        self.initial = initial
+        self.factor = factor
+        self.jitter = jitter
+        self.ceiling = max(ceiling, initial)
+        self.history = []       # JobMetrics of every job waited on
+
+    @classmethod
+    def fixed(cls, interval: float) -> "AdaptivePoller":
+
+        """A poller with a constant interval (the legacy 'poll_interval' behavior)."""
+
+        return cls(initial=interval, factor=1.0, jitter=0.0, ceiling=interval)
+
+    def delays(self):
+
+        """Infinite generator of jittered backoff delays."""
+
+        delay = self.initial
+        while True:
+            spread = delay * self.jitter
+            yield max(0.0, delay + random.uniform(-spread, spread))
+            delay = min(self.ceiling, delay * self.factor)
+
+    def wait_for_job(self, client, job_id: str, sleep=time.sleep) -> tuple:
+
+        """
+        Polls get_document_analysis until the job leaves IN_PROGRESS.
+
+        Returns:
+            tuple: (last status response, JobMetrics). The response of a succeeded job is
+                   the first page of results.
+        """
+
+        metrics = JobMetrics(job_id=job_id)
+        self.history.append(metrics)
+
+        for delay in self.delays():
+
+            response = client.get_document_analysis(JobId=job_id)
+            metrics.polls += 1
+            metrics.status = response["JobStatus"]
+
+            if metrics.status != "IN_PROGRESS":
+                metrics.completed_at = time.monotonic()
+                return response, metrics
+
+            sleep(delay)
+
+
+# --- Completion Notifications ---
+class LocalNotificationChannel:
+
+    """
+    Local stand-in for Textract's SNS completion notifications (SNS topic -> SQS queue).
+
+    Textract publishes {"JobId", "Status", ...} when a job finishes; waiters block on the
+    JobId instead of polling. A real SQS-backed channel only needs 'publish' semantics on the
+    receive side and the same 'wait' method.
+    """
+
+    def __init__(self):
+
+        self._messages = {}     # JobId -> message
+        self._condition = threading.Condition()
+
+    def publish(self, message: dict) -> None:
+
+        with self._condition:
+            self._messages[message["JobId"]] = message
+            self._condition.notify_all()
+
+    def wait(self, job_id: str, timeout: float = None) -> dict:
+
+        """Blocks until the completion message of 'job_id' arrives. Returns None on timeout."""
+
+        with self._condition:
+            self._condition.wait_for(lambda: job_id in self._messages, timeout=timeout)
+            return self._messages.pop(job_id, None)
+
+    def channel_config(self) -> dict:
+
+        """NotificationChannel argument for start_document_analysis."""
+
+        return {"SNSTopicArn": "local:textract-completions", "RoleArn": "local:textract-publisher"}
+
+
+def wait_for_notification(channel, job_id: str, timeout: float = None) -> tuple:
+
+    """
+    Waits for a job completion message instead of polling.
+
+    Returns:
+        tuple: (message, JobMetrics). Raises TimeoutError if no message arrives in time.
+    """
+
+    metrics = JobMetrics(job_id=job_id, mode="notification")
+    message = channel.wait(job_id, timeout=timeout)
+
+    if message is None:
+        raise TimeoutError(f"No completion notification for Textract job {job_id}")
+
+    metrics.status = message["Status"]
+    metrics.completed_at = time.monotonic()
+    return message, metrics
+
+async def await_notification(channel, job_id: str, timeout: float = None, slice_seconds: float = NOTIFICATION_SLICE) -> tuple:
+
+    """
+    Async 'wait_for_notification'. The channel is waited on in short blocking slices in a worker
+    thread, looping in the event loop between them: cancelling the caller frees the thread within
+    one slice, so an abandoned job never pins an executor worker (nor hangs 'asyncio.run' shutdown),
+    even with timeout=None.
+
+    Returns:
+        tuple: (message, JobMetrics). Raises TimeoutError if no message arrives in time.
+    """
+
+    metrics = JobMetrics(job_id=job_id, mode="notification")
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    while True:
+        wait = slice_seconds if deadline is None else max(0.0, min(slice_seconds, deadline - time.monotonic()))
+        message = await asyncio.to_thread(channel.wait, job_id, wait)
+        if message is not None:
+            break
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"No completion notification for Textract job {job_id}")
+
+    metrics.status = message["Status"]
+    metrics.completed_at = time.monotonic()
+    return message, metrics
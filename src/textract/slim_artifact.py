@@ -0,0 +1,258 @@
+# Builtin Imports
+import os
+import re
+import json
+import gzip
+
+
+
+
+# Constants setting
+ARTIFACT_FORMAT = "pba-textract"
+ARTIFACT_VERSION = 1
+ARTIFACT_SUFFIXES = (".slim.json", ".slim.json.gz", ".slim.json.zst")
+
+BBOX_SCALE = 10000      # Bounding boxes are quantized to 1e-4 of the page in slim mode
+
+_GZIP_MAGIC = b"\x1f\x8b"
+_ZSTD_MAGIC = b"\x28\xb5\x2f\xfd"
+
+# Every artifact starts with its format marker (the first key 'save_textract_artifact' writes)
+_HEAD_SIZE = 64
+_MARKER = re.compile(rb'^\s*\{\s*"format"\s*:\s*"' + ARTIFACT_FORMAT.encode("utf-8") + rb'"')
+
+
+# --- Auxiliar Functions ---
+def _zstd():
+
+    """Imports the optional 'zstandard' package only when zstd compression is requested."""
+
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd compression requires the 'zstandard' package (pip install zstandard)") from e
+    return zstandard
+
+def _compress(data: bytes, compression: str) -> bytes:
+
+    if compression is None:
+        return data
+    if compression == "gzip":
+        return gzip.compress(data, compresslevel=6, mtime=0)
+    if compression == "zstd":
+        return _zstd().ZstdCompressor(level=10).compress(data)
+    raise ValueError(f"Unknown compression '{compression}' (expected None, 'gzip' or 'zstd')")
+
+def _decompress(data: bytes) -> bytes:
+
+    if data.startswith(_GZIP_MAGIC):
+        return gzip.decompress(data)
+    if data.startswith(_ZSTD_MAGIC):
+        return _zstd().ZstdDecompressor().decompress(data)
+    return data
+
+def _read_head(path: str, size: int = _HEAD_SIZE) -> bytes:
+
+    """First bytes of a file's content, decompressed (gzip / zstd detected by their magic number)."""
+
+    with open(path, "rb") as f:
+        magic = f.read(len(_ZSTD_MAGIC))
+        f.seek(0)
+        if magic.startswith(_GZIP_MAGIC):
+            with gzip.GzipFile(fileobj=f) as g:
+                return g.read(size)
+        if magic.startswith(_ZSTD_MAGIC):
+            return _zstd().ZstdDecompressor().stream_reader(f).read(size)
+        return f.read(size)
+
+def _quantize_bbox(block: dict) -> list:
+
+    bbox = block.get("Geometry", {}).get("BoundingBox")
+    if not bbox:
+        return None
+    return [round(bbox[k] * BBOX_SCALE) for k in ("Width", "Height", "Left", "Top")]
+
+def _slim_document(result: dict) -> dict:
+
+    """
+    Columnar, geometry-quantized encoding of a Textract result.
+    Block Ids are interned to their position in the 'Blocks' list and relationships become int arrays.
+    """
+
+    blocks = result.get("Blocks", [])
+    id_index = {b["Id"]: i for i, b in enumerate(blocks)}
+
+    block_types = {}
+    rel_types = {}
+    columns = {"type": [], "page": [], "text": [], "cell": [], "entity_types": [], "bbox": [], "relationships": []}
+
+    for block in blocks:
+
+        columns["type"].append(block_types.setdefault(block["BlockType"], len(block_types)))
+        columns["page"].append(block.get("Page", 1))
+        columns["text"].append(block.get("Text"))
+        columns["entity_types"].append(block.get("EntityTypes"))
+        columns["bbox"].append(_quantize_bbox(block))
+
+        if "RowIndex" in block:
+            columns["cell"].append([block["RowIndex"], block["ColumnIndex"], block.get("RowSpan", 1), block.get("ColumnSpan", 1)])
+        else:
+            columns["cell"].append(None)
+
+        relationships = [
+            [rel_types.setdefault(rel["Type"], len(rel_types)), [id_index[i] for i in rel.get("Ids", []) if i in id_index]]
+            for rel in block.get("Relationships", [])
+        ]
+        columns["relationships"].append(relationships or None)
+
+    return {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "mode": "slim",
+        "DocumentMetadata": result.get("DocumentMetadata"),
+        "JobStatus": result.get("JobStatus"),
+        "block_types": list(block_types),
+        "relationship_types": list(rel_types),
+        "blocks": columns,
+    }
+
+def _expand_document(artifact: dict) -> dict:
+
+    """Rebuilds a Textract-shaped result (Ids as strings of their index) from a slim artifact."""
+
+    block_types = artifact["block_types"]
+    rel_types = artifact["relationship_types"]
+    columns = artifact["blocks"]
+
+    blocks = []
+    for i, type_idx in enumerate(columns["type"]):
+
+        block = {"BlockType": block_types[type_idx], "Id": str(i), "Page": columns["page"][i]}
+
+        if columns["text"][i] is not None:
+            block["Text"] = columns["text"][i]
+
+        if columns["cell"][i] is not None:
+            block["RowIndex"], block["ColumnIndex"], block["RowSpan"], block["ColumnSpan"] = columns["cell"][i]
+
+        if columns["entity_types"][i] is not None:
+            block["EntityTypes"] = columns["entity_types"][i]
+
+        if columns["bbox"][i] is not None:
+            width, height, left, top = (v / BBOX_SCALE for v in columns["bbox"][i])
+            block["Geometry"] = {"BoundingBox": {"Width": width, "Height": height, "Left": left, "Top": top}}
+
+        if columns["relationships"][i] is not None:
+            block["Relationships"] = [
+                {"Type": rel_types[rel_type], "Ids": [str(j) for j in ids]}
+                for rel_type, ids in columns["relationships"][i]
+            ]
+
+        blocks.append(block)
+
+    return {
+        "Blocks": blocks,
+        "DocumentMetadata": artifact.get("DocumentMetadata"),
+        "JobStatus": artifact.get("JobStatus"),
+    }
+
+
+# --- Main Functions ---
+def save_textract_artifact(result: dict, path: str, mode: str = "slim", compression: str = "gzip") -> str:
+
+    """
+    Persists a Textract result in the compact artifact format.
+
+    Args:
+        result (dict): Textract result as returned by 'run_textract_analysis'.
+        path (str): Destination path (conventionally ending in one of ARTIFACT_SUFFIXES).
+        mode (str): 'slim' (geometry quantized, polygons/confidences dropped, integer Ids)
+                    or 'lossless' (the original result, byte-for-byte equivalent once loaded).
+        compression (str): None, 'gzip' or 'zstd' (requires the optional 'zstandard' package).
+
+    Returns:
+        str: The path written.
+    """
+
+    if mode == "slim":
+        artifact = _slim_document(result)
+    elif mode == "lossless":
+        artifact = {"format": ARTIFACT_FORMAT, "version": ARTIFACT_VERSION, "mode": "lossless", "document": result}
+    else:
+        raise ValueError(f"Unknown artifact mode '{mode}' (expected 'slim' or 'lossless')")
+
+    data = json.dumps(artifact, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+    if os.path.dirname(path):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "wb") as f:
+        f.write(_compress(data, compression))
+
+    return path
+
+def load_textract_artifact(path: str) -> dict:
+
+    """
+    Loads a compact artifact (any mode/compression) back into a Textract-shaped result
+    that 'parse_textract_tables' can consume.
+    """
+
+    with open(path, "rb") as f:
+        artifact = json.loads(_decompress(f.read()).decode("utf-8"))
+
+    return _from_artifact(artifact, path)
+
+def _from_artifact(artifact: dict, path: str) -> dict:
+
+    if artifact.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"Not a {ARTIFACT_FORMAT} artifact: {path}")
+    if artifact.get("version") != ARTIFACT_VERSION:
+        raise ValueError(f"Unsupported artifact version {artifact.get('version')}: {path}")
+
+    if artifact["mode"] == "lossless":
+        return artifact["document"]
+
+    return _expand_document(artifact)
+
+def is_textract_artifact(path: str) -> bool:
+
+    """
+    True if the file is a compact artifact, whatever its name: the format marker is checked on the
+    (decompressed) first bytes of its content. ARTIFACT_SUFFIXES are only a naming convention.
+    """
+
+    try:
+        head = _read_head(path)
+    except (OSError, EOFError):
+        return False
+    return _MARKER.match(head) is not None
+
+def is_compressed(path: str) -> bool:
+
+    """True if the file is gzip or zstd compressed (by magic number, whatever its name)."""
+
+    with open(path, "rb") as f:
+        magic = f.read(len(_ZSTD_MAGIC))
+    return magic.startswith(_GZIP_MAGIC) or magic.startswith(_ZSTD_MAGIC)
+
+def load_textract_document(path: str) -> dict:
+
+    """
+    Loads any saved Textract output into a Textract-shaped result: a raw JSON dump, the same dump
+    gzip / zstd compressed (whatever the file name), or a compact artifact.
+    """
+
+    with open(path, "rb") as f:
+        document = json.loads(_decompress(f.read()).decode("utf-8"))
+
+    if isinstance(document, dict) and document.get("format") == ARTIFACT_FORMAT:
+        return _from_artifact(document, path)
+    return document
+
+def convert_textract_json(json_file_path: str, out_path: str, mode: str = "slim", compression: str = "gzip") -> str:
+
+    """Converts an existing full Textract JSON dump (plain or compressed) into the compact artifact format."""
+
+    result = load_textract_document(json_file_path)
+
+    return save_textract_artifact(result, out_path, mode=mode, compression=compression)
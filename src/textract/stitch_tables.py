@@ -0,0 +1,151 @@
+# Builtin Imports
+import re
+
+
+
+
+# Constants setting
+BOTTOM_MARGIN = 0.80        # A table continues on the next page only if it ends below this height (page fraction)
+TOP_MARGIN = 0.20           # ...and the continuation starts above this height
+COLUMN_TOLERANCE = 0.02     # Max horizontal offset between matching column edges (page fraction)
+HEADER_SIMILARITY = 0.8     # Fraction of equal header cells for a first row to count as a repeated header
+
+_SPACES = re.compile(r"\s+")
+
+
+# --- Auxiliar Functions ---
+def table_meta(page: int, block: dict, cells: list, has_title: bool, has_footer: bool) -> dict:
+
+    """
+    Layout summary of a TABLE used to decide whether it continues a table from the previous page.
+
+    Args:
+        page (int): Page of the table.
+        block (dict): TABLE block (only its Geometry is read).
+        cells (list): (col, col span, left) of the table's CELLs, 0-based col.
+        has_title (bool): The table has a TABLE_TITLE (it starts a new table).
+        has_footer (bool): The table has a TABLE_FOOTER (it ends here).
+
+    Returns:
+        dict: {"page", "top", "bottom", "columns", "title", "footer"}; geometry values are None when missing.
+    """
+
+    box = block.get("Geometry", {}).get("BoundingBox")
+
+    # Left edge of every column, from its single-column cells
+    columns = {}
+    for col, col_span, left in cells:
+        if col_span == 1 and left is not None and (col not in columns or left < columns[col]):
+            columns[col] = left
+
+    return {
+        "page": page,
+        "top": box["Top"] if box else None,
+        "bottom": box["Top"] + box["Height"] if box else None,
+        "columns": [columns.get(col) for col in range(max(columns) + 1)] if columns else [],
+        "title": has_title,
+        "footer": has_footer,
+    }
+
+def header_similarity(row: list, header: list) -> float:
+
+    """Fraction of positions where both rows hold the same (whitespace/case-normalized) non-empty text."""
+
+    if not header or len(row) != len(header):
+        return 0.0
+
+    def norm(value: str) -> str:
+        return _SPACES.sub(" ", value).strip().lower()
+
+    filled = [(norm(a), norm(b)) for a, b in zip(row, header) if a or b]
+    if not filled:
+        return 0.0
+    return sum(a == b for a, b in filled) / len(filled)
+
+def continues(previous: dict, fragment: dict, first_on_page: bool) -> bool:
+
+    """
+    True if 'fragment' is the continuation of the table ending with 'previous':
+    next page, first table there, no footer before / title after, page-edge positions and same columns.
+    """
+
+    if not first_on_page or fragment["page"] != previous["page"] + 1:
+        return False
+
+    if previous["footer"] or fragment["title"]:
+        return False
+
+    if None in (previous["bottom"], fragment["top"]):
+        return False
+
+    if previous["bottom"] < BOTTOM_MARGIN or fragment["top"] > TOP_MARGIN:
+        return False
+
+    a, b = previous["columns"], fragment["columns"]
+    if not a or len(a) != len(b):
+        return False
+
+    return all(x is not None and y is not None and abs(x - y) <= COLUMN_TOLERANCE for x, y in zip(a, b))
+
+
+# Main class
+class TableStitcher:
+
+    """
+    Merges table fragments that continue across pages into one logical table, in a single pass.
+
+    Fragments are fed in document order. The last table of a page is held back until the first
+    table of the next page shows whether it continues it. A continuation's first row is dropped
+    when it repeats the header; headerless continuations keep all their rows.
+    """
+
+    def __init__(self):
+
+        self._open = None           # [matrix, meta of its last fragment] of the table that may still continue
+        self._last_page = None
+
+    def feed(self, matrix: list, meta: dict) -> list:
+
+        """Consumes one fragment and returns the logical tables that can no longer grow."""
+
+        first_on_page = meta["page"] != self._last_page
+        self._last_page = meta["page"]
+
+        if self._open is not None and matrix and self._open[0] and continues(self._open[1], meta, first_on_page):
+
+            header = self._open[0][0]
+            rows = matrix[1:] if header_similarity(matrix[0], header) >= HEADER_SIMILARITY else matrix
+            self._open[0].extend(rows)
+            self._open[1] = meta
+            return []
+
+        completed = self.flush()
+        self._open = [matrix, meta]
+        return completed
+
+    def flush(self) -> list:
+
+        """Returns the table still held back (if any)."""
+
+        completed = [self._open[0]] if self._open is not None else []
+        self._open = None
+        return completed
+
+
+def stitch_tables(fragments: list) -> list:
+
+    """
+    Stitches (matrix, meta) fragments into logical tables (see TableStitcher).
+
+    Args:
+        fragments (list): (matrix, meta) pairs in document order.
+
+    Returns:
+        list: Logical tables, each a list of rows (lists of cell values).
+    """
+
+    stitcher = TableStitcher()
+    tables = []
+    for matrix, meta in fragments:
+        tables.extend(stitcher.feed(matrix, meta))
+    return tables + stitcher.flush()
@@ -0,0 +1,220 @@
+# Builtin Imports
+import os
+import hashlib
+import struct
+import zlib
+import tempfile
+from array import array
+
+# Local Imports
+from src.textract.parse_textract_output import DEFAULT_MERGED_CELLS, DEFAULT_STITCH, PARSER_VERSION, parse_textract_file
+
+
+
+
+# Constants setting
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "../../data/table_cache")
+CACHE_MAX_BYTES = 64 * 1024 * 1024      # Eviction threshold for the whole cache directory
+CACHE_SUFFIX = ".tables"
+
+_MAGIC = b"PBTC"
+_FORMAT_VERSION = 1
+_HEADER = struct.Struct("<4sBII")       # magic, format version, n_tables, n_strings
+
+# Parsing options left out of the cache key: 'stream' only changes how the file is read, and an
+# option passed with its default value gives the same tables as leaving it out
+_NEUTRAL_OPTIONS = frozenset({"stream"})
+_DEFAULT_OPTIONS = {"merged_cells": DEFAULT_MERGED_CELLS, "stitch": DEFAULT_STITCH}
+
+
+# --- Auxiliar Functions ---
+def cache_key(json_file_path: str, **parse_options) -> str:
+
+    """
+    Builds the cache key of a Textract JSON file: SHA-256 of its content, the parser version
+    and any parsing options that change the reconstructed tables (not 'stream', nor defaults).
+    """
+
+    digest = hashlib.sha256()
+
+    with open(json_file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+
+    options = ",".join(
+        f"{k}={parse_options[k]}" for k in sorted(parse_options)
+        if k not in _NEUTRAL_OPTIONS and not (k in _DEFAULT_OPTIONS and parse_options[k] == _DEFAULT_OPTIONS[k])
+    )
+    digest.update(f"|parser={PARSER_VERSION}|{options}".encode("utf-8"))
+
+    return digest.hexdigest()
+
+def encode_tables(tables: list) -> bytes:
+
+    """
+    Serializes tables into a compact columnar blob:
+    table shapes + one uint32 string index per cell + an interned, length-prefixed string pool.
+    """
+
+    strings = {}
+    shapes = array("I")
+    cells = array("I")
+
+    for table in tables:
+        n_cols = max((len(row) for row in table), default=0)
+        shapes.extend((len(table), n_cols))
+        for row in table:
+            for col in range(n_cols):
+                value = row[col] if col < len(row) else ""
+                cells.append(strings.setdefault(value, len(strings)))
+
+    pool = [s.encode("utf-8") for s in strings]
+    lengths = array("I", (len(s) for s in pool))
+
+    payload = shapes.tobytes() + cells.tobytes() + lengths.tobytes() + b"".join(pool)
+    return _HEADER.pack(_MAGIC, _FORMAT_VERSION, len(tables), len(pool)) + zlib.compress(payload, 6)
+
+def decode_tables(blob: bytes) -> list:
+
+    """Inverse of 'encode_tables'."""
+
+    magic, version, n_tables, n_strings = _HEADER.unpack_from(blob)
+    if magic != _MAGIC or version != _FORMAT_VERSION:
+        raise ValueError("Unsupported table cache format")
+
+    payload = zlib.decompress(blob[_HEADER.size:])
+    itemsize = array("I").itemsize
+
+    # Table shapes
+    shapes = array("I")
+    offset = 2 * n_tables * itemsize
+    shapes.frombytes(payload[:offset])
+    n_cells = sum(shapes[i] * shapes[i + 1] for i in range(0, len(shapes), 2))
+
+    # Cell string indexes
+    cells = array("I")
+    cells.frombytes(payload[offset:offset + n_cells * itemsize])
+    offset += n_cells * itemsize
+
+    # String pool
+    lengths = array("I")
+    lengths.frombytes(payload[offset:offset + n_strings * itemsize])
+    offset += n_strings * itemsize
+
+    strings = []
+    for length in lengths:
+        strings.append(payload[offset:offset + length].decode("utf-8"))
+        offset += length
+
+    # Tables reconstruction
+    tables = []
+    pos = 0
+    for i in range(0, len(shapes), 2):
+        n_rows, n_cols = shapes[i], shapes[i + 1]
+        table = []
+        for _ in range(n_rows):
+            table.append([strings[idx] for idx in cells[pos:pos + n_cols]])
+            pos += n_cols
+        tables.append(table)
+
+    return tables
+
+def _entry_path(key: str, cache_dir: str) -> str:
+    return os.path.join(cache_dir, key + CACHE_SUFFIX)
+
+def _evict(cache_dir: str, max_bytes: int) -> None:
+
+    """Removes least recently used entries until the cache fits in 'max_bytes'."""
+
+    entries = []
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            stat = os.stat(os.path.join(cache_dir, name))
+            entries.append((stat.st_mtime, stat.st_size, name))
+
+    total = sum(size for _, size, _ in entries)
+
+    for _, size, name in sorted(entries):
+        if total <= max_bytes:
+            break
+        try:
+            os.remove(os.path.join(cache_dir, name))
+        except FileNotFoundError:
+            pass    # Evicted by a concurrent writer
+        total -= size
+
+
+# --- Main Functions ---
+def load_tables_cached(json_file_path: str, cache_dir: str = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES, **parse_options) -> list:
+
+    """
+    Returns the parsed tables of a Textract JSON file, reusing the on-disk cache when the
+    file content and parser version are unchanged.
+
+    Args:
+        json_file_path (str): Path to the Textract JSON output.
+        cache_dir (str): Optional. Directory holding cache entries.
+        max_bytes (int): Optional. Size bound of the cache directory; LRU entries are evicted past it.
+        **parse_options: Forwarded to 'parse_textract_file' and part of the cache key.
+
+    Returns:
+        list: A list of tables, each table is a list of rows (lists of cell values)
+    """
+
+    key = cache_key(json_file_path, **parse_options)
+    path = _entry_path(key, cache_dir)
+
+    # Cache hit (a missing entry, or one evicted by a concurrent writer while reading it, is a miss)
+    try:
+        with open(path, "rb") as f:
+            tables = decode_tables(f.read())
+        os.utime(path)  # Mark as recently used
+        return tables
+    except OSError:
+        pass
+    except (ValueError, zlib.error, struct.error):
+        try:
+            os.remove(path)  # Corrupted or outdated entry
+        except OSError:
+            pass
+
+    # Cache miss
+    tables = parse_textract_file(json_file_path, **parse_options)
+
+    # Unique temporary file per writer, atomically renamed: concurrent misses never clobber each other
+    blob = encode_tables(tables)
+    os.makedirs(cache_dir, exist_ok=True)
+    with tempfile.NamedTemporaryFile("wb", dir=cache_dir, prefix=key + ".", suffix=".tmp", delete=False) as f:
+        f.write(blob)
+    os.replace(f.name, path)
+
+    _evict(cache_dir, max_bytes)
+
+    return tables
+
+def invalidate(json_file_path: str, cache_dir: str = CACHE_DIR, **parse_options) -> bool:
+
+    """Removes the cache entry of a Textract JSON file. Returns True if one existed."""
+
+    path = _entry_path(cache_key(json_file_path, **parse_options), cache_dir)
+
+    try:
+        os.remove(path)
+        return True
+    except FileNotFoundError:
+        return False
+
+def clear_cache(cache_dir: str = CACHE_DIR) -> int:
+
+    """Removes every cache entry. Returns the number of entries removed."""
+
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if name.endswith(CACHE_SUFFIX):
+            os.remove(os.path.join(cache_dir, name))
+            removed += 1
+
+    return removed
@@ -0,0 +1,287 @@
+# Builtin Imports
+import time
+import asyncio
+
+# Local Imports
+from src.textract.polling import SUCCESS_STATUSES, AdaptivePoller, JobMetrics, await_notification
+from src.textract.parse_textract_output import TableAssembler
+
+
+
+
+# Main class
+class TextractJobManager:
+
+    """
+    Runs Textract document analysis for many S3 documents concurrently.
+
+    Jobs are submitted up to 'max_active_jobs' at a time. Each job is polled on its own adaptive
+    backoff schedule (all jobs due in a round are polled together), or, with a notification
+    channel, waits for its completion message without polling. As soon as a job succeeds (or
+    partially succeeds, see 'SUCCESS_STATUSES') its block pages are fetched and streamed to the
+    caller while the remaining jobs keep running. Every API call goes through a shared semaphore,
+    so at most 'max_concurrency' requests are in flight, and at most 'max_queued_pages' fetched
+    pages wait for the caller: fetchers pause while a slow consumer catches up.
+
+    Args:
+        client: Optional. boto3 Textract client (or LocalTextractClient). Defaults to the shared client.
+        bucket (str): Optional. S3 bucket holding the documents. Defaults to S3_BUCKET.
+        max_concurrency (int): Maximum simultaneous Textract API calls.
+        max_active_jobs (int): Maximum jobs running at once (Textract enforces a per-account limit).
+        poll_interval (float): Optional. Fixed seconds between polls (disables adaptive backoff).
+        page_counts (dict): Optional. s3_key -> page count, used to size each job's backoff ceiling.
+        notification_channel: Optional. Completion channel (e.g. LocalNotificationChannel); jobs then
+                              wait for their notification instead of polling.
+        notification_timeout (float): Optional. Seconds to wait for a notification before failing the job.
+        max_queued_pages (int): Optional. Result pages buffered between the fetchers and the caller.
+    """
+
+    def __init__(self, client=None, bucket: str = None, max_concurrency: int = 4, max_active_jobs: int = 10, poll_interval: float = None,
+                 page_counts: dict = None, notification_channel=None, notification_timeout: float = None, max_queued_pages: int = 16):
+
+        if client is None or bucket is None:
+            from src.core.aws_clients import get_client, default_bucket
+            client = client if client is not None else get_client("textract")
+            bucket = bucket if bucket is not None else default_bucket()
+
+        self.client = client
+        self.bucket = bucket
+        self.max_concurrency = max_concurrency
+        self.max_active_jobs = max_active_jobs
+        self.poll_interval = poll_interval
+        self.page_counts = page_counts or {}
+        self.notification_channel = notification_channel
+        self.notification_timeout = notification_timeout
+        self.max_queued_pages = max_queued_pages
+
+        self.failures = {}      # s3_key -> error message
+        self.metrics = {}       # s3_key -> JobMetrics
+
+    def _poller(self, s3_key: str) -> AdaptivePoller:
+
+        if self.poll_interval is not None:
+            return AdaptivePoller.fixed(self.poll_interval)
+        return AdaptivePoller(page_count=self.page_counts.get(s3_key))
+
+    async def _call(self, semaphore: asyncio.Semaphore, method, **kwargs) -> dict:
+
+        """Runs a blocking client call in a worker thread, bounded by the shared semaphore."""
+
+        async with semaphore:
+            return await asyncio.to_thread(method, **kwargs)
+
+    async def _start(self, semaphore: asyncio.Semaphore, s3_key: str) -> str:
+
+        request = {
+            "DocumentLocation": {"S3Object": {"Bucket": self.bucket, "Name": s3_key}},
+            "FeatureTypes": ["TABLES"],
+        }
+        if self.notification_channel is not None:
+            request["NotificationChannel"] = self.notification_channel.channel_config()
+
+        response = await self._call(semaphore, self.client.start_document_analysis, **request)
+        print(f"📤 Textract job started for '{s3_key}'. JobId: {response['JobId']}")
+        return response["JobId"]
+
+    def _fail(self, s3_key: str, message: str) -> None:
+
+        self.failures[s3_key] = message
+        print(f"❌ Textract job failed for '{s3_key}': {message}")
+
+    async def _fetch_pages(self, semaphore: asyncio.Semaphore, s3_key: str, job_id: str, first_page: dict, queue: asyncio.Queue) -> None:
+
+        """Streams every result page of a succeeded job into the queue (the status response is page 1)."""
+
+        page = first_page
+        while True:
+            next_token = page.get("NextToken")
+            await queue.put((s3_key, page, not next_token))
+            if not next_token:
+                break
+            page = await self._call(semaphore, self.client.get_document_analysis, JobId=job_id, NextToken=next_token)
+
+    async def _await_notification(self, semaphore: asyncio.Semaphore, s3_key: str, job_id: str, queue: asyncio.Queue) -> None:
+
+        """Notification mode: waits for the completion message, then streams the pages."""
+
+        try:
+            message, metrics = await await_notification(self.notification_channel, job_id, self.notification_timeout)
+        except TimeoutError as e:
+            self._fail(s3_key, str(e))
+            return
+
+        self.metrics[s3_key] = metrics
+        if message["Status"] not in SUCCESS_STATUSES:
+            self._fail(s3_key, message["Status"])
+            return
+
+        first_page = await self._call(semaphore, self.client.get_document_analysis, JobId=job_id)
+        await self._fetch_pages(semaphore, s3_key, job_id, first_page, queue)
+
+    async def _run(self, s3_keys: list, queue: asyncio.Queue) -> None:
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        waiting = list(s3_keys)
+        active = {}         # JobId -> {"key", "delays", "next_poll", "metrics"}
+        waiters = set()     # Notification-mode jobs still running
+        tasks = []
+        cancelled = False
+
+        try:
+            while waiting or active:
+
+                # Submit jobs up to the active limit
+                slots = self.max_active_jobs - len(active) - len(waiters)
+                batch = waiting[:max(0, slots)]
+                del waiting[:len(batch)]
+                started = await asyncio.gather(*(self._start(semaphore, key) for key in batch), return_exceptions=True)
+
+                for key, job_id in zip(batch, started):
+
+                    if isinstance(job_id, Exception):
+                        self._fail(key, f"could not start job: {job_id}")
+
+                    elif self.notification_channel is not None:
+                        task = asyncio.create_task(self._await_notification(semaphore, key, job_id, queue))
+                        task.add_done_callback(waiters.discard)
+                        waiters.add(task)
+                        tasks.append(task)
+
+                    else:
+                        delays = self._poller(key).delays()
+                        metrics = JobMetrics(job_id=job_id)
+                        self.metrics[key] = metrics
+                        active[job_id] = {"key": key, "delays": delays, "next_poll": time.monotonic() + next(delays), "metrics": metrics}
+
+                if not active:
+                    if waiting and waiters:
+                        await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+                    continue
+
+                # Wait for the earliest scheduled poll, then poll every job that is due
+                delay = min(job["next_poll"] for job in active.values()) - time.monotonic()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                now = time.monotonic()
+                due = [job_id for job_id, job in active.items() if job["next_poll"] <= now]
+                statuses = await asyncio.gather(
+                    *(self._call(semaphore, self.client.get_document_analysis, JobId=job_id) for job_id in due),
+                    return_exceptions=True,
+                )
+
+                for job_id, status in zip(due, statuses):
+
+                    job = active[job_id]
+                    metrics = job["metrics"]
+                    metrics.polls += 1
+
+                    if isinstance(status, Exception) or status["JobStatus"] == "FAILED":
+                        del active[job_id]
+                        metrics.status, metrics.completed_at = "FAILED", time.monotonic()
+                        self._fail(job["key"], str(status) if isinstance(status, Exception) else status.get("StatusMessage", "FAILED"))
+
+                    elif status["JobStatus"] in SUCCESS_STATUSES:
+                        del active[job_id]
+                        metrics.status, metrics.completed_at = status["JobStatus"], time.monotonic()
+                        outcome = "succeeded" if metrics.status == "SUCCEEDED" else "partially succeeded"
+                        print(f"✅ Textract job {outcome} for '{job['key']}' after {metrics.polls} polls ({metrics.time_to_complete:.1f}s).")
+                        tasks.append(asyncio.create_task(self._fetch_pages(semaphore, job["key"], job_id, status, queue)))
+
+                    else:
+                        job["next_poll"] = time.monotonic() + next(job["delays"])
+
+            await asyncio.gather(*tasks)
+
+        except BaseException as e:
+            # Fetchers may be blocked on a full queue nobody will drain any more
+            cancelled = isinstance(e, asyncio.CancelledError)
+            for task in tasks:
+                task.cancel()
+            raise
+
+        finally:
+            if not cancelled:
+                await queue.put(None)
+
+    async def stream_pages(self, s3_keys: list):
+
+        """
+        Async generator yielding (s3_key, page, is_last_page) as soon as each page is available.
+        Failed documents are skipped and recorded in 'self.failures'.
+        """
+
+        queue = asyncio.Queue(maxsize=self.max_queued_pages)
+        runner = asyncio.create_task(self._run(s3_keys, queue))
+        finished = False
+
+        try:
+            while True:
+                item = await queue.get()
+                if item is None:
+                    finished = True
+                    break
+                yield item
+        finally:
+            if not finished:
+                runner.cancel()     # Caller stopped early: stop polling and fetching
+
+        await runner
+
+    async def stream_tables(self, s3_keys: list):
+
+        """
+        Async generator yielding (s3_key, table) while result pages are still arriving.
+        Each document has its own TableAssembler, so pages are parsed as soon as they land
+        and no document's full block list is accumulated.
+        """
+
+        assemblers = {}
+
+        async for key, page, is_last in self.stream_pages(s3_keys):
+
+            assembler = assemblers.setdefault(key, TableAssembler())
+            for block in page.get("Blocks", []):
+                for table in assembler.feed(block):
+                    yield key, table
+
+            if is_last:
+                for table in assemblers.pop(key).flush():
+                    yield key, table
+
+    async def analyze(self, s3_keys: list) -> dict:
+
+        """Runs every job and returns {s3_key: result} in the same shape as 'run_textract_analysis'."""
+
+        results = {}
+
+        async for key, page, _ in self.stream_pages(s3_keys):
+            result = results.setdefault(key, {"Blocks": [], "DocumentMetadata": None, "JobStatus": page.get("JobStatus", "SUCCEEDED")})
+            result["Blocks"].extend(page.get("Blocks", []))
+            result["DocumentMetadata"] = page.get("DocumentMetadata") or result["DocumentMetadata"]
+
+        return results
+
+    def metrics_summary(self) -> list:
+
+        """Per-job metrics as plain dicts (time-to-complete, polls issued, mode, status)."""
+
+        return [dict(s3_key=key, **metrics.as_dict()) for key, metrics in self.metrics.items()]
+
+
+# Function Caller
+def run_textract_jobs(s3_keys: list, **manager_options) -> dict:
+
+    """
+    Analyzes many S3 documents concurrently and returns {s3_key: result}.
+
+    Args:
+        s3_keys (list): S3 object keys of the PDF files.
+        **manager_options: Forwarded to TextractJobManager (client, bucket, max_concurrency, ...).
+
+    Returns:
+        dict: Full Textract analysis result per S3 key (failed documents are omitted).
+    """
+
+    manager = TextractJobManager(**manager_options)
+    return asyncio.run(manager.analyze(s3_keys))
@@ -1,38 +1,145 @@
 # Builtin Imports
 import os
 import json
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 # Local Imports
-...
+from src.core.aws_clients import get_client, default_bucket
+from src.textract.slim_artifact import save_textract_artifact, load_textract_document
+from src.textract.polling import SUCCESS_STATUSES, AdaptivePoller, wait_for_notification
+from src.textract.parse_textract_output import iter_textract_pages
 
-# Third-party imports
-import boto3
-from dotenv import load_dotenv
 
 
 
+# Former module-level globals ('textract' client, 'S3_BUCKET'), now resolved on first use
+def __getattr__(name: str):
 
+    if name == "textract":
+        return get_client("textract")
+    if name == "S3_BUCKET":
+        return default_bucket()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Load environment variables
-load_dotenv()
 
-AWS_ACCESS_KEY_ID = os.getenv("AWS_ACCESS_KEY_ID")
-AWS_SECRET_ACCESS_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
-AWS_REGION = os.getenv("AWS_REGION")
-S3_BUCKET = os.getenv("S3_BUCKET")
+# --- Auxiliar Functions ---
+def start_and_wait(s3_key: str, poll_interval: float = None, page_count: int = None, poller: AdaptivePoller = None,
+                   notification_channel=None, notification_timeout: float = None, client=None, bucket: str = None) -> tuple:
 
-# Init boto client
-textract = boto3.client(
-    "textract",
-    aws_access_key_id=AWS_ACCESS_KEY_ID,
-    aws_secret_access_key=AWS_SECRET_ACCESS_KEY,
-    region_name=AWS_REGION
-)
+    """
+    Starts a Textract analysis job and waits until it finishes (adaptive polling or completion notification).
+    'client' and 'bucket' default to the module client and S3_BUCKET.
+
+    Returns:
+        tuple: (job_id, first result page). Raises RuntimeError if the job did not succeed
+               (PARTIAL_SUCCESS counts as success: its pages are returned, see 'SUCCESS_STATUSES').
+    """
+
+    client = client if client is not None else get_client("textract")
+    bucket = bucket if bucket is not None else default_bucket()
+
+    # Start the async job
+    request = {
+        "DocumentLocation": {'S3Object': {'Bucket': bucket, 'Name': s3_key}},
+        "FeatureTypes": ["TABLES"]
+    }
+    if notification_channel is not None:
+        request["NotificationChannel"] = notification_channel.channel_config()
+
+    response = client.start_document_analysis(**request)
+
+    job_id = response["JobId"]
+    print(f"📤 Textract job started. JobId: {job_id}")
+
+
+    # Wait until job finishes (completion notification or adaptive polling)
+    if notification_channel is not None:
+        message, metrics = wait_for_notification(notification_channel, job_id, timeout=notification_timeout)
+        page = client.get_document_analysis(JobId=job_id) if message["Status"] in SUCCESS_STATUSES else message
+
+    else:
+        if poller is None:
+            poller = AdaptivePoller.fixed(poll_interval) if poll_interval else AdaptivePoller(page_count=page_count)
+        page, metrics = poller.wait_for_job(client, job_id)
+
+    if metrics.status not in SUCCESS_STATUSES:
+        raise RuntimeError(f"❌ Textract job {metrics.status.lower()}.")
+
+    outcome = "succeeded" if metrics.status == "SUCCEEDED" else "partially succeeded (some pages missing)"
+    print(f"✅ Textract job {outcome} in {metrics.time_to_complete:.1f}s ({metrics.polls} polls).")
+
+    return job_id, page
+
+def iter_document_analysis_pages(job_id: str, first_page: dict = None, client=None, prefetch: bool = True):
+
+    """
+    Yields the result pages of a finished job as they arrive.
+
+    NextToken pagination is sequential, so with 'prefetch' the request for the next page is
+    issued in a background thread before the current page is handed to the caller: network
+    time overlaps with whatever the caller does with the page, and at most two pages are
+    held in memory.
+
+    Args:
+        job_id (str): Textract JobId.
+        first_page (dict): Optional. Already fetched first page (e.g. the final status response).
+        client: Optional. Textract client. Defaults to the module client.
+        prefetch (bool): Optional. Fetch page N+1 while page N is being consumed.
+
+    Yields:
+        dict: One get_document_analysis response page.
+    """
+
+    client = client if client is not None else get_client("textract")
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+
+    try:
+        page = first_page if first_page is not None else client.get_document_analysis(JobId=job_id)
+
+        while True:
+
+            next_token = page.get("NextToken")
+            future = None
+            if next_token and executor:
+                future = executor.submit(client.get_document_analysis, JobId=job_id, NextToken=next_token)
+
+            yield page
+
+            if not next_token:
+                break
+
+            page = future.result() if future else client.get_document_analysis(JobId=job_id, NextToken=next_token)
+
+    finally:
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+def iter_textract_analysis_tables(s3_key: str, prefetch: bool = True, client=None, **wait_options):
+
+    """
+    Runs Textract on a PDF in S3 and yields its tables while result pages are still being fetched.
+    The full block list is never accumulated.
+
+    Args:
+        s3_key (str): The S3 object key of the PDF file.
+        prefetch (bool): Optional. Fetch the next page while the current one is parsed.
+        client: Optional. Textract client. Defaults to the module client.
+        **wait_options: Forwarded to 'start_and_wait' (poll_interval, page_count, poller, ...).
+
+    Yields:
+        list: One table as a list of rows (lists of cell values), in document order.
+    """
+
+    job_id, first_page = start_and_wait(s3_key, client=client, **wait_options)
+    pages = iter_document_analysis_pages(job_id, first_page=first_page, client=client, prefetch=prefetch)
+
+    yield from iter_textract_pages(pages)
 
 
 # Main function
-def run_textract_analysis(s3_key: str, save_to: str = None, poll_interval: int = 5) -> dict:
+def run_textract_analysis(s3_key: str, save_to: str = None, poll_interval: float = None, save_format: str = "json",
+                          page_count: int = None, poller: AdaptivePoller = None, notification_channel=None,
+                          notification_timeout: float = None, client=None, bucket: str = None, index=None) -> dict:
     
     """
     Asynchronously analyzes a PDF in S3 using Textract's start_document_analysis.
@@ -41,71 +148,73 @@ def run_textract_analysis(s3_key: str, save_to: str = None, poll_interval: int =
     Args:
         s3_key (str): The S3 object key of the PDF file.
         save_to (str): Optional. Path to save the JSON response.
-        poll_interval (int): Seconds to wait between polling attempts.
+        poll_interval (float): Optional. Fixed seconds between polling attempts (disables adaptive backoff).
+        save_format (str): Optional. 'json' (full indented dump), 'slim' or 'lossless'
+                           (compact gzip artifacts, see 'slim_artifact.py').
+        page_count (int): Optional. Pages in the PDF, used to size the backoff ceiling.
+        poller (AdaptivePoller): Optional. Poller to use; its 'history' collects per-job metrics.
+        notification_channel: Optional. Completion channel (e.g. LocalNotificationChannel). When given,
+                              the job completion is awaited from it instead of polling.
+        notification_timeout (float): Optional. Seconds to wait for the completion notification.
+        client: Optional. Textract client (e.g. LocalTextractClient). Defaults to the module client.
+        bucket (str): Optional. Bucket holding the PDF. Defaults to S3_BUCKET.
+        index (ContentIndex): Optional. Content-hash index; if an artifact was already produced for
+                              this S3 object it is loaded instead of starting a new job, and new
+                              artifacts saved with 'save_to' are recorded.
 
     Returns:
         dict: Full Textract analysis result with all blocks.
     """
 
     try:
-        # Start the async job
-        response = textract.start_document_analysis(
-            DocumentLocation={'S3Object': {'Bucket': S3_BUCKET, 'Name': s3_key}},
-            FeatureTypes=["TABLES"]
+        # Content-addressed short-circuit
+        entry = index.lookup_s3_key(s3_key) if index is not None else None
+        artifact = entry["textract_artifact"] if entry else None
+
+        if artifact and os.path.exists(artifact):
+            print(f"♻️ Reusing Textract output of '{s3_key}' from {artifact}")
+            return load_textract_document(artifact)
+
+        job_id, first_page = start_and_wait(
+            s3_key,
+            poll_interval=poll_interval,
+            page_count=page_count,
+            poller=poller,
+            notification_channel=notification_channel,
+            notification_timeout=notification_timeout,
+            client=client,
+            bucket=bucket,
         )
 
-        job_id = response["JobId"]
-        print(f"📤 Textract job started. JobId: {job_id}")
-
 
-        # Poll until job finishes
-        while True:
-            job_status = textract.get_document_analysis(JobId=job_id)
-            status = job_status["JobStatus"]
-
-            if status == "SUCCEEDED":
-                print("✅ Textract job succeeded.")
-                break
-            elif status == "FAILED":
-                raise RuntimeError("❌ Textract job failed.")
-            else:
-                print(f"⏳ Job status: {status}... retrying in {poll_interval}s")
-                time.sleep(poll_interval)
-
-
-        # Pagination Handling         
+        # Pagination Handling (the status response already carries the first page)
         all_blocks = []
-        next_token = None
-
-        while True:
-
-            if next_token:
-                page = textract.get_document_analysis(JobId=job_id, NextToken=next_token)
-
-            else:
-                page = textract.get_document_analysis(JobId=job_id)
 
+        for page in iter_document_analysis_pages(job_id, first_page=first_page, client=client):
             all_blocks.extend(page["Blocks"])
-            next_token = page.get("NextToken")
-
-            if not next_token:
-                break
 
         # Final combined result
         result = {
             "Blocks": all_blocks,
             "DocumentMetadata": page.get("DocumentMetadata"),
-            "JobStatus": "SUCCEEDED"
+            "JobStatus": first_page.get("JobStatus", "SUCCEEDED")
         }
 
 
         # Save to file if requested
-        if save_to:
+        if save_to and save_format in ("slim", "lossless"):
+            save_textract_artifact(result, save_to, mode=save_format)
+            print(f"📝 Saved {save_format} Textract artifact to {save_to}")
+
+        elif save_to:
             os.makedirs(os.path.dirname(save_to), exist_ok=True)
             with open(save_to, "w", encoding="utf-8") as f:
                 json.dump(result, f, indent=2)
             print(f"📝 Saved Textract output to {save_to}")
 
+        if save_to and index is not None:
+            index.record_artifact(s3_key, save_to)
+
         return result
 
 
@@ -0,0 +1,110 @@
+# Built-in imports
+import os
+import re
+import sys
+import time
+import random
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.amounts import parse_amount, parse_amounts, amount_parser, cache_info
+from src.core.templates import get_template
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def legacy_parse_amount(value: str) -> float:
+
+    """Original 'parse_amount' (regex compiled on every call), kept as the reference."""
+
+    try:
+        value = re.sub(r"[^\d,.-]", "", value).replace(",", "")
+        return float(value)
+    except Exception:
+        return 0.0
+
+
+def format_amount(value: float, decimal: str, thousands: str) -> str:
+
+    """Renders an amount the way a bill would print it in the given locale."""
+
+    text = f"{value:,.2f}"
+    return text.replace(",", "\0").replace(".", decimal).replace("\0", thousands)
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    # Known values
+    assert parse_amount("$ 1,234.50") == 1234.5
+    assert parse_amount("-6.63") == -6.63
+    assert parse_amount("") == 0.0 and parse_amount("N/A") == 0.0
+    assert parse_amount("1,9598", decimal=",", thousands=".") == 1.9598
+    assert parse_amount("1.234.567,89", decimal=",", thousands=".") == 1234567.89
+    assert parse_amount("1.2.3", decimal=",", thousands=".") == 0.0 and parse_amount("12,34,5") == 0.0
+    assert parse_amount("1 234,5", decimal=",", thousands=" ") == 1234.5
+    for bad in ((";", ","), (",", ",")):
+        try:
+            amount_parser(*bad)
+            raise AssertionError(f"Format {bad} accepted")
+        except ValueError:
+            pass
+    print("✅ Known amounts parsed.")
+
+    # Randomized round trips, both locales
+    rng = random.Random(16)
+    for decimal, thousands in ((".", ","), (",", "."), (",", " ")):
+        parse = amount_parser(decimal, thousands)
+        for _ in range(5000):
+            value = round(rng.uniform(-10_000_000, 10_000_000), 2)
+            text = format_amount(value, decimal, thousands)
+            if rng.random() < 0.3:
+                text = f"$ {text} "
+            assert abs(parse(text) - value) < 1e-6, (text, value)
+    print("✅ Randomized round trips hold for every separator pair.")
+
+    # Same values as the legacy parser on the real bill's amount columns (default format)
+    tables = parse_textract_file(input_path)
+    amount_columns = {"valor original", "cargos y abonos", "saldo a diferir"}
+    cells = [
+        row[i] for table in tables for i, header in enumerate(table[0]) if header.strip().lower() in amount_columns
+        for row in table[1:] if i < len(row)
+    ]
+    assert cells and parse_amounts(cells) == [legacy_parse_amount(cell) for cell in cells]
+
+    # Rate columns use the decimal comma
+    template = get_template("bancolombia_v1")
+    assert template.amount_format("Tasa Pactada") == (",", ".")
+    assert template.amount_format("Valor Original") == (".", ",")
+    print("✅ Bill amounts parse like the legacy parser; rate columns use their own format.")
+
+    # Benchmark
+    cells = cells * 200
+    start = time.perf_counter()
+    legacy = [legacy_parse_amount(cell) for cell in cells]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [parse_amount(cell) for cell in cells]
+    fast_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = parse_amounts(cells)
+    batch_seconds = time.perf_counter() - start
+
+    assert legacy == fast == batch
+    print(f"📊 {len(cells)} cells: legacy={legacy_seconds:.3f}s, cached={fast_seconds:.3f}s, batch={batch_seconds:.3f}s "
+          f"({legacy_seconds / fast_seconds:.1f}x / {legacy_seconds / batch_seconds:.1f}x), {cache_info()}")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
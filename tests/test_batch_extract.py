@@ -0,0 +1,85 @@
+# Built-in imports
+import os
+import sys
+import gzip
+import json
+import shutil
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+import src.core.batch_extract as batch_extract
+from src.core.batch_extract import extract_directory, extract_file, main as batch_main
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    n_bills = 6
+
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        # A directory of bills (the last one a gzipped raw Textract output) plus a broken file
+        input_dir = os.path.join(work_dir, "textract")
+        os.makedirs(input_dir)
+        sources = [f"bill_{i:02d}.json" for i in range(n_bills - 1)] + [f"bill_{n_bills - 1:02d}.json.gz"]
+        for source in sources[:-1]:
+            shutil.copyfile(input_path, os.path.join(input_dir, source))
+        with open(input_path, "rb") as f, gzip.open(os.path.join(input_dir, sources[-1]), "wb") as g:
+            shutil.copyfileobj(f, g)
+        with open(os.path.join(input_dir, "broken.json"), "w", encoding="utf-8") as f:
+            f.write("{not json")
+        with open(os.path.join(input_dir, "notes.txt"), "w", encoding="utf-8") as f:
+            f.write("ignored")
+
+        serial = extract_directory(input_dir, workers=1)
+
+        output_path = os.path.join(work_dir, "out", "expenses.json")
+        parallel = extract_directory(input_dir, output_path, workers=3)
+
+        # Provenance, ground truth and failures
+        assert [b["source"] for b in parallel["bills"]] == sources
+        for bill in parallel["bills"]:
+            assert {k: bill[k] for k in ("usd_expenses", "cop_expenses")} == ground
+        assert [b["source"] for b in parallel["failed"]] == ["broken.json"]
+        print(f"✅ {n_bills} bills extracted in worker processes; broken file reported, not fatal.")
+
+        # Same merge as the serial run, written to one file
+        strip = lambda merged: [{k: v for k, v in b.items() if k != "seconds"} for b in merged["bills"]]
+        assert strip(serial) == strip(parallel)
+        with open(output_path, "r", encoding="utf-8") as f:
+            assert strip(json.load(f)) == strip(parallel)
+        print("✅ Parallel merge equals serial run and is saved to one file.")
+
+        # Errors while totalling land in 'failed' too
+        def broken_totals(expenses, **kwargs):
+            raise KeyError("Valor Original")
+        original, batch_extract.bill_totals = batch_extract.bill_totals, broken_totals
+        try:
+            result = extract_file(input_path)
+        finally:
+            batch_extract.bill_totals = original
+        assert result == {"source": os.path.basename(input_path), "error": "KeyError: 'Valor Original'"}
+
+        # CLI exits non-zero when a bill failed
+        assert batch_main([input_dir, os.path.join(work_dir, "cli.json"), "--workers", "2"]) == 1
+
+        print(f"📊 serial={serial['seconds']:.2f}s, 3 workers={parallel['seconds']:.2f}s on {os.cpu_count()} CPU(s)")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
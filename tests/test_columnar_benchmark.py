@@ -0,0 +1,100 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import random
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_file
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.core.extract_expenses_columnar import extract_expenses_batch, parse_amount_column, parse_date_column
+from src.core.amounts import parse_amount
+from src.core.dates import parse_date
+
+
+def synthetic_bills(tables: list, n_bills: int, seed: int = 7) -> list:
+
+    """Copies of the sample bill with shuffled transaction values (dates, amounts, descriptions, blanks)."""
+
+    rng = random.Random(seed)
+    header = tables[3][0]
+    rows = [row for table in tables if table and table[0] == header for row in table[1:]]
+    descriptions = [row[2] for row in rows] + ["ABONO SUCURSAL VIRTUAL"]
+
+    bills = []
+    for _ in range(n_bills):
+        bill = []
+        for table in tables:
+            if not table or table[0] != header:
+                bill.append(table)
+                continue
+            new_table = [header]
+            for row in table[1:]:
+                row = list(row)
+                if any(row):
+                    row[1] = f"{rng.randint(1, 28):02d}/{rng.randint(1, 12):02d}/2025"
+                    row[2] = rng.choice(descriptions)
+                    row[3] = f"{rng.uniform(0, 2_000_000):,.2f}"
+                    row[6] = rng.choice([row[3], f"-{rng.uniform(0, 500):,.2f}", ""])
+                new_table.append(row)
+            bill.append(new_table)
+        bills.append(bill)
+    return bills
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    tables = parse_textract_file(input_path)
+
+    # Vectorized column parsers agree with the scalar ones, leftovers included
+    import pandas as pd
+    amounts = ["1,234.50", "-6.63", "$ 1,234", "1234,567", "12,34", "", "  ", "5.", ".5", "-", "1.2.3", "1,2345", "1/36", " 27,800.00 ", "€ 12,50"]
+    assert parse_amount_column(pd.Series(amounts, dtype=object)).tolist() == [parse_amount(v) for v in amounts]
+    rates = ["1,9598", "1.234,5", "1.2.3", "-0,5", "0"]
+    assert parse_amount_column(pd.Series(rates, dtype=object), ",", ".").tolist() == [parse_amount(v, ",", ".") for v in rates]
+    dates = ["25/02/2025", "31/02/2025", "1/2/2025", "2025-02-25", "01/01/1500", "", "Fecha", "29/02/2024", " 03/02/2025 "]
+    assert parse_date_column(pd.Series(dates, dtype=object)).tolist() == [parse_date(v) for v in dates]
+
+    # Same output as the row engine on the real bill
+    assert extract_expenses_from_tables(tables, engine="pandas") == ground, "Columnar engine differs from ground truth"
+    print("✅ Columnar engine matches ground truth.")
+
+    # Thousands of synthetic bills: best of a few runs per engine, reported rather than raced
+    bills = synthetic_bills(tables, n_bills=2000)
+
+    def best_of(run, repeats: int = 3):
+        timings = []
+        for _ in range(repeats):
+            start = time.perf_counter()
+            result = run()
+            timings.append(time.perf_counter() - start)
+        return result, min(timings)
+
+    row_results, row_seconds = best_of(lambda: [extract_expenses_from_tables(bill) for bill in bills])
+    columnar_results, columnar_seconds = best_of(lambda: extract_expenses_batch(bills))
+
+    assert columnar_results == row_results, "Columnar batch differs from the row engine"
+    n_expenses = sum(len(r["usd_expenses"]) + len(r["cop_expenses"]) for r in row_results)
+    print(f"✅ {len(bills)} synthetic bills ({n_expenses} expenses) match the row engine.")
+    print(f"📊 best of 3: row={row_seconds:.2f}s, columnar={columnar_seconds:.2f}s, speedup={row_seconds / columnar_seconds:.1f}x")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+# Built-in imports
+import os
+import sys
+import shutil
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from main_extract_and_store import Pipeline, build_offline_clients
+from src.ingestion.content_index import ContentIndex
+from src.ingestion.local_s3 import LocalS3Client
+from src.ingestion.upload_to_s3 import upload_file
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    textract_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(textract_path):
+        print(f"❌ Missing file: {textract_path}")
+        return
+
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        pdf_path = os.path.join(work_dir, "BC - MC - 02 - FEB-2025.pdf")
+        with open(pdf_path, "wb") as f:
+            f.write(b"%PDF-1.4 placeholder")
+
+        # Same content uploaded twice -> one S3 upload
+        index = ContentIndex(os.path.join(work_dir, "index.sqlite3"))
+        s3_client = LocalS3Client(root=os.path.join(work_dir, "s3"))
+        first = upload_file(pdf_path, client=s3_client, bucket="local", index=index)
+        second = upload_file(pdf_path, client=s3_client, bucket="local", index=index)
+        assert first == second and s3_client.calls == {"upload_file": 1}, s3_client.calls
+        print("✅ Duplicate upload short-circuited.")
+
+        # A fresh pipeline run (new state) sharing the index pays for nothing twice
+        fixtures_dir = os.path.join(work_dir, "fixtures")
+        os.makedirs(fixtures_dir)
+        shutil.copyfile(textract_path, os.path.join(fixtures_dir, "BC - MC - 02 - FEB-2025.pdf.json"))
+
+        for run in ("run_1", "run_2"):
+            s3_client, textract_client = build_offline_clients(os.path.join(work_dir, run), fixtures_dir)
+            pipeline = Pipeline(output_dir=os.path.join(work_dir, run), s3_client=s3_client, textract_client=textract_client,
+                                bucket="local", poll_interval=0.05, index=index)
+            docs = pipeline.run([pdf_path])
+            assert not docs[0].error, docs[0].error
+
+        assert not s3_client.calls and not any(textract_client.calls.values()), "Second run re-uploaded or re-analyzed"
+        print("✅ Second run reused the indexed upload and Textract artifact.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
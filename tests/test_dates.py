@@ -0,0 +1,107 @@
+# Built-in imports
+import os
+import sys
+import time
+import random
+from datetime import datetime
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.dates import DATE_FORMATS, parse_date, parse_dates, infer_format, cache_info
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def legacy_parse_date(value: str) -> str:
+
+    """Original 'parse_date' (strptime and an exception per missed format), kept as the reference."""
+
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(value.strip(), fmt).strftime("%Y-%m-%d")
+        except Exception:
+            continue
+    return value.strip()
+
+
+def random_date_string(rng: random.Random) -> str:
+
+    """Valid, invalid and malformed dates in every supported layout."""
+
+    day, month, year = rng.randint(0, 32), rng.randint(0, 13), rng.randint(1990, 2035)
+    day_text = rng.choice([f"{day:02d}", str(day), f" {day}"])
+    month_text = rng.choice([f"{month:02d}", str(month)])
+    return rng.choice([
+        f"{day_text}/{month_text}/{year}",
+        f"{day_text}-{month_text}-{year}",
+        f"{year}-{month_text}-{day_text}",
+        f"{day_text}/{month_text}/{year % 100:02d}",
+        f"{day_text}.{month_text}.{year}",
+        f" {day_text}/{month_text}/{year} ",
+        "",
+        "N/A",
+    ])
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    # Known values
+    assert parse_date("25/02/2025") == "2025-02-25"
+    assert parse_date("29/02/2024") == "2024-02-29" and parse_date("29/02/2025") == "29/02/2025"
+    assert parse_date("01/03/69") == "1969-03-01" and parse_date("01/03/68") == "2068-03-01"
+    assert parse_date(" Fecha ") == "Fecha"
+    print("✅ Known dates parsed.")
+
+    # Randomized comparison with strptime, value by value and in batch
+    rng = random.Random(17)
+    values = [random_date_string(rng) for _ in range(20_000)]
+    expected = [legacy_parse_date(v) for v in values]
+    assert [parse_date(v) for v in values] == expected
+    for fmt in (None,) + DATE_FORMATS:
+        assert parse_dates(values, fmt=fmt) == expected
+    print("✅ Randomized dates parse like strptime (single and batch, any first format).")
+
+    # Format inference per column
+    assert infer_format(["", "25/02/2025", "03/02/2025"]) == "%d/%m/%Y"
+    assert infer_format(["2025-02-25", "bad", "2025-02-03"]) == "%Y-%m-%d"
+    assert infer_format(["", "N/A"]) is None
+    assert parse_date(None) is None and parse_dates(["25/02/2025", None, float("nan")]) == ["2025-02-25", None, None]
+
+    # Every cell of the real bill
+    tables = parse_textract_file(input_path)
+    cells = [cell for table in tables for row in table for cell in row]
+    assert parse_dates(cells) == [legacy_parse_date(cell) for cell in cells]
+    print("✅ Format inference and bill cells checked.")
+
+    # Benchmark on a date column (bills repeat the same dates)
+    column = [f"{rng.randint(1, 28):02d}/{rng.randint(1, 2):02d}/2025" for _ in range(100_000)]
+
+    start = time.perf_counter()
+    legacy = [legacy_parse_date(v) for v in column]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fast = [parse_date(v) for v in column]
+    fast_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    batch = parse_dates(column)
+    batch_seconds = time.perf_counter() - start
+
+    assert legacy == fast == batch
+    print(f"📊 {len(column)} dates: legacy={legacy_seconds:.3f}s, cached={fast_seconds:.3f}s, batch={batch_seconds:.3f}s "
+          f"({legacy_seconds / fast_seconds:.1f}x / {legacy_seconds / batch_seconds:.1f}x), {cache_info()}")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
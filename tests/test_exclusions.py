@@ -0,0 +1,135 @@
+# Built-in imports
+import os
+import re
+import sys
+import time
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.exclusions import ExclusionRules
+from src.core.templates import get_template
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.textract.parse_textract_output import parse_textract_file
+
+
+RULES = [
+    "ABONO SUCURSAL VIRTUAL",
+    {"pattern": "PAGO ", "match": "prefix", "name": "payments"},
+    {"pattern": "INTERESES", "match": "contains", "name": "interest"},
+    {"pattern": "CUOTA DE MANEJO", "match": "exact", "name": "fees"},
+    {"pattern": r"^REVERSI[OÓ]N\b|\bDEVOLUCI[OÓ]N\b", "match": "regex", "name": "reversals"},
+]
+
+
+def linear_rule(engines: list, description: str):
+
+    """Reference: one precompiled single-rule engine per rule (exact rules first), tested one after the other."""
+
+    for engine in engines:
+        name = engine._evaluate(description)
+        if name is not None:
+            return name
+    return None
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    rules = ExclusionRules(RULES)
+
+    # Semantics per match type
+    assert rules.rule_for(" abono sucursal virtual ") == "ABONO SUCURSAL VIRTUAL"
+    assert rules.rule_for("PAGO PSE BANCOLOMBIA") == "payments" and rules.rule_for("REPAGO PSE") is None
+    assert rules.rule_for("INTERESES CORRIENTES") == "interest" and rules.rule_for("Intereses de mora") == "interest"
+    assert rules.rule_for("CUOTA DE MANEJO") == "fees" and rules.rule_for("CUOTA DE MANEJO 2") is None
+    assert rules.rule_for("Reversión compra") == "reversals" and rules.rule_for("DLO*DEVOLUCION RAPPI") == "reversals"
+    assert rules.rule_for("DLO*RAPPI COLOMBIA") is None
+    assert "PAGO PSE" in rules and "RAPPI" not in rules
+    for bad in ({"pattern": "(", "match": "regex"}, {"pattern": "X", "match": "suffix"}):
+        try:
+            ExclusionRules([bad])
+            raise AssertionError(f"Rule {bad} accepted")
+        except (ValueError, re.error):
+            pass
+
+    # Backreferences and named groups keep their meaning (searched on their own, not joined)
+    grouped = ExclusionRules(RULES + [
+        {"pattern": r"(\w)\1{3}", "match": "regex", "name": "repeated"},
+        {"pattern": r"^(?P<code>[A-Z]{2})-(?P=code)$", "match": "regex", "name": "twin_code"},
+        {"pattern": r"(?P<code>\d{4})X", "match": "regex", "name": "coded"},
+    ])
+    assert grouped.rule_for("AAAA STORE") == "repeated" and grouped.rule_for("ABAB STORE") is None
+    assert grouped.rule_for("CO-CO") == "twin_code" and grouped.rule_for("CO-US") is None
+    assert grouped.rule_for("REF 1234X") == "coded" and grouped.rule_for("PAGO PSE") == "payments"
+
+    # Global inline flags stay local to their rule (they would fail, or leak into the others, once joined)
+    flagged = ExclusionRules(RULES + [{"pattern": r"(?x) CUOTA \s MANEJO", "match": "regex", "name": "verbose"}])
+    assert flagged.rule_for("CUOTA MANEJO") == "verbose" and flagged.rule_for("PAGO PSE") == "payments"
+    assert flagged.rule_for("CUOTA  MANEJO") is None and "verbose" in flagged.profile(["CUOTA MANEJO"])
+    print("✅ Exact, prefix, contains and regex rules behave as configured.")
+
+    # Counters: hits per rule, memoized repeats
+    rules.reset()
+    descriptions = ["PAGO PSE", "PAGO PSE", "INTERESES CORRIENTES", "DLO*RAPPI COLOMBIA", "PAGO PSE"]
+    assert rules.match_many(descriptions) == [True, True, True, False, True]
+    stats = rules.stats()
+    assert stats["hits"]["payments"] == 3 and stats["hits"]["interest"] == 1 and stats["hits"]["fees"] == 0
+    assert stats["evaluations"] == 5 and stats["memo_hits"] == 4      # Repeats plus the two descriptions already seen above
+    print(f"✅ Hit counters: {stats['hits']}")
+
+    # Shared across threads: no counted row is lost
+    rules.reset()
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(lambda _: [rules.rule_for(d) for d in descriptions * 200], range(8)))
+    stats = rules.stats()
+    assert stats["evaluations"] == 8 * 200 * len(descriptions) and stats["hits"]["payments"] == 8 * 200 * 3, stats
+
+    # The template's rules: extraction counts its hits
+    template = get_template("bancolombia_v1")
+    template.exclusions.reset()
+    tables = parse_textract_file(input_path)
+    extract_expenses_from_tables(tables)
+    assert template.exclusions.stats()["hits"]["ABONO SUCURSAL VIRTUAL"] == 2
+    print("✅ Template exclusion hits counted during extraction.")
+
+    # Combined engine vs. testing every rule one by one
+    rng = random.Random(23)
+    merchants = [row[2] for table in tables for row in table[1:] if len(row) > 2 and row[2]]
+    many = RULES + [{"pattern": f"MERCHANT {i:03d}", "match": "contains", "name": f"merchant_{i:03d}"} for i in range(60)]
+    stream = [rng.choice(merchants + ["PAGO PSE", "MERCHANT 042 BOG", "REVERSION X"]) for _ in range(20_000)]
+
+    # Both sides compiled up front; only evaluation over the same stream is timed
+    engine = ExclusionRules(many)
+    exact = [spec for spec in many if isinstance(spec, str) or spec["match"] == "exact"]
+    engines = [ExclusionRules([spec]) for spec in exact + [spec for spec in many if spec not in exact]]
+
+    start = time.perf_counter()
+    combined = [engine.rule_for(d) for d in stream]
+    combined_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [linear_rule(engines, d) for d in stream]
+    linear_seconds = time.perf_counter() - start
+
+    assert combined == reference
+    distinct = sorted(set(stream))
+    profile = engine.profile(distinct)
+    slowest = max((name for name in profile if name != "__combined__"), key=lambda name: profile[name]["seconds"])
+    print(f"📊 {len(many)} rules x {len(stream)} descriptions: combined+memo={combined_seconds * 1e3:.1f} ms, "
+          f"rule by rule={linear_seconds * 1e3:.0f} ms; slowest rule '{slowest}'")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
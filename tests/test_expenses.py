@@ -0,0 +1,134 @@
+# Built-in imports
+import os
+import sys
+import json
+import random
+import tracemalloc
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.expenses import Expense, ExpenseBatch, to_records, from_records, encode_date, decode_date
+from src.core.templates import compile_template, get_template
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def history(ground: dict, n_bills: int, seed: int = 21) -> list:
+
+    """Years of bills: copies of the sample bill's expenses with fresh authorizations, dates and amounts."""
+
+    rng = random.Random(seed)
+    bills = []
+    for _ in range(n_bills):
+        bill = {}
+        for bucket, records in ground.items():
+            bill[bucket] = [dict(record,
+                                 **{"Número de Autorización": f"R{rng.randint(0, 999_999):06d}",
+                                    "Fecha de Transacción": f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                                    "Cargos y Abonos": round(rng.uniform(0, 2_000_000), 2)})
+                            for record in records]
+        bills.append(bill)
+    return bills
+
+
+def measure(build) -> int:
+
+    """Bytes allocated (and still alive) by 'build()'."""
+
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del kept
+    return size
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    tables = parse_textract_file(input_path)
+
+    # Converters round-trip the extractor's dict exactly (labels, order, values)
+    records = to_records(ground)
+    assert from_records(records) == ground
+    assert json.dumps(from_records(records), ensure_ascii=False) == json.dumps(ground, ensure_ascii=False)
+    batch = ExpenseBatch.from_expenses(ground)
+    assert len(batch) == len(records) and list(batch) == records and batch[-1] == records[-1]
+    assert json.dumps(batch.to_expenses(), ensure_ascii=False) == json.dumps(ground, ensure_ascii=False)
+
+    # Extractor outputs
+    assert extract_expenses_from_tables(tables, output="records") == records
+    assert extract_expenses_from_tables(tables, output="batch").to_expenses() == ground
+    assert extract_expenses_from_tables(tables, engine="pandas", output="records") == records
+    print("✅ Expense / ExpenseBatch round-trip the extractor's dicts.")
+
+    # Edge cases: unparsed dates survive, unknown fields are refused
+    assert decode_date(encode_date("2025-02-25")) == "2025-02-25" and encode_date("31/02/2025") == 0
+    odd = ExpenseBatch()
+    odd.append(Expense(date="31/02/2025", description="X", currency="USD"))
+    assert odd[0].date == "31/02/2025" and odd.to_expenses()["usd_expenses"][0]["Fecha de Transacción"] == "31/02/2025"
+    try:
+        Expense.from_dict({"Moneda": "USD"})
+        raise AssertionError("Unknown field accepted")
+    except ValueError:
+        pass
+    print("✅ Unparsed dates kept; unknown fields rejected.")
+
+    # Another template's labels map through its own field_attributes
+    config = dict(get_template("bancolombia_v1").config, fields_to_extract=["Fecha", "Detalle", "Monto"],
+                  field_attributes={"Fecha": "date", "Detalle": "description", "Monto": "charge"})
+    other = compile_template("other_v1", config)
+    assert other.record_fields == (("Fecha", "date"), ("Detalle", "description"), ("Monto", "charge"))
+    bill = {"usd_expenses": [{"Fecha": "2025-02-03", "Detalle": "APPLE.COM/BILL", "Monto": 6.63}],
+            "cop_expenses": [{"Fecha": "2025-02-05", "Detalle": "RAPPI", "Monto": 35900.0}]}
+    assert to_records(bill, other.record_fields)[0].charge == 6.63
+    assert from_records(to_records(bill, other.record_fields)) == bill
+    assert ExpenseBatch.from_expenses(bill, other.record_fields).to_expenses() == bill
+    try:
+        to_records(bill)    # No registered template extracts these labels
+        raise AssertionError("Unmapped labels accepted")
+    except ValueError:
+        pass
+    try:
+        compile_template("bad_v1", dict(config, field_attributes={"Monto": "amount"}))
+        raise AssertionError("Unknown attribute accepted")
+    except ValueError:
+        pass
+    print("✅ Records of other templates round-trip through their field_attributes.")
+
+    # Memory of years of history (many cards x 12 months)
+    payload = json.dumps(history(ground, n_bills=240), ensure_ascii=False)
+    n_expenses = sum(len(b["usd_expenses"]) + len(b["cop_expenses"]) for b in json.loads(payload))
+
+    as_dicts = measure(lambda: [r for bill in json.loads(payload) for bucket in bill.values() for r in bucket])
+    as_records = measure(lambda: [e for bill in json.loads(payload) for e in to_records(bill)])
+
+    def build_batch():
+        batch = ExpenseBatch()
+        for bill in json.loads(payload):
+            batch.extend(to_records(bill))
+        return batch
+    as_batch = measure(build_batch)
+
+    assert as_records < as_dicts and as_batch < as_records
+    print(f"📊 {n_expenses} expenses: dicts={as_dicts / 1e6:.1f} MB, Expense={as_records / 1e6:.1f} MB "
+          f"({as_dicts / as_records:.1f}x), ExpenseBatch={as_batch / 1e6:.1f} MB ({as_dicts / as_batch:.1f}x)")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -7,7 +7,7 @@ import json
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Local Imports
-from src.textract.parse_textract_output import parse_textract_file
+from src.textract.table_cache import load_tables_cached
 from src.core.extract_expenses import extract_expenses_from_tables
 
 def main():
@@ -20,7 +20,7 @@ def main():
         return
 
     # Parse tables
-    tables = parse_textract_file(input_path)
+    tables = load_tables_cached(input_path)
     print(f"Parsed {len(tables)} tables from Textract output.")
 
     # Extract expenses using template adapter
@@ -0,0 +1,53 @@
+# Built-in imports
+import os
+import sys
+import subprocess
+
+# Module path setting
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(ROOT)
+
+
+# CLI entry point whose cold start is reported (boto3 alone costs ~300 ms, which is why it is deferred)
+CLI_MODULE = "main_extract_and_store"
+
+# Modules that must import without touching AWS / .env
+LIGHT_MODULES = [CLI_MODULE, "src.ingestion.upload_to_s3", "src.textract.trigger_textract", "src.textract.textract_jobs"]
+DEFERRED = ("boto3", "botocore", "dotenv")
+
+
+def import_profile(module: str) -> dict:
+
+    """Runs 'python -X importtime -c import <module>' in a fresh interpreter -> {imported module: cumulative µs}."""
+
+    env = {k: v for k, v in os.environ.items() if not k.startswith("AWS_")}
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            cwd=ROOT, env=env, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr[-2000:]
+
+    profile = {}
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line and "cumulative" not in line:
+            _, cumulative, name = line.split("|")
+            profile[name.strip()] = int(cumulative)
+    return profile
+
+
+def main():
+
+    # AWS SDK and dotenv are loaded on first client use, not at import
+    for module in LIGHT_MODULES:
+        profile = import_profile(module)
+        loaded = [name for name in profile if name.split(".")[0] in DEFERRED]
+        assert not loaded, f"{module} imports {loaded} at import time"
+        print(f"✅ {module}: {profile[module] / 1000:.1f} ms, no AWS SDK import.")
+
+    # CLI cold start, reported only: wall-clock import time depends on the machine (best of 3 to absorb noise)
+    best_ms = min(import_profile(CLI_MODULE)[CLI_MODULE] for _ in range(3)) / 1000
+    print(f"📊 CLI cold start: {best_ms:.1f} ms.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+# Built-in imports
+import os
+import sys
+import json
+import asyncio
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.local_textract import LocalTextractClient
+from src.textract.textract_jobs import TextractJobManager
+from src.textract.parse_textract_output import parse_textract_file, iter_textract_pages
+
+
+async def collect_tables(manager: TextractJobManager, keys: list) -> dict:
+
+    tables = {key: [] for key in keys}
+    async for key, table in manager.stream_tables(keys):
+        tables[key].append(table)
+    return tables
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+
+    expected = parse_textract_file(input_path)
+
+    # Small pages split tables (and their cells) across page boundaries
+    blocks = document["Blocks"]
+    for page_size in (50, 333, 1000):
+        pages = ({"Blocks": blocks[i:i + page_size]} for i in range(0, len(blocks), page_size))
+        assert list(iter_textract_pages(pages)) == expected, f"Page size {page_size} changed the tables"
+    print("✅ Tables resolved across page boundaries.")
+
+    # Jobs feeding their pages straight into per-document assemblers
+    keys = ["uploads/bill_a.pdf", "uploads/bill_b.pdf"]
+    client = LocalTextractClient({key: document for key in keys}, page_size=400, latency=0.01)
+    manager = TextractJobManager(client=client, bucket="local", poll_interval=0.01)
+
+    tables = asyncio.run(collect_tables(manager, keys))
+    assert all(tables[key] == expected for key in keys), "Streamed tables differ from the parsed file"
+    print(f"✅ Streamed {sum(len(t) for t in tables.values())} tables from {len(keys)} jobs.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+# Built-in imports
+import os
+import sys
+import time
+import random
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.merchants import MerchantCanonicalizer, canonicalize_batch, canonicalize_expenses, get_canonicalizer
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    canonicalizer = get_canonicalizer()
+    assert get_canonicalizer() is canonicalizer
+
+    # Noise removal and aliases
+    assert canonicalizer.clean("APPLE.COM/BILL VR MONEDA ORIG 27800.0 USA") == "APPLE.COM BILL"
+    assert canonicalizer.clean("APPLE.COM BILL VR MONEDA ORIG 124900.0 USA") == "APPLE.COM BILL"
+    assert canonicalizer.clean("AMAZON MKTPL*7116O2OJ3") == "AMAZON MKTPL"
+    assert canonicalizer.clean("Nintendo CA1361206913") == "NINTENDO"
+    assert canonicalizer.clean("Dlocal *UBER RIDES VR MONEDA ORIG 31809.0 MLT") == "UBER RIDES"
+    assert canonicalizer.clean("SUSHI GREEN 4") == "SUSHI GREEN 4"
+    assert not any("MONEDA" in p.pattern for p in canonicalizer.noise)     # Cut by original_amounts.ORIGINAL_PATTERN
+    expected = {
+        "APPLE.COM/BILL VR MONEDA ORIG 27800.0 USA": "apple", "APPLE.COM BILL VR MONEDA ORIG 124900.0 USA": "apple",
+        "AMAZON MKTPL*7116O2OJ3": "amazon", "AMAZON.COM": "amazon", "Nintendo CA1351525990": "nintendo",
+        "DLO*RAPPI COLOMBIA": "rappi", "DiDi co Food": "didi", "UBERLANDIA SAS": "uberlandia-sas",
+        "HAMBURGUESAS EL CORRAL": "hamburguesas-el-corral",
+    }
+    for description, merchant_id in expected.items():
+        assert canonicalizer.canonicalize(description) == merchant_id, description
+    print("✅ Reference codes and 'VR MONEDA ORIG' fragments stripped; aliases map to canonical IDs.")
+
+    # Statement stage: parallel ID lists, records untouched
+    tables = parse_textract_file(input_path)
+    expenses = extract_expenses_from_tables(tables)
+    merchants = canonicalize_expenses(expenses)
+    assert all(len(merchants[bucket]) == len(expenses[bucket]) for bucket in expenses)
+    assert "Merchant" not in expenses["usd_expenses"][0]
+    usd = set(merchants["usd_expenses"])
+    assert {"apple", "amazon", "nintendo", "disney"} <= usd
+    batch = extract_expenses_from_tables(tables, output="batch")
+    assert canonicalize_batch(batch) == merchants["usd_expenses"] + merchants["cop_expenses"]
+
+    # The description label comes from the template, not a hard-coded header
+    fields = (("Fecha", "date"), ("Detalle", "description"), ("Monto", "charge"))
+    renamed = {bucket: [{"Fecha": r["Fecha de Transacción"], "Detalle": r["Descripción"], "Monto": r["Cargos y Abonos"]}
+                        for r in records] for bucket, records in expenses.items()}
+    assert canonicalize_expenses(renamed, fields=fields) == merchants
+    try:
+        canonicalize_expenses(renamed, fields=fields[:1])
+        raise AssertionError("Template without a description field accepted")
+    except ValueError:
+        pass
+    print(f"✅ Statement canonicalized: {len(usd | set(merchants['cop_expenses']))} merchants "
+          f"in {sum(len(m) for m in merchants.values())} expenses.")
+
+    # Bounded LRU keyed on the raw description
+    small = MerchantCanonicalizer([p.pattern for p in canonicalizer.noise], canonicalizer.merchants, cache_size=4)
+    small.canonicalize_many(["A 1", "B 2", "A 1", "C 3", "D 4", "E 5"])
+    info = small.cache_info()
+    assert info.currsize == 4 and info.maxsize == 4 and info.misses == 5
+    print(f"✅ LRU bounded: {info}")
+
+    # Many monthly bills: the same merchants over and over
+    rng = random.Random(24)
+    raw = [r["Descripción"] for bucket in expenses.values() for r in bucket]
+    stream = [rng.choice(raw) for _ in range(100_000)]
+
+    canonicalizer.cache_clear()
+    start = time.perf_counter()
+    cached = canonicalizer.canonicalize_many(stream)
+    cached_seconds = time.perf_counter() - start
+
+    uncached = MerchantCanonicalizer([p.pattern for p in canonicalizer.noise], canonicalizer.merchants, cache_size=0)
+    start = time.perf_counter()
+    reference = [uncached.canonicalize(d) for d in stream]
+    uncached_seconds = time.perf_counter() - start
+
+    assert cached == reference
+    print(f"📊 100k descriptions: cached={cached_seconds * 1e3:.0f} ms, uncached={uncached_seconds * 1e3:.0f} ms "
+          f"({uncached_seconds / cached_seconds:.0f}x); {canonicalizer.cache_info()}")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
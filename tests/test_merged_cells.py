@@ -0,0 +1,56 @@
+# Built-in imports
+import os
+import sys
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_file, parse_textract_tables, iter_textract_file
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    # "Cupo Total | Cupo de Avances | Período Facturado" where the last header spans 2 columns
+    ignored = parse_textract_file(input_path, merged_cells="ignore")
+    anchored = parse_textract_file(input_path, merged_cells="anchor")
+    duplicated = parse_textract_file(input_path, merged_cells="duplicate")
+
+    assert ignored[1][0][2:] == ["Período", "Facturado"], ignored[1][0]
+    assert anchored[1][0][2:] == ["Período Facturado", ""], anchored[1][0]
+    assert duplicated[1][0][2:] == ["Período Facturado", "Período Facturado"], duplicated[1][0]
+    print("✅ Merged header resolved in anchor and duplicate modes.")
+
+    # Row span: a 2x1 region keeps its text in the anchor row only (anchor mode)
+    word = {"BlockType": "WORD", "Id": "w1", "Text": "TOTAL"}
+    cells = [
+        {"BlockType": "CELL", "Id": f"c{r}{c}", "RowIndex": r, "ColumnIndex": c, "RowSpan": 1, "ColumnSpan": 1,
+         "Relationships": [{"Type": "CHILD", "Ids": ["w1"]}] if (r, c) == (1, 2) else []}
+        for r in (1, 2) for c in (1, 2)
+    ]
+    merged = {"BlockType": "MERGED_CELL", "Id": "m1", "RowIndex": 1, "ColumnIndex": 2, "RowSpan": 2, "ColumnSpan": 1,
+              "Relationships": [{"Type": "CHILD", "Ids": ["c12", "c22"]}]}
+    table = {"BlockType": "TABLE", "Id": "t1", "Relationships": [{"Type": "CHILD", "Ids": [c["Id"] for c in cells]}, {"Type": "MERGED_CELL", "Ids": ["m1"]}]}
+    document = {"Blocks": [word, table] + cells + [merged]}
+
+    assert parse_textract_tables(document, merged_cells="anchor") == [[["", "TOTAL"], ["", ""]]]
+    assert parse_textract_tables(document, merged_cells="duplicate") == [[["", "TOTAL"], ["", "TOTAL"]]]
+    print("✅ Row spans propagated.")
+
+    # Streaming assembler agrees in every mode
+    for mode, expected in (("ignore", ignored), ("anchor", anchored), ("duplicate", duplicated)):
+        assert list(iter_textract_file(input_path, merged_cells=mode)) == expected, f"Streaming differs in '{mode}' mode"
+    print("✅ Streaming output matches in every mode.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+# Built-in imports
+import os
+import re
+import sys
+import time
+import json
+import random
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.money import Money, bill_totals, group_sum, minor_array, minor_parser, parse_minor, to_minor, total
+from src.core.amounts import parse_amount
+from src.core.templates import CONFIG_PATH
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def summary_totals(path: str) -> dict:
+
+    """{bill name: total} from the 'ground truth total.md' table ('$10,421,816' -> 10421816)."""
+
+    totals = {}
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            found = re.match(r"\|\s*(.+?)\s*\|\s*\d+\s*\|\s*\$([\d,]+)\s*\|", line)
+            if found:
+                totals[found.group(1)] = int(found.group(2).replace(",", ""))
+    return totals
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    summary_path = "data/ground truth total.md"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    # Exact parsing and arithmetic
+    assert parse_minor("$ 1,234.56", "COP") == 123456 and parse_minor("-6.63", "USD") == -663
+    assert parse_minor("0,125", "COP", decimal=",", thousands=".") == 13 and parse_minor("", "COP") == 0
+    assert minor_parser("USD")("1,234.565") == 123457 and minor_parser("COP")("1,23") == 0
+    assert Money.from_text("261,316.00", "COP") == Money.from_float(parse_amount("261,316.00"), "COP")
+    assert str(sum([Money(1, "USD")] * 10)) == "USD 0.10" and sum([0.01] * 10) != 0.1
+    try:
+        Money(1, "USD") + Money(1, "COP")
+        raise AssertionError("Currencies mixed")
+    except ValueError:
+        pass
+    print("✅ Minor-unit parsing and arithmetic are exact.")
+
+    # Reconciles with the bill summary: Valor Original of the COP bucket, in whole pesos
+    tables = parse_textract_file(input_path)
+    expenses = extract_expenses_from_tables(tables)
+    totals = bill_totals(expenses)
+    assert totals["COP"] == Money(1042181604, "COP")
+    assert totals["COP"].rounded() == summary_totals(summary_path)["BC - MC - 02 - FEB-2025"]
+
+    # Floats drift where minor units don't
+    charges = bill_totals(expenses, field="Cargos y Abonos")["COP"]
+    float_sum = sum(r["Cargos y Abonos"] for r in expenses["cop_expenses"])
+    assert charges == Money(965514908, "COP") and float_sum != 9655149.08
+    print(f"✅ {totals['COP']} reconciles with the summary; charges {charges} (float sum: {float_sum!r}).")
+
+    # Extraction in minor units: same records as the float amounts, same totals without converting
+    amount_fields = ("Valor Original", "Cargos y Abonos", "Saldo a Diferir")
+    minor = extract_expenses_from_tables(tables, minor_units=True)
+    assert minor == extract_expenses_from_tables(tables, engine="pandas", minor_units=True)
+    for bucket, currency in (("usd_expenses", "USD"), ("cop_expenses", "COP")):
+        assert minor[bucket] == [{k: to_minor(v, currency) if k in amount_fields else v for k, v in r.items()} for r in expenses[bucket]]
+    assert all(type(r["Cargos y Abonos"]) is int for b in minor.values() for r in b)
+    assert bill_totals(minor, minor_units=True) == totals
+    try:
+        extract_expenses_from_tables(tables, output="batch", minor_units=True)
+        raise AssertionError("Minor units accepted for a batch")
+    except ValueError:
+        pass
+    print("✅ Extraction yields integer minor units; both engines agree and totals match.")
+
+    # The total field comes from the template: one without "Valor Original" totals its own field
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        config = json.load(f)
+    other = dict(config["bill_templates"]["bancolombia_v1"], total_field="Cargos y Abonos")
+    other["fields_to_extract"] = [f for f in other["fields_to_extract"] if f != "Valor Original"]
+    config["bill_templates"]["other_v1"] = other
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "bill_templates.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        trimmed = {b: [{k: v for k, v in r.items() if k != "Valor Original"} for r in rs] for b, rs in expenses.items()}
+        assert bill_totals(expenses, path=path) == totals
+        assert bill_totals(trimmed, path=path)["COP"] == charges
+        assert bill_totals(trimmed, template_name="other_v1", path=path)["COP"] == charges
+    try:
+        bill_totals({"cop_expenses": [{"Monto": 1.0}]})
+        raise AssertionError("Unknown template totalled")
+    except ValueError:
+        pass
+    print("✅ Bill totals add up each template's own total field.")
+
+    # Batches: int64 columns, exact vectorized totals and group-bys
+    batch = extract_expenses_from_tables(tables, output="batch")
+    assert batch.to_expenses() == expenses
+    assert batch.totals("original_value") == totals
+    by_month = batch.totals("charge", by="month")
+    assert sum(m.minor for (c, _), m in by_month.items() if c == "COP") == batch.totals("charge")["COP"].minor
+    by_description = batch.totals("charge", by="description")
+    assert by_description[("USD", "APPLE.COM/BILL VR MONEDA ORIG 27800.0 USA")] == Money(19, "USD")
+    print(f"✅ Batch totals: {', '.join(str(m) for m in batch.totals('charge').values())}; {len(by_month)} month groups.")
+
+    # Aggregation speed and exactness on many rows
+    rng = random.Random(22)
+    amounts = [round(rng.uniform(-5_000_000, 5_000_000), 2) for _ in range(1_000_000)]
+    keys = [rng.randrange(200) for _ in amounts]
+    minor = minor_array(amounts, "COP")
+
+    start = time.perf_counter()
+    exact = total(minor)
+    grouped = group_sum(keys, minor)
+    numpy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    python_total = sum(round(a * 100) for a in amounts)
+    python_groups = {}
+    for key, amount in zip(keys, amounts):
+        python_groups[key] = python_groups.get(key, 0) + round(amount * 100)
+    python_seconds = time.perf_counter() - start
+
+    assert exact == python_total and grouped == python_groups
+    print(f"📊 1M rows total + 200-group sum: int64={numpy_seconds * 1e3:.0f} ms, python ints={python_seconds * 1e3:.0f} ms "
+          f"({python_seconds / numpy_seconds:.0f}x); float drift {abs(sum(amounts) - exact / 100):.2e}")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
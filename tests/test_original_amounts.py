@@ -0,0 +1,80 @@
+# Built-in imports
+import os
+import sys
+import time
+import random
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.original_amounts import ORIGINAL_PATTERN, add_original_amounts, split_original, split_original_column, split_original_frame
+from src.core.expenses import ExpenseBatch
+from src.core.extract_expenses import extract_expenses_from_tables
+from src.core.extract_expenses_columnar import extract_expenses_columnar
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    import pandas as pd
+
+    # Single descriptions
+    assert split_original("Disney PLUS VR MONEDA ORIG 23450.0 USA") == ("Disney PLUS", 23450.0, "USA")
+    assert split_original("Dlocal *UBER RIDES VR MONEDA ORIG 31809.0 MLT") == ("Dlocal *UBER RIDES", 31809.0, "MLT")
+    assert split_original("APPLE.COM BILL VR MONEDA ORIG 124,900.0 USA") == ("APPLE.COM BILL", 124900.0, "USA")
+    assert split_original("UBER RIDES") == ("UBER RIDES", None, None)
+    odd = ["SPOTIFY VR MONEDA ORIG 1,23 USA", "NETFLIX VR MONEDA ORIG 12,345.5 USA", "UBER RIDES"]
+    _, listed, _ = split_original_column(odd)
+    _, series, _ = split_original_column(pd.Series(odd))
+    assert listed[:2] == series.tolist()[:2] == [0.0, 12345.5] and pd.isna(series[2])
+    print("✅ 'VR MONEDA ORIG' fragments split into amount and currency, same parse rule for lists and Series.")
+
+    # Statement stage: only foreign rows carrying the fragment change; the input stays as it was
+    tables = parse_textract_file(input_path)
+    expenses = extract_expenses_from_tables(tables)
+    split = add_original_amounts(expenses)
+    assert any("VR MONEDA ORIG" in r["Descripción"] for r in expenses["usd_expenses"])
+    assert not any("VR MONEDA ORIG" in r["Descripción"] for b in split.values() for r in b)
+
+    carried = [r for r in expenses["usd_expenses"] + expenses["cop_expenses"] if ORIGINAL_PATTERN.search(r["Descripción"])]
+    with_fields = [r for b in split.values() for r in b if "original_amount" in r]
+    assert len(carried) == len(with_fields) == 11
+    assert split["cop_expenses"] == expenses["cop_expenses"]
+
+    # Same result from both engines, the columnar frame and through Expense / ExpenseBatch
+    assert extract_expenses_from_tables(tables, original_amounts=True) == split
+    assert extract_expenses_from_tables(tables, engine="pandas", original_amounts=True) == split
+    assert ExpenseBatch.from_expenses(split).to_expenses() == split
+    frame = split_original_frame(extract_expenses_columnar(tables, as_frame=True))
+    assert frame["original_amount"].notna().sum() == 11 and frame["original_amount"].sum() == sum(r["original_amount"] for r in with_fields)
+    print(f"✅ {len(with_fields)} foreign expenses split; engines, frame and batch round trip agree.")
+
+    # One compiled pattern over a whole column vs. scanning descriptions at read time
+    rng = random.Random(25)
+    raw = [r["Descripción"] for b in expenses.values() for r in b]
+    column = [rng.choice(raw) for _ in range(100_000)]
+
+    start = time.perf_counter()
+    descriptions, amounts, currencies = split_original_column(column)
+    column_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    reference = [split_original(d) for d in column]
+    row_seconds = time.perf_counter() - start
+
+    assert list(zip(descriptions, amounts, currencies)) == reference
+    print(f"📊 100k descriptions: column split={column_seconds * 1e3:.0f} ms, per-row scan={row_seconds * 1e3:.0f} ms")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Built-in imports
+import os
+import sys
+import json
+import timeit
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_tables
+
+
+def legacy_parse_textract_tables(textract_json: dict) -> list:
+
+    """Previous reconstruction (block map + per-table relationship scans), kept as the reference."""
+
+    blocks = textract_json.get("Blocks", [])
+    block_map = {b["Id"]: b for b in blocks}
+    tables = []
+
+    for block in blocks:
+        if block["BlockType"] == "TABLE":
+
+            cell_ids = []
+            for rel in block.get("Relationships", []):
+                if rel["Type"] == "CHILD":
+                    cell_ids.extend(rel["Ids"])
+
+            cells = [block_map[cell_id] for cell_id in cell_ids if block_map[cell_id]["BlockType"] == "CELL"]
+            max_row = max(cell["RowIndex"] for cell in cells)
+            max_col = max(cell["ColumnIndex"] for cell in cells)
+            matrix = [["" for _ in range(max_col)] for _ in range(max_row)]
+
+            for cell in cells:
+                text = ""
+                for rel in cell.get("Relationships", []):
+                    if rel["Type"] == "CHILD":
+                        text = " ".join(block_map[wid]["Text"] for wid in rel["Ids"] if block_map[wid]["BlockType"] == "WORD")
+                matrix[cell["RowIndex"] - 1][cell["ColumnIndex"] - 1] = text
+
+            tables.append(matrix)
+
+    return tables
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        textract_json = json.load(f)
+
+    # Identical output (the reference knows nothing about merged cells or stitching)
+    expected = legacy_parse_textract_tables(textract_json)
+    assert parse_textract_tables(textract_json, merged_cells="ignore", stitch=False) == expected, "Indexed reconstruction differs from the reference"
+    print(f"✅ Indexed reconstruction matches the reference ({len(expected)} tables).")
+
+    # Micro-benchmark (best of 5 repeats), reported only: the margin is too thin to assert on a shared machine
+    runs = 50
+    legacy = min(timeit.repeat(lambda: legacy_parse_textract_tables(textract_json), number=runs, repeat=5)) / runs
+    indexed = min(timeit.repeat(lambda: parse_textract_tables(textract_json, merged_cells="ignore", stitch=False), number=runs, repeat=5)) / runs
+
+    print(f"📊 legacy={legacy * 1000:.2f} ms, indexed={indexed * 1000:.2f} ms, speedup={legacy / indexed:.2f}x")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+# Built-in imports
+import os
+import sys
+import json
+import shutil
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+import main_extract_and_store
+from main_extract_and_store import Pipeline, build_offline_clients
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    textract_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(textract_path):
+        print(f"❌ Missing file: {textract_path}")
+        return
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        # Four "bills": placeholder PDFs whose saved Textract output is served offline
+        input_dir = os.path.join(work_dir, "pdfs")
+        fixtures_dir = os.path.join(work_dir, "fixtures")
+        output_dir = os.path.join(work_dir, "output")
+        os.makedirs(input_dir)
+        os.makedirs(fixtures_dir)
+
+        names = [f"BC - MC - 0{i} - 2025.pdf" for i in range(1, 5)]
+        for name in names:
+            with open(os.path.join(input_dir, name), "wb") as f:
+                f.write(b"%PDF-1.4 placeholder " + name.encode())
+            shutil.copyfile(textract_path, os.path.join(fixtures_dir, f"{name}.json"))
+
+        pdf_paths = [os.path.join(input_dir, name) for name in names]
+        s3_client, textract_client = build_offline_clients(output_dir, fixtures_dir)
+        pipeline = Pipeline(output_dir=output_dir, s3_client=s3_client, textract_client=textract_client, bucket="local", poll_interval=0.05)
+
+        # Each document is parsed once: the extract stage gets the parse stage's tables
+        loads = []
+        load_tables_cached = main_extract_and_store.load_tables_cached
+        main_extract_and_store.load_tables_cached = lambda path, **kwargs: loads.append(path) or load_tables_cached(path, **kwargs)
+        try:
+            docs = pipeline.run(pdf_paths)
+        finally:
+            main_extract_and_store.load_tables_cached = load_tables_cached
+        assert all(not doc.error for doc in docs), [doc.error for doc in docs]
+        assert len(loads) == len(docs) and all(doc.tables is None for doc in docs), loads
+
+        for doc in docs:
+            with open(doc.stages["extract"]["output"], "r", encoding="utf-8") as f:
+                assert json.load(f) == ground, f"{doc.name}: extracted expenses differ from ground truth"
+        print(f"✅ {len(docs)} PDFs processed offline; outputs match ground truth. Calls: {textract_client.calls}")
+
+        # Re-run resumes from the saved state: nothing is uploaded or analyzed again
+        s3_client, textract_client = build_offline_clients(output_dir, fixtures_dir)
+        pipeline = Pipeline(output_dir=output_dir, s3_client=s3_client, textract_client=textract_client, bucket="local", poll_interval=0.05)
+        pipeline.run(pdf_paths)
+        assert not s3_client.calls and not any(textract_client.calls.values()), "Resumed run repeated completed stages"
+        print("✅ Re-run skipped every completed stage.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import asyncio
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.local_textract import LocalTextractClient
+from src.textract.polling import NOTIFICATION_SLICE, AdaptivePoller, LocalNotificationChannel, await_notification
+from src.textract.textract_jobs import TextractJobManager
+
+
+def main():
+
+    # Backoff grows from the initial delay up to the page-based ceiling
+    poller = AdaptivePoller(page_count=4, jitter=0.0)
+    delays = poller.delays()
+    schedule = [next(delays) for _ in range(10)]
+    assert schedule[0] == poller.initial and max(schedule) == poller.ceiling, schedule
+    assert all(a <= b for a, b in zip(schedule, schedule[1:])), "Backoff is not monotonic without jitter"
+    print(f"✅ Backoff schedule: {[round(d, 2) for d in schedule]}")
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+
+    keys = [f"uploads/bill_{i}.pdf" for i in range(4)]
+
+    # Polling mode: short jobs complete within a couple of fast polls
+    client = LocalTextractClient({key: document for key in keys}, completion_delay=0.3)
+    manager = TextractJobManager(client=client, bucket="local", page_counts={key: 4 for key in keys})
+    results = asyncio.run(manager.analyze(keys))
+    assert len(results) == len(keys)
+    print(f"✅ Poll mode metrics: {[(m['polls'], m['time_to_complete']) for m in manager.metrics_summary()]}")
+
+    # Notification mode: no status polls at all
+    channel = LocalNotificationChannel()
+    client = LocalTextractClient({key: document for key in keys}, completion_delay=0.3, notifier=channel)
+    manager = TextractJobManager(client=client, bucket="local", notification_channel=channel, notification_timeout=5)
+    results = asyncio.run(manager.analyze(keys))
+    assert len(results) == len(keys)
+    assert all(m["polls"] == 0 for m in manager.metrics_summary()), "Notification mode should not poll"
+    print(f"✅ Notification mode metrics: {[m['time_to_complete'] for m in manager.metrics_summary()]}")
+
+    # An abandoned wait without timeout releases its worker thread: the event loop shuts down promptly
+    async def abandon():
+        task = asyncio.create_task(await_notification(LocalNotificationChannel(), "never-completes", timeout=None))
+        await asyncio.sleep(0.1)
+        task.cancel()
+
+    start = time.perf_counter()
+    asyncio.run(abandon())
+    shutdown = time.perf_counter() - start
+    assert shutdown < 0.1 + 5 * NOTIFICATION_SLICE, shutdown
+    print(f"✅ Cancelled notification wait shut down in {shutdown:.2f}s.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
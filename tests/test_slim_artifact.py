@@ -0,0 +1,62 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_file
+from src.textract.slim_artifact import convert_textract_json, is_textract_artifact, load_textract_artifact
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    start = time.perf_counter()
+    expected = parse_textract_file(input_path)
+    full_time = time.perf_counter() - start
+    full_size = os.path.getsize(input_path)
+
+    with tempfile.TemporaryDirectory() as out_dir:
+
+        # Slim artifact: same tables, >= 10x smaller
+        slim_path = convert_textract_json(input_path, os.path.join(out_dir, "bill.slim.json.gz"), mode="slim")
+
+        start = time.perf_counter()
+        tables = parse_textract_file(slim_path)
+        slim_time = time.perf_counter() - start
+        slim_size = os.path.getsize(slim_path)
+
+        assert tables == expected, "Slim artifact tables differ from the full JSON tables"
+        assert full_size / slim_size >= 10, f"Slim artifact only {full_size / slim_size:.1f}x smaller"
+
+        # Lossless artifact: original document restored exactly
+        lossless_path = convert_textract_json(input_path, os.path.join(out_dir, "bill.slim.json.gz"), mode="lossless")
+
+        with open(input_path, "r", encoding="utf-8") as f:
+            assert load_textract_artifact(lossless_path) == json.load(f), "Lossless artifact is not lossless"
+
+        # Artifacts are recognized by content, not by name
+        for name, compression in (("bill.json", None), ("bill.gz", "gzip"), ("bill_output", "gzip")):
+            path = convert_textract_json(input_path, os.path.join(out_dir, name), mode="slim", compression=compression)
+            assert is_textract_artifact(path) and parse_textract_file(path) == expected, name
+        assert not is_textract_artifact(input_path) and not is_textract_artifact(os.path.join(out_dir, "missing.slim.json"))
+
+    print(f"✅ Slim artifact: {full_size / 1e6:.2f} MB -> {slim_size / 1e3:.1f} KB ({full_size / slim_size:.0f}x)")
+    print(f"Load + parse: full={full_time * 1000:.1f} ms, slim={slim_time * 1000:.1f} ms")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+# Built-in imports
+import os
+import sys
+import json
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_tables, iter_textract_pages
+from src.core.extract_expenses import extract_expenses_from_tables
+
+
+def drop_header(document: dict, page: int) -> dict:
+
+    """Copy of the document whose table on 'page' lost its header row (a headerless continuation)."""
+
+    blocks = []
+    dropped = set()
+
+    for block in document["Blocks"]:
+        if block["BlockType"] == "CELL" and block["Page"] == page:
+            if block["RowIndex"] == 1:
+                dropped.add(block["Id"])
+                continue
+            block = dict(block, RowIndex=block["RowIndex"] - 1)
+        blocks.append(block)
+
+    for i, block in enumerate(blocks):
+        if block["BlockType"] == "TABLE" and block["Page"] == page:
+            relationships = [dict(rel, Ids=[x for x in rel["Ids"] if x not in dropped]) for rel in block["Relationships"]]
+            blocks[i] = dict(block, Relationships=relationships)
+
+    return dict(document, Blocks=blocks)
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    # Transaction tables continue on pages 2 and 4: 11 fragments -> 9 logical tables
+    fragments = parse_textract_tables(document, stitch=False)
+    tables = parse_textract_tables(document)
+    assert len(fragments) == 11 and len(tables) == 9, (len(fragments), len(tables))
+    assert len(tables[3]) == len(fragments[3]) + len(fragments[4]) - 1, "Repeated header not dropped"
+    assert extract_expenses_from_tables(tables) == ground, "Stitched tables changed the extracted expenses"
+    print(f"✅ {len(fragments)} fragments stitched into {len(tables)} tables; expenses match ground truth.")
+
+    # Headerless continuation: lost without stitching, recovered with it
+    headerless = drop_header(document, page=2)
+    unstitched = extract_expenses_from_tables(parse_textract_tables(headerless, stitch=False))
+    stitched = extract_expenses_from_tables(parse_textract_tables(headerless))
+    assert len(unstitched["usd_expenses"]) < len(ground["usd_expenses"])
+    assert stitched == ground, "Headerless continuation rows were not recovered"
+    print(f"✅ Headerless continuation recovered ({len(ground['usd_expenses']) - len(unstitched['usd_expenses'])} rows).")
+
+    # Streaming assembler stitches the same way
+    pages = ({"Blocks": document["Blocks"][i:i + 500]} for i in range(0, len(document["Blocks"]), 500))
+    assert list(iter_textract_pages(pages)) == tables, "Streamed stitching differs"
+    print("✅ Streaming output matches.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
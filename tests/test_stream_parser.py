@@ -0,0 +1,68 @@
+# Built-in imports
+import os
+import sys
+import time
+import tracemalloc
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import TableAssembler, parse_textract_file, iter_textract_file
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    # Reference parse (whole document in memory)
+    tracemalloc.start()
+    expected = parse_textract_file(input_path)
+    full_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    # Streaming parse
+    tracemalloc.start()
+    streamed = parse_textract_file(input_path, stream=True)
+    stream_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    assert streamed == expected, "Streaming parser output differs from the full parser"
+
+    # Tiny chunks force blocks to be split across reads
+    assert list(iter_textract_file(input_path, chunk_size=17)) == expected, "Chunk boundaries changed the output"
+
+    print(f"✅ Streaming output matches ({len(streamed)} tables).")
+    print(f"Peak memory: full={full_peak / 1e6:.1f} MB, stream={stream_peak / 1e6:.1f} MB")
+
+    # One large table announced before its cells and words: each table is built once, when its last block lands
+    n_rows, n_cols = 2000, 8
+    cells = [(f"c{r}_{c}", f"w{r}_{c}", r, c) for r in range(n_rows) for c in range(n_cols)]
+    blocks = [{"BlockType": "TABLE", "Id": "t", "Page": 1, "Relationships": [{"Type": "CHILD", "Ids": [c[0] for c in cells]}]}]
+    blocks += [{"BlockType": "CELL", "Id": cid, "Page": 1, "RowIndex": r + 1, "ColumnIndex": c + 1,
+                "Relationships": [{"Type": "CHILD", "Ids": [wid]}]} for cid, wid, r, c in cells]
+    blocks += [{"BlockType": "WORD", "Id": wid, "Page": 1, "Text": f"{r}.{c}"} for _, wid, r, c in cells]
+
+    assembler = TableAssembler(stitch=False)
+    builds = []
+    build = assembler._build
+    assembler._build = lambda entry, force=False: builds.append(force) or build(entry, force)
+
+    start = time.perf_counter()
+    tables = [table for block in blocks for table in assembler.feed(block)] + assembler.flush()
+    seconds = time.perf_counter() - start
+
+    assert builds == [False] and len(tables) == 1
+    assert tables[0][0][:2] == ["0.0", "0.1"] and tables[0][-1][-1] == f"{n_rows - 1}.{n_cols - 1}"
+    print(f"✅ {len(blocks)} blocks of one {n_rows}x{n_cols} table assembled in {seconds * 1e3:.0f} ms, built once.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
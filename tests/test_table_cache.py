@@ -0,0 +1,78 @@
+# Built-in imports
+import os
+import sys
+import time
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.parse_textract_output import parse_textract_file
+from src.textract.table_cache import load_tables_cached, invalidate, clear_cache
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    expected = parse_textract_file(input_path)
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+
+        # Cold run populates the cache
+        start = time.perf_counter()
+        cold = load_tables_cached(input_path, cache_dir=cache_dir)
+        cold_time = time.perf_counter() - start
+
+        # Warm run reads the cache entry
+        start = time.perf_counter()
+        warm = load_tables_cached(input_path, cache_dir=cache_dir)
+        warm_time = time.perf_counter() - start
+
+        assert cold == expected and warm == expected, "Cached tables differ from parsed tables"
+
+        entry_size = sum(os.path.getsize(os.path.join(cache_dir, n)) for n in os.listdir(cache_dir))
+        print(f"✅ Cache round-trip OK. Entry size: {entry_size} bytes")
+        print(f"Cold: {cold_time * 1000:.1f} ms, Warm: {warm_time * 1000:.1f} ms")
+
+        # Reading mode and default options share the entry; options changing the tables don't
+        load_tables_cached(input_path, cache_dir=cache_dir, stream=True, stitch=True)
+        load_tables_cached(input_path, cache_dir=cache_dir, stitch=False)
+        entries = [n for n in os.listdir(cache_dir)]
+        assert len(entries) == 2 and all(n.endswith(".tables") for n in entries), entries
+
+        # Concurrent misses each write their own temporary file
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            results = list(executor.map(lambda _: load_tables_cached(input_path, cache_dir=cache_dir, merged_cells="duplicate"), range(8)))
+        assert all(r == results[0] for r in results) and len(os.listdir(cache_dir)) == 3
+        print("✅ Cache key ignores 'stream'; concurrent writers don't clobber each other.")
+
+        # Entries evicted while other threads read them count as misses, not errors
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            racing = list(executor.map(lambda _: load_tables_cached(input_path, cache_dir=cache_dir, stitch=False, max_bytes=0), range(32)))
+        assert all(r == racing[0] for r in racing)
+        load_tables_cached(input_path, cache_dir=cache_dir, stitch=False)
+        assert invalidate(input_path, cache_dir=cache_dir, stitch=False)
+        assert invalidate(input_path, cache_dir=cache_dir, merged_cells="duplicate")
+
+        # Explicit invalidation
+        assert invalidate(input_path, cache_dir=cache_dir)
+        assert not invalidate(input_path, cache_dir=cache_dir)
+
+        # Size-bounded eviction keeps the directory under the limit
+        load_tables_cached(input_path, cache_dir=cache_dir, max_bytes=0)
+        assert clear_cache(cache_dir) == 0, "Entries above the size bound were not evicted"
+        print("✅ Invalidation and eviction OK.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
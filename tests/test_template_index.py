@@ -0,0 +1,93 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.templates import CONFIG_PATH, load_templates, template_index, match_template
+from src.core.extract_expenses import extract_expenses_from_tables, header_matches
+from src.textract.parse_textract_output import parse_textract_file
+
+
+def many_templates(base: dict, n_issuers: int) -> dict:
+
+    """Config with the real template plus 'n_issuers' synthetic issuers (own headers) and a more specific Bancolombia version."""
+
+    templates = {"bancolombia_v1": base}
+    for i in range(n_issuers):
+        headers = [f"Fecha {i}", f"Concepto {i}", f"Valor {i}", "Cuotas"]
+        templates[f"issuer_{i:03d}_v1"] = dict(base, headers=headers, fields_to_extract=headers)
+
+    # Same headers plus one more: wins over 'bancolombia_v1' only on tables carrying the extra column
+    templates["bancolombia_v2"] = dict(base, headers=base["headers"] + ["Moneda"])
+    return {"bill_templates": templates}
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+    ground_path = "tests/extraction_testing_data/extraction_ground_truth.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(ground_path, "r", encoding="utf-8") as f:
+        ground = json.load(f)
+
+    tables = parse_textract_file(input_path)
+
+    # Auto-detection on the real bill: same expenses as naming the template
+    header = tables[3][0]
+    assert match_template(header).name == "bancolombia_v1"
+    assert match_template(["Fecha", "Valor"]) is None
+    assert extract_expenses_from_tables(tables) == extract_expenses_from_tables(tables, template_name="bancolombia_v1") == ground
+    assert extract_expenses_from_tables(tables, engine="pandas") == ground
+    print("✅ Template auto-detected; expenses match ground truth.")
+
+    # Hundreds of templates
+    with open(CONFIG_PATH, "r", encoding="utf-8") as f:
+        base = json.load(f)["bill_templates"]["bancolombia_v1"]
+
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        path = os.path.join(work_dir, "bill_templates.json")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(many_templates(base, n_issuers=500), f)
+
+        templates = load_templates(path)
+        index = template_index(path)
+
+        assert index.match(header).name == "bancolombia_v1"
+        assert index.match(header + ["Moneda"]).name == "bancolombia_v2"
+        assert index.candidates(header + [" MONEDA "]) == ["bancolombia_v2", "bancolombia_v1"]
+        assert index.match(["Fecha 42", "Concepto 42", "Valor 42", "Cuotas", "Extra"]).name == "issuer_042_v1"
+        assert index.match(["Fecha 42", "Concepto 42"]) is None
+        print(f"✅ Best template chosen among {len(templates)}.")
+
+        # Index lookup vs. a linear 'header_matches' scan over every template
+        headers = [table[0] for table in tables if table] * 50
+
+        start = time.perf_counter()
+        linear = [next((t.name for t in templates.values() if header_matches(t.headers, h)), None) for h in headers]
+        linear_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        indexed = [index.candidates(h) for h in headers]
+        indexed_seconds = time.perf_counter() - start
+
+        assert [c[0] if c else None for c in indexed] == linear
+        print(f"📊 {len(headers)} headers x {len(templates)} templates: linear={linear_seconds * 1e3:.1f} ms, "
+              f"indexed={indexed_seconds * 1e3:.1f} ms ({linear_seconds / indexed_seconds:.0f}x, before memoization)")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import shutil
+import tempfile
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.core.templates import CONFIG_PATH, get_template, load_templates
+from src.core.extract_expenses import classify_currency, load_template
+
+
+def main():
+
+    # Loaded once per process: same compiled object on every call
+    template = get_template("bancolombia_v1")
+    assert get_template("bancolombia_v1") is template
+    assert "ABONO SUCURSAL VIRTUAL" in template.exclusions
+    assert [key for _, key, _ in template.fields][:2] == ["número de autorización", "fecha de transacción"]
+    print("✅ Template compiled once and reused.")
+
+    # Parsers and currency rules resolved at compile time
+    parsers = {field: parser.__name__ for field, _, parser in template.fields}
+    assert parsers["Fecha de Transacción"] == "parse_date" and parsers["Valor Original"] == "parse_amount"
+
+    header = template.config["headers"]
+    foreign_table = [header, ["T1", "25/02/2025", "APPLE", "6.82", "1,9598", "26,2256", "0.19", "6.63", "1/36"]]
+    domestic_table = [header, ["R1", "18/02/2025", "RAPPI", "261,316.00", "0,0000", "00,0000", "261,316.00", "0.00", "1/1"]]
+    assert classify_currency(foreign_table, template) == "foreign"
+    assert classify_currency(domestic_table, template) == "domestic"
+    assert classify_currency(foreign_table, load_template("bancolombia_v1")) == "foreign"    # Raw dict still accepted
+    print("✅ Currency rules compiled.")
+
+    # Invalidated when the config file changes
+    with tempfile.TemporaryDirectory() as work_dir:
+
+        path = os.path.join(work_dir, "bill_templates.json")
+        shutil.copyfile(CONFIG_PATH, path)
+        first = load_templates(path)
+        assert load_templates(path) is first
+
+        with open(path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        config["bill_templates"]["bancolombia_v1"]["exclude_descriptions"].append("CUOTA DE MANEJO")
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(config, f)
+        os.utime(path, ns=(time.time_ns(), time.time_ns() + 1_000_000_000))
+
+        reloaded = load_templates(path)
+        assert reloaded is not first and "CUOTA DE MANEJO" in reloaded["bancolombia_v1"].exclusions
+        print("✅ Config change picked up after mtime change.")
+
+    # Cost of a cached lookup
+    runs = 10_000
+    start = time.perf_counter()
+    for _ in range(runs):
+        get_template("bancolombia_v1")
+    print(f"📊 Cached template lookup: {(time.perf_counter() - start) / runs * 1e6:.1f} µs")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+# Built-in imports
+import os
+import sys
+import json
+import time
+import asyncio
+
+# Module path setting
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+# Local imports
+from src.textract.local_textract import LocalTextractClient
+from src.textract.textract_jobs import TextractJobManager, run_textract_jobs
+from src.textract.trigger_textract import start_and_wait
+from src.textract.parse_textract_output import parse_textract_file, parse_textract_tables
+
+
+def main():
+
+    # Path to previously generated Textract JSON output
+    input_path = "data/textract_output/2025-07-22_1035_cb23bdf6_BC - MC - 02 - FEB-2025.pdf.json"
+
+    if not os.path.exists(input_path):
+        print(f"❌ Missing file: {input_path}")
+        return
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        document = json.load(f)
+
+    # Eight "bills" served by the local stand-in, one of them failing and one partially analyzed
+    keys = [f"uploads/bill_{i}.pdf" for i in range(8)]
+    client = LocalTextractClient(
+        {key: document for key in keys},
+        polls_to_complete=2,
+        page_size=500,
+        latency=0.02,
+        fail_keys=[keys[-1]],
+        partial_keys=[keys[0]],
+    )
+
+    start = time.perf_counter()
+    results = run_textract_jobs(keys, client=client, bucket="local", max_concurrency=8, max_active_jobs=4, poll_interval=0.01)
+    elapsed = time.perf_counter() - start
+
+    expected = parse_textract_file(input_path)
+
+    assert sorted(results) == sorted(keys[:-1]), "Unexpected set of succeeded documents"
+    assert all(parse_textract_tables(result) == expected for result in results.values()), "Streamed pages lost blocks"
+    assert results[keys[0]]["JobStatus"] == "PARTIAL_SUCCESS" and results[keys[1]]["JobStatus"] == "SUCCEEDED"
+
+    # Single jobs treat PARTIAL_SUCCESS the same way
+    job_id, page = start_and_wait(keys[0], poll_interval=0.01, client=client, bucket="local")
+    assert page["JobStatus"] == "PARTIAL_SUCCESS" and page["Blocks"]
+
+    # Serial processing would need every call back to back
+    serial_estimate = sum(client.calls.values()) * client.latency
+    print(f"✅ {len(results)} documents analyzed, 1 failure. API calls: {client.calls}")
+    print(f"Elapsed: {elapsed:.2f}s (serial estimate {serial_estimate:.2f}s)")
+
+    # Backpressure: a slow consumer holds at most 'max_queued_pages' fetched pages
+    manager = TextractJobManager(client=LocalTextractClient({key: document for key in keys}, page_size=50),
+                                 bucket="local", poll_interval=0.01, max_queued_pages=2)
+    fetched = []
+    original = manager.client.get_document_analysis
+    manager.client.get_document_analysis = lambda **kw: fetched.append(kw) or original(**kw)
+
+    async def consume(limit: int = None):
+        consumed = 0
+        async for _ in manager.stream_pages(keys):
+            consumed += 1
+            # Pages fetched (first pages counted up front) but not consumed yet: queue + one in hand per fetcher
+            pages_ahead = len(keys) + sum("NextToken" in kw for kw in fetched) - consumed
+            assert pages_ahead <= manager.max_queued_pages + len(keys) + manager.max_concurrency, pages_ahead
+            await asyncio.sleep(0.001)
+            if consumed == limit:
+                break
+        return consumed
+
+    total_pages = asyncio.run(consume())
+    assert total_pages == len(keys) * -(-len(document["Blocks"]) // 50)
+
+    # Stopping early cancels the remaining work instead of leaving fetchers blocked
+    fetched.clear()
+    assert asyncio.run(consume(limit=3)) == 3
+    assert len(fetched) < total_pages
+    print(f"✅ {total_pages} pages streamed through a 2-page queue; early stop cancels the fetchers.")
+
+
+
+# Nameguard
+if __name__ == "__main__":
+    main()
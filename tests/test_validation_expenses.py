@@ -7,8 +7,9 @@ import sys
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Local Imports
-from src.textract.parse_textract_output import parse_textract_file
+from src.textract.table_cache import load_tables_cached
 from src.core.extract_expenses import extract_expenses_from_tables
+from src.core.money import BUCKET_CURRENCIES, bill_totals, to_minor
 
 
 
@@ -25,7 +26,8 @@ METRICS DEFINITION
 
     Here:
 
-        * True positive = record index exists in both sets and all fields match.
+        * True positive = record index exists in both sets and all fields match (amounts as exact
+          integer minor units: extracted with minor_units=True, ground truth converted with 'to_minor').
         * False positive = record exists in extracted but not in ground truth (extra rows or mismatched fields).
         * False negative = record missing from extracted but present in ground truth.
 
@@ -33,14 +35,17 @@ METRICS DEFINITION
 
 """
 
+AMOUNT_FIELDS = ("Valor Original", "Cargos y Abonos", "Saldo a Diferir")
+
+
 # --- Aux Funcs ---
 def load_json(path):
     with open(path, "r", encoding="utf-8") as f:
         return json.load(f)
 
-def compare_records(extracted, ground_truth):
+def compare_records(extracted, ground_truth, currency=None):
 
-    """Compare records row by row (aligned by index)."""
+    """Compare records row by row (aligned by index); with a currency, amounts are compared in minor units."""
 
     mismatches = []
     true_positives = 0
@@ -54,7 +59,11 @@ def compare_records(extracted, ground_truth):
 
         for field in g.keys():
 
-            if str(e.get(field, "")).strip() != str(g.get(field, "")).strip():
+            if currency is not None and field in AMOUNT_FIELDS:
+                if e.get(field) != to_minor(g[field], currency):
+                    row_mismatch.append((field, e.get(field), to_minor(g[field], currency)))
+
+            elif str(e.get(field, "")).strip() != str(g.get(field, "")).strip():
                 row_mismatch.append((field, e.get(field), g.get(field)))
 
         if row_mismatch:
@@ -73,7 +82,7 @@ def validate_bucket(bucket, extracted, ground_truth):
 
     print(f"\n=== {bucket.upper()} ===")
 
-    mismatches, tp, fp, fn = compare_records(extracted, ground_truth)
+    mismatches, tp, fp, fn = compare_records(extracted, ground_truth, BUCKET_CURRENCIES[bucket])
 
     # Precision & Recall
     precision = tp / (tp + fp) if (tp + fp) > 0 else 0
@@ -108,8 +117,8 @@ def main():
     
 
     # Generate extracted expenses
-    tables = parse_textract_file(textract_path)
-    extracted = extract_expenses_from_tables(tables, template_name="bancolombia_v1")
+    tables = load_tables_cached(textract_path)
+    extracted = extract_expenses_from_tables(tables, template_name="bancolombia_v1", minor_units=True)
 
     # Save the resulted transformed data from the extration
     output_path = "tests\extraction_testing_data\extraction_test_results\extracted.json"
@@ -122,6 +131,12 @@ def main():
     for bucket in ["usd_expenses", "cop_expenses"]:
         validate_bucket(bucket, extracted.get(bucket, []), ground.get(bucket, []))
 
+    # Totals reconcile exactly (integer minor units on both sides)
+    extracted_totals = bill_totals(extracted, template_name="bancolombia_v1", minor_units=True)
+    ground_totals = bill_totals(ground, template_name="bancolombia_v1")
+    for currency, money in ground_totals.items():
+        print(f"{'✅' if extracted_totals[currency] == money else '❌'} {currency} total: extracted {extracted_totals[currency]} vs ground {money}")
+
 
 
 